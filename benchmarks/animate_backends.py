@@ -0,0 +1,64 @@
+"""
+animate() encoder backends: frames / second per installed backend.
+
+Encodes the same synthetic clip (float RGBA frames, so the one-time rgb24 conversion is included) through every
+available backend: ffmpeg / opencv / moviepy write an .mp4, pil writes a .gif and a .webp.
+
+Run: python benchmarks/animate_backends.py [--frames N] [--size WxH] [--fps FPS]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ppplt
+from ppplt.animate import ENCODERS, animate
+
+OUTPUTS = {"ffmpeg": ("mp4",), "opencv": ("mp4",), "moviepy": ("mp4",), "pil": ("gif", "webp")}
+
+
+def make_frames(n, width, height):
+    t = np.linspace(0, 2 * np.pi, n, dtype=np.float32)[:, None, None]
+    x = np.linspace(0, 1, width, dtype=np.float32)[None, None, :]
+    y = np.linspace(0, 1, height, dtype=np.float32)[None, :, None]
+    frames = np.empty((n, height, width, 4), dtype=np.float32)
+    frames[..., 0] = 0.5 + 0.5 * np.sin(6 * x + t)
+    frames[..., 1] = 0.5 + 0.5 * np.cos(6 * y - t)
+    frames[..., 2] = x * y
+    frames[..., 3] = 1.0
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=240)
+    parser.add_argument("--size", default="640x360")
+    parser.add_argument("--fps", type=int, default=60)
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.split("x"))
+
+    ppplt.init(theme="dumb", logging_level=logging.ERROR)
+    frames = make_frames(args.frames, width, height)
+    print(f"{args.frames} frames {width}x{height} float32 RGBA\n")
+    print(f"{'backend':<10s} {'output':<6s} {'seconds':>8s} {'frames/s':>9s} {'size':>10s}")
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name, cls in ENCODERS.items():
+            for ext in OUTPUTS.get(name, ("mp4",)):
+                if not cls.available():
+                    print(f"{name:<10s} {ext:<6s} {'not installed':>29s}")
+                    continue
+                path = os.path.join(out_dir, f"{name}.{ext}")
+                t = time.perf_counter()
+                animate(frames, path, fps=args.fps, backend=name)
+                elapsed = time.perf_counter() - t
+                size = os.path.getsize(path)
+                print(f"{name:<10s} {ext:<6s} {elapsed:8.2f} {args.frames / elapsed:9.1f} {size / 1e6:8.2f} MB")
+    ppplt.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+PDF export with the bundled fonts: font subset cache off vs. on.
+
+Draws a GB-preset figure with mixed CJK / Latin labels and saves it N times as PDF (Type 42), once with
+Matplotlib's own subsetting and once through ppplt.fontcache.
+
+Run: python benchmarks/font_subset_cache.py [--figures N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+import ppplt  # noqa: E402
+from ppplt import fontcache  # noqa: E402
+
+
+def make_figure():
+    fig, ax = plt.subplots(figsize=(3.5, 2.5))
+    ax.plot([0, 1, 2, 3], [0, 1, 0, 1], label="实验组 Experiment")
+    ax.plot([0, 1, 2, 3], [1, 0, 1, 0], label="对照组 Control")
+    ax.set_xlabel("时间 Time (s)")
+    ax.set_ylabel("幅值 Amplitude")
+    ax.set_title("图 1 GB 样式 Figure")
+    ax.legend()
+    return fig
+
+
+def run(n, out_dir):
+    total, sizes = 0.0, 0
+    for i in range(n):
+        fig = make_figure()
+        path = os.path.join(out_dir, f"fig_{i}.pdf")
+        t = time.perf_counter()
+        fig.savefig(path)
+        total += time.perf_counter() - t
+        sizes += os.path.getsize(path)
+        plt.close(fig)
+    return total / n * 1000.0, sizes / n / 1024.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--figures", type=int, default=20)
+    args = parser.parse_args()
+
+    ppplt.apply_paper_preset("gb-modern")
+    matplotlib.rcParams["pdf.fonttype"] = 42
+    with tempfile.TemporaryDirectory() as d:
+        run(1, d)  # warm up font manager / backend imports
+        fontcache.uninstall()
+        base_ms, base_kb = run(args.figures, d)
+        fontcache.install()
+        fontcache.clear()
+        cached_ms, cached_kb = run(args.figures, d)
+    print(f"no cache   : {base_ms:8.1f} ms/figure  {base_kb:8.1f} KiB/file")
+    print(f"font cache : {cached_ms:8.1f} ms/figure  {cached_kb:8.1f} KiB/file  ({base_ms / cached_ms:.1f}x)")
+    print(f"cache stats: {fontcache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Preset switch cost: legacy path vs. precompiled ``ppplt.preset`` context.
+
+Legacy path = what ``apply_paper_preset`` did before presets were memoized: re-parse the ``.mplstyle`` file through
+``mpl.style.use(path)`` (validating every key) and then set the color cycle.
+
+Run: python benchmarks/preset_switch.py [--repeat N]
+"""
+
+import argparse
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib as mpl  # noqa: E402
+
+import ppplt  # noqa: E402
+from ppplt.presets import styles_dir, get_paper_preset  # noqa: E402
+
+PRESETS = ("ieee-modern", "gb-okabe")
+
+
+def legacy_switch(name):
+    info = get_paper_preset(name)
+    mpl.style.use(str(styles_dir() / f"{info['style'].upper()}.mplstyle"))
+    ppplt.apply_color_set(info["colors"])
+
+
+def context_switch(name):
+    with ppplt.preset(name, register_font=False):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    ppplt.register_fonts()
+    for name in PRESETS:  # warm the memoized rcParams
+        context_switch(name)
+
+    results = {}
+    for label, fn in (("legacy style.use + color set", legacy_switch), ("ppplt.preset context", context_switch)):
+        t = timeit.timeit(lambda: [fn(n) for n in PRESETS], number=args.repeat)
+        results[label] = t / (args.repeat * len(PRESETS)) * 1e6
+    base = results["legacy style.use + color set"]
+    for label, us in results.items():
+        print(f"{label:<32s} {us:10.1f} us/switch  ({base / us:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Benchmark suite for the render / export hot paths, with stored baselines and a regression report.
+
+Covers: cold `import ppplt`, `init`, `set_style` per preset, `draw` and `draw_grid` at several sizes, the figure
+legend layout (`draw._apply_legend`) and `save` per format. Runs offline with the standard library only.
+
+Run:
+    python benchmarks/suite.py                          # run everything, print a table
+    python benchmarks/suite.py -k draw --repeat 10      # substring filter on benchmark names
+    python benchmarks/suite.py --save main              # store results as benchmarks/baselines/main.json
+    python benchmarks/suite.py --compare main [--threshold 0.2] [--fail]
+        # compare with a stored baseline; --fail exits with status 1 when a benchmark is slower than
+        # (1 + threshold) x the baseline median
+
+Each benchmark is timed `repeat` times after one warm-up call; the median is compared, min / max are reported.
+Baselines record the interpreter, Matplotlib and ppplt versions and the CPU, since numbers are only comparable on
+the same machine.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+import ppplt  # noqa: E402
+from ppplt.draw import LegendConfig, _apply_legend, draw_grid  # noqa: E402
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+POINTS = (1_000, 100_000)
+GRIDS = ((1, 1), (2, 2), (4, 4))
+LEGEND_LABELS = (4, 16)
+FORMATS = ("png", "pdf", "svg", "eps")
+
+
+@dataclass
+class Benchmark:
+    name: str
+    fn: Callable[[], None]
+    setup: Optional[Callable[[], None]] = None
+    teardown: Optional[Callable[[], None]] = None
+    repeat: Optional[int] = None  # override for very slow / very fast cases
+
+
+def _init():
+    ppplt.init(theme="dumb", logging_level=logging.ERROR)
+
+
+def _ready(preset="ieee-modern"):
+    _init()
+    ppplt.set_style(preset=preset)
+
+
+def _teardown():
+    plt.close("all")
+    ppplt.destroy()
+
+
+def _lines(n):
+    x = np.linspace(0, 10, n)
+    return lambda fig, ax: [ax.plot(x, np.sin(x + k), label=f"series {k}") for k in range(3)]
+
+
+def _cell(n):
+    x = np.linspace(0, 10, n)
+    return lambda ax, r, c, idx: ax.plot(x, np.sin(x + idx), label=f"cell {idx}")
+
+
+def bench_import():
+    subprocess.run([sys.executable, "-c", "import ppplt"], check=True)
+
+
+def bench_init():
+    _init()
+    ppplt.destroy()
+
+
+def _legend_case(n_labels):
+    state = {}
+
+    def setup():
+        _ready()
+        fig, axes = draw_grid(_cell(100), grid=(2, 2), return_axes=True)
+        x = np.arange(10)
+        for k in range(n_labels - 4):
+            axes.flat[k % 4].plot(x, x * k, label=f"extra {k}")
+        state.update(fig=fig, axes=axes)
+
+    def fn():
+        legend = _apply_legend(state["fig"], state["axes"], LegendConfig())
+        legend.remove()
+
+    return Benchmark(f"legend[labels={n_labels}]", fn, setup, _teardown)
+
+
+def _save_case(fmt, out_dir):
+    def setup():
+        _ready()
+        ppplt.draw(_lines(1_000))
+
+    def fn():
+        ppplt.save(os.path.join(out_dir, f"bench.{fmt}"))
+
+    return Benchmark(f"save[{fmt}]", fn, setup, _teardown)
+
+
+def collect(out_dir) -> List[Benchmark]:
+    benches = [
+        Benchmark("import_ppplt", bench_import, repeat=5),
+        Benchmark("init", bench_init, teardown=_teardown),
+    ]
+    for name in ppplt.list_paper_presets():
+        benches.append(Benchmark(f"set_style[{name}]", lambda n=name: ppplt.set_style(preset=n), _init, _teardown))
+    for n in POINTS:
+        benches.append(
+            Benchmark(f"draw[points={n}]", lambda n=n: (ppplt.draw(_lines(n)), plt.close("all")), _ready, _teardown)
+        )
+    for grid in GRIDS:
+        for n in POINTS:
+            benches.append(
+                Benchmark(
+                    f"draw_grid[grid={grid[0]}x{grid[1]},points={n}]",
+                    lambda g=grid, n=n: (draw_grid(_cell(n), grid=g), plt.close("all")),
+                    _ready,
+                    _teardown,
+                )
+            )
+    benches += [_legend_case(n) for n in LEGEND_LABELS]
+    benches += [_save_case(fmt, out_dir) for fmt in FORMATS]
+    return benches
+
+
+def run(benches: List[Benchmark], repeat: int) -> Dict[str, dict]:
+    results = {}
+    for bench in benches:
+        if bench.setup:
+            bench.setup()
+        try:
+            bench.fn()  # warm-up: first-call caches (fonts, styles) are not what we track
+            times = []
+            for _ in range(bench.repeat or repeat):
+                t = time.perf_counter()
+                bench.fn()
+                times.append((time.perf_counter() - t) * 1000.0)
+        finally:
+            if bench.teardown:
+                bench.teardown()
+        results[bench.name] = {
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "max_ms": max(times),
+            "repeat": len(times),
+        }
+        print(f"  {bench.name:<40s} {results[bench.name]['median_ms']:10.3f} ms", flush=True)
+    return results
+
+
+def machine_info() -> dict:
+    try:
+        import cpuinfo
+
+        cpu = cpuinfo.get_cpu_info().get("brand_raw", "")
+    except Exception:
+        cpu = platform.processor()
+    return {
+        "python": platform.python_version(),
+        "matplotlib": matplotlib.__version__,
+        "numpy": np.__version__,
+        "ppplt": ppplt.__version__,
+        "platform": platform.platform(),
+        "cpu": cpu,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(current: Dict[str, dict], baseline: dict, threshold: float) -> List[str]:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    base = baseline["results"]
+    regressions = []
+    print(f"\n{'benchmark':<40s} {'baseline':>10s} {'current':>10s} {'ratio':>7s}")
+    for name, res in current.items():
+        if name not in base:
+            print(f"{name:<40s} {'-':>10s} {res['median_ms']:10.3f} {'new':>7s}")
+            continue
+        ratio = res["median_ms"] / base[name]["median_ms"]
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            mark = "  faster"
+        print(f"{name:<40s} {base[name]['median_ms']:10.3f} {res['median_ms']:10.3f} {ratio:7.2f}{mark}")
+    if baseline.get("machine", {}).get("cpu") != machine_info()["cpu"]:
+        print("\nnote: baseline was recorded on a different CPU; ratios are indicative only.")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", dest="filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="NAME", help="store results as a baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare with a stored baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    parser.add_argument("--fail", action="store_true", help="exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        path = BASELINE_DIR / f"{args.compare}.json"
+        if not path.exists():
+            parser.error(f"baseline not found: {path}")
+        baseline = json.loads(path.read_text())
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        benches = [b for b in collect(out_dir) if args.filter is None or args.filter in b.name]
+        print(f"Running {len(benches)} benchmarks:")
+        results = run(benches, args.repeat)
+
+    if args.save:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        path = BASELINE_DIR / f"{args.save}.json"
+        path.write_text(json.dumps({"machine": machine_info(), "results": results}, indent=2))
+        print(f"\nBaseline saved to {path}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            if args.fail:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
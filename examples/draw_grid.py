@@ -21,15 +21,12 @@ def cell(ax, r, c, idx, data):
 
     Mirrors logic in matplot_subplot_demo:
       - generate sample multi-series data
-      - plot 3 curves (only label on first subplot to avoid legend duplicates)
+      - plot 3 labelled curves (the figure legend deduplicates labels across cells)
       - set axis labels on bottom row / first column with contextual text
     """
     x = data["x"]
     curves = data["curves"]  # precomputed list
-    # Only label on first subplot so legend has 3 entries
-    show_label = r == 0 and c == 0
-    labels = ["a", "b", "c"] if show_label else ["_nolegend_"] * 3
-    for y, lab in zip(curves, labels):
+    for y, lab in zip(curves, ["a", "b", "c"]):
         ax.plot(x, y, label=lab)
 
     # Axis labels pattern
@@ -29,6 +29,7 @@ from enum import Enum, auto
 from contextlib import redirect_stdout
 
 from .logging import Logger
+from . import style as _style
 from .version import __version__
 from .misc import redirect_libc_stderr, get_platform, get_src_dir, get_style_dir
 
@@ -55,6 +56,8 @@ def init(
     theme: str = "dark",
     logger_verbose_time: bool = False,
     preset: str = "ieee-modern",
+    async_logging: bool = False,
+    json_log=None,
 ):
     global _initialized, _phase
     if _initialized:
@@ -64,15 +67,19 @@ def init(
 
     # ppplot._theme
     global _theme
-    is_theme_valid = theme in ("dark", "light", "dumb")
+    is_theme_valid = theme in _style.THEMES
     # Set fallback theme if necessary to be able to initialize logger
-    _theme = theme if is_theme_valid else "dark"
+    _theme = _style.resolve_theme(theme if is_theme_valid else "dark")
+    _style.set_palette(_theme)
 
     # ppplot.logger
     global logger
     if logging_level is None:
         logging_level = _logging.DEBUG if debug else _logging.INFO
-    logger = Logger(logging_level, log_time, logger_verbose_time)
+    logger = Logger(logging_level, log_time, logger_verbose_time, async_=async_logging)
+    if json_log is not None:
+        # path, "-" for stdout, or an open text stream
+        logger.add_json_sink(json_log)
     atexit.register(destroy)
 
     if not is_theme_valid:
@@ -123,6 +130,25 @@ def destroy():
         cb()
     exit_callbacks.clear()
 
+    # Drain pending output and detach the handler so a later `init` does not stack a second one
+    if logger:
+        logger.close()
+
+
+def set_theme(theme: str):
+    """
+    Switch the console theme ("dark", "light", "dumb" or "auto") by swapping in its precomputed palette.
+    NO_COLOR / TERM=dumb keep the output uncolored whatever theme is requested.
+    """
+    global _theme
+    if theme not in _style.THEMES:
+        raise_exception(f"Unsupported theme: {theme}")
+    theme = _style.resolve_theme(theme)
+    palette = _style.set_palette(theme)
+    _theme = theme
+    if _initialized:
+        logger.set_palette(palette)
+
 
 def _display_greeting(INFO_length):
     try:
@@ -198,11 +224,23 @@ def init_step(*args, allow_reinit: bool = True, **kwargs):
 
 
 # Re-export color set utilities
-from .colorset import list_color_sets, get_color_set, apply_color_set, is_grayscale_discriminable  # noqa: E402
+from .colorset import (  # noqa: E402
+    list_color_sets,
+    get_color_set,
+    apply_color_set,
+    register_color_set,
+    is_grayscale_discriminable,
+)
+from .colorspace import PaletteReport, palette_report  # noqa: E402
+from .palette import generate_palette  # noqa: E402
 from .presets import (
     list_paper_presets,
     get_paper_preset,
     apply_paper_preset,
+    preset,
+    register_style,
+    register_paper_preset,
+    load_presets_dir,
     styles_dir,
     fonts_dir,
     available_styles,
@@ -212,7 +250,10 @@ from .presets import (
     style_step,
 )  # noqa: E402
 from .draw import draw, draw_step  # noqa: E402
-from .save import save, save_step  # noqa: E402
+from .imagegrid import compose_image_grid, draw_image_grid, draw_image_grid_step  # noqa: E402
+from .save import save, save_step, PdfBook  # noqa: E402
+from .live import LiveFigure, live  # noqa: E402
+from .aggregate import binned_stats, histogram2d, density  # noqa: E402
 from .misc import (
     assert_style_set,
     assert_style_unset,
@@ -225,6 +266,7 @@ __all__ = [
     # core lifecycle
     "init",
     "destroy",
+    "set_theme",
     "PaperPlotException",
     # style & presets
     "apply_style",
@@ -232,24 +274,42 @@ __all__ = [
     "list_paper_presets",
     "get_paper_preset",
     "apply_paper_preset",
+    "preset",
+    "register_style",
+    "register_paper_preset",
+    "load_presets_dir",
     "available_styles",
     "register_fonts",
     "styles_dir",
     "fonts_dir",
     # drawing & saving
     "draw",
+    "draw_image_grid",
+    "compose_image_grid",
     "save",
+    "PdfBook",
+    "LiveFigure",
+    "live",
+    # out-of-core data
+    "binned_stats",
+    "histogram2d",
+    "density",
     "last_figure",
     "last_axes",
     # colors
     "list_color_sets",
     "get_color_set",
     "apply_color_set",
+    "register_color_set",
+    "generate_palette",
     "is_grayscale_discriminable",
+    "PaletteReport",
+    "palette_report",
     # pipeline
     "Step",
     "init_step",
     "style_step",
     "draw_step",
+    "draw_image_grid_step",
     "save_step",
 ]
@@ -0,0 +1,331 @@
+"""
+Out-of-core aggregation: reduce arrays larger than memory to per-bin views before plotting.
+
+API:
+- open_array(path) -> np.ndarray: Memory-map a `.npy` file (read-only); other arrays pass through unchanged.
+- iter_chunks(x, y=None, *, chunk_size=1 << 20) -> Iterator[(x_chunk, y_chunk)]
+    Sources: (x, y) arrays / memmaps / `.npy` paths, a single (N, 2) array, a single 1-D array (x is the sample
+    index), or an iterable yielding (x, y) chunks.
+- binned_stats(x, y=None, *, bins=1000, range=None, chunk_size=...) -> BinnedStats
+    Per-bin count / min / max / mean of y over equal-width x bins (e.g. one bin per horizontal pixel).
+- histogram2d(x, y=None, *, bins=(512, 512), range=None, weights=None, chunk_size=...) -> Histogram2D
+    Streaming 2D histogram (count, or sum of `weights`) for scatter-like data.
+
+- density(ax, x, y=None, *, values=None, agg="count", bins=None, range=None, dpi=None, cmap=None, norm="log",
+          colorbar=False, chunk_size=...) -> AxesImage
+    Datashader-style scatter replacement: aggregate points into a pixel-aligned grid and draw it as one image.
+
+Classes:
+- BinnedStats: centers, edges, count, min, max, mean; plot(ax, ...) draws the min-max band plus the mean line.
+- Histogram2D: counts / sums of shape (ny, nx) with x_edges, y_edges and extent; mean() for weighted grids.
+
+Behavior:
+- Chunks are converted to float64 one at a time, so peak memory is O(chunk_size + bins) regardless of input size.
+- Without `range` the extent is found by an extra streaming pass, which needs a re-iterable source (arrays,
+  memmaps, paths); one-shot iterators must pass `range` (ValueError otherwise).
+- NaN points and points outside `range` are ignored (the right edge is inclusive, as in np.histogram).
+- Empty bins have count 0 and NaN min / max / mean.
+- density() sizes its grid to the axes at save resolution (`dpi`, default `savefig.dpi`), so one bin maps to one
+  output pixel; empty pixels are transparent. The image keeps the data extent, so ticks and colorbars stay correct,
+  and vector outputs embed a single raster instead of millions of markers.
+- The axes size is measured when density() runs. If the figure has a layout engine (constrained / tight), the
+  grid is sized after a layout pass and re-aggregated (re-iterable sources only) until the size is stable. Later
+  changes that move the axes (labels or titles added
+  afterwards with a layout engine, `fig.tight_layout()` as in `ppplt.draw(tight=True)`) make the mapping
+  approximate: the image is resampled by a few pixels. Call density() last, or pass `bins` explicitly.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DEFAULT_CHUNK = 1 << 20
+
+Range = Tuple[float, float]
+
+
+def open_array(path_or_array) -> np.ndarray:
+    if isinstance(path_or_array, (str, os.PathLike)):
+        return np.load(path_or_array, mmap_mode="r")
+    return path_or_array
+
+
+def _is_array(obj) -> bool:
+    return isinstance(obj, (np.ndarray, str, os.PathLike)) or hasattr(obj, "__array__") and hasattr(obj, "shape")
+
+
+def iter_chunks(x, y=None, *, chunk_size: int = DEFAULT_CHUNK) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    if y is None and not _is_array(x):
+        for xc, yc in x:
+            yield np.asarray(xc, dtype=np.float64).ravel(), np.asarray(yc, dtype=np.float64).ravel()
+        return
+    x = open_array(x)
+    if y is None:
+        if x.ndim == 2:
+            x, y = x[:, 0], x[:, 1]
+        else:
+            x, y = None, x
+    else:
+        y = open_array(y)
+        if len(x) != len(y):
+            raise ValueError(f"x and y must have the same length, got {len(x)} and {len(y)}")
+    for start in range(0, len(y), chunk_size):
+        stop = min(start + chunk_size, len(y))
+        xc = np.arange(start, stop, dtype=np.float64) if x is None else np.asarray(x[start:stop], dtype=np.float64)
+        yield xc, np.asarray(y[start:stop], dtype=np.float64)
+
+
+def _reiterable(x, y) -> bool:
+    return y is not None or _is_array(x)
+
+
+def _scan_extent(x, y, chunk_size) -> Tuple[Range, Range]:
+    lo = np.array([np.inf, np.inf])
+    hi = np.array([-np.inf, -np.inf])
+    for xc, yc in iter_chunks(x, y, chunk_size=chunk_size):
+        ok = ~(np.isnan(xc) | np.isnan(yc))
+        if ok.any():
+            lo = np.minimum(lo, [xc[ok].min(), yc[ok].min()])
+            hi = np.maximum(hi, [xc[ok].max(), yc[ok].max()])
+    if not np.all(np.isfinite(lo)):
+        raise ValueError("Cannot determine the data range: no finite points.")
+    return (lo[0], hi[0]), (lo[1], hi[1])
+
+
+def _resolve_range(x, y, range, chunk_size, ndim: int):
+    if range is not None and (ndim == 1 or all(r is not None for r in range)):
+        return range
+    if not _reiterable(x, y):
+        raise ValueError("`range` is required for one-shot chunk iterators.")
+    scanned = _scan_extent(x, y, chunk_size)
+    if ndim == 1:
+        return scanned[0]
+    if range is None:
+        return scanned
+    return tuple(r if r is not None else s for r, s in zip(range, scanned))
+
+
+def _bin_index(values: np.ndarray, lo: float, hi: float, n: int) -> np.ndarray:
+    """Bin index of every value in [lo, hi] (right edge inclusive), -1 elsewhere."""
+    scale = n / (hi - lo) if hi > lo else 0.0
+    outside = ~((values >= lo) & (values <= hi))  # also catches NaN
+    idx = np.floor((np.where(outside, lo, values) - lo) * scale).astype(np.int64)
+    # values == hi, and finite values just below hi that round up to n
+    np.minimum(idx, n - 1, out=idx)
+    idx[outside] = -1
+    return idx
+
+
+@dataclass(frozen=True)
+class BinnedStats:
+    edges: np.ndarray
+    count: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    mean: np.ndarray
+
+    @property
+    def centers(self) -> np.ndarray:
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    def plot(self, ax, *, color=None, alpha: float = 0.3, label: Optional[str] = None, **line_kwargs: Any):
+        """Draw the min-max envelope as a band and the per-bin mean as a line; returns (band, line)."""
+        (line,) = ax.plot(self.centers, self.mean, color=color, label=label, **line_kwargs)
+        band = ax.fill_between(self.centers, self.min, self.max, color=line.get_color(), alpha=alpha, lw=0)
+        return band, line
+
+
+def binned_stats(
+    x,
+    y=None,
+    *,
+    bins: int = 1000,
+    range: Optional[Range] = None,
+    chunk_size: int = DEFAULT_CHUNK,
+) -> BinnedStats:
+    lo, hi = _resolve_range(x, y, range, chunk_size, ndim=1)
+    count = np.zeros(bins, dtype=np.int64)
+    total = np.zeros(bins)
+    vmin = np.full(bins, np.inf)
+    vmax = np.full(bins, -np.inf)
+    for xc, yc in iter_chunks(x, y, chunk_size=chunk_size):
+        idx = _bin_index(xc, lo, hi, bins)
+        ok = (idx >= 0) & ~np.isnan(yc)
+        idx, yc = idx[ok], yc[ok]
+        count += np.bincount(idx, minlength=bins)
+        total += np.bincount(idx, weights=yc, minlength=bins)
+        np.minimum.at(vmin, idx, yc)
+        np.maximum.at(vmax, idx, yc)
+    empty = count == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+    vmin[empty] = vmax[empty] = mean[empty] = np.nan
+    return BinnedStats(np.linspace(lo, hi, bins + 1), count, vmin, vmax, mean)
+
+
+@dataclass(frozen=True)
+class Histogram2D:
+    x_edges: np.ndarray
+    y_edges: np.ndarray
+    counts: np.ndarray  # (ny, nx), image orientation with origin="lower"
+    sums: Optional[np.ndarray] = None  # per-bin sum of weights, when weights were given
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        return (self.x_edges[0], self.x_edges[-1], self.y_edges[0], self.y_edges[-1])
+
+    def mean(self) -> np.ndarray:
+        if self.sums is None:
+            raise ValueError("mean() needs a histogram built with weights.")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.counts > 0, self.sums / self.counts, np.nan)
+
+
+def histogram2d(
+    x,
+    y=None,
+    *,
+    bins: Union[int, Sequence[int]] = (512, 512),
+    range: Optional[Tuple[Optional[Range], Optional[Range]]] = None,
+    weights: Optional[Iterable] = None,
+    chunk_size: int = DEFAULT_CHUNK,
+) -> Histogram2D:
+    nx, ny = (bins, bins) if np.isscalar(bins) else bins
+    (x0, x1), (y0, y1) = _resolve_range(x, y, range, chunk_size, ndim=2)
+    counts = np.zeros(nx * ny, dtype=np.int64)
+    sums = None if weights is None else np.zeros(nx * ny)
+    w_chunks = None if weights is None else _weight_chunks(weights, chunk_size)
+    for xc, yc in iter_chunks(x, y, chunk_size=chunk_size):
+        ix = _bin_index(xc, x0, x1, nx)
+        iy = _bin_index(yc, y0, y1, ny)
+        ok = (ix >= 0) & (iy >= 0)
+        flat = iy[ok] * nx + ix[ok]
+        counts += np.bincount(flat, minlength=nx * ny)
+        if w_chunks is not None:
+            wc = next(w_chunks)
+            if len(wc) != len(xc):
+                raise ValueError("weights must be chunked like the points.")
+            sums += np.bincount(flat, weights=wc[ok], minlength=nx * ny)
+    return Histogram2D(
+        np.linspace(x0, x1, nx + 1),
+        np.linspace(y0, y1, ny + 1),
+        counts.reshape(ny, nx),
+        None if sums is None else sums.reshape(ny, nx),
+    )
+
+
+def _has_layout_engine(fig) -> bool:
+    return bool(fig.get_layout_engine() if hasattr(fig, "get_layout_engine") else fig.get_constrained_layout())
+
+
+def _make_norm(norm, agg: str, grid):
+    import matplotlib.colors as mcolors
+
+    if not isinstance(norm, str):
+        return norm
+    if norm == "log" and agg == "count":
+        return mcolors.LogNorm(vmin=1, vmax=max(1, int(grid.max() or 1)))
+    if norm in ("log", "linear"):
+        return mcolors.Normalize()
+    raise ValueError(f"norm must be 'log', 'linear' or a Normalize, got {norm!r}")
+
+
+def _axes_pixels(ax, dpi: Optional[float]) -> Tuple[int, int]:
+    import matplotlib as mpl
+
+    fig = ax.figure
+    if _has_layout_engine(fig):
+        # let constrained / tight layout place the axes before measuring them
+        getattr(fig, "draw_without_rendering", fig.canvas.draw)()
+    if dpi is None:
+        dpi = mpl.rcParams["savefig.dpi"]
+        dpi = fig.dpi if dpi == "figure" else dpi
+    bbox = ax.get_position()  # figure fraction, independent of the canvas resolution
+    width, height = fig.get_size_inches()
+    return max(1, int(round(bbox.width * width * dpi))), max(1, int(round(bbox.height * height * dpi)))
+
+
+def density(
+    ax,
+    x,
+    y=None,
+    *,
+    values=None,
+    agg: str = "count",
+    bins: Union[int, Sequence[int], None] = None,
+    range: Optional[Tuple[Optional[Range], Optional[Range]]] = None,
+    dpi: Optional[float] = None,
+    cmap=None,
+    norm: Any = "log",
+    colorbar: bool = False,
+    chunk_size: int = DEFAULT_CHUNK,
+    **imshow_kwargs: Any,
+):
+    """
+    Draw the density (agg="count") or the per-pixel mean of `values` (agg="mean") of many points as one image.
+
+    `norm` is "log", "linear" or a matplotlib Normalize; `colorbar=True` adds a colorbar next to `ax`.
+    """
+    if agg not in ("count", "mean"):
+        raise ValueError(f"agg must be 'count' or 'mean', got {agg!r}")
+    if agg == "mean" and values is None:
+        raise ValueError("agg='mean' needs `values`.")
+    range = _resolve_range(x, y, range, chunk_size, ndim=2)
+    extent = (range[0][0], range[0][1], range[1][0], range[1][1])
+    imshow_kwargs.setdefault("interpolation", "nearest")
+    image = ax.imshow(
+        np.ma.masked_all((1, 1)), extent=extent, origin="lower", aspect="auto", cmap=cmap, **imshow_kwargs
+    )
+    # final limits before measuring, so a layout engine sees the final tick labels
+    ax.set_xlim(extent[0], extent[1])
+    ax.set_ylim(extent[2], extent[3])
+    if colorbar:
+        # the colorbar takes space from `ax`, so size the grid afterwards
+        ax.figure.colorbar(image, ax=ax, label="count" if agg == "count" else None)
+    # with a layout engine the colorbar ticks of the filled image can move the axes again: re-measure and
+    # re-aggregate while the pixel size changes (at most twice; only possible for re-iterable sources)
+    retries = 2 if bins is None and _reiterable(x, y) and (values is None or _is_array(values)) else 0
+    while True:
+        shape = _axes_pixels(ax, dpi) if bins is None else bins
+        hist = histogram2d(
+            x,
+            y,
+            bins=shape,
+            range=range,
+            weights=values if agg == "mean" else None,
+            chunk_size=chunk_size,
+        )
+        grid = hist.counts if agg == "count" else hist.mean()
+        grid = np.ma.masked_where(hist.counts == 0, grid)
+        image.set_data(grid)
+        image.set_norm(_make_norm(norm, agg, grid))
+        image.autoscale_None()
+        if not retries or not _has_layout_engine(ax.figure) or _axes_pixels(ax, dpi) == shape:
+            break
+        retries -= 1
+    return image
+
+
+def _weight_chunks(weights, chunk_size) -> Iterator[np.ndarray]:
+    if _is_array(weights):
+        weights = open_array(weights)
+        for start in range(0, len(weights), chunk_size):
+            yield np.asarray(weights[start : start + chunk_size], dtype=np.float64)
+    else:
+        for wc in weights:
+            yield np.asarray(wc, dtype=np.float64).ravel()
+
+
+__all__ = [
+    "open_array",
+    "iter_chunks",
+    "binned_stats",
+    "histogram2d",
+    "density",
+    "BinnedStats",
+    "Histogram2D",
+]
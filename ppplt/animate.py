@@ -2,29 +2,65 @@
 Media helpers (animation & image saving) for PaperPlot.
 
 API:
-- animate(imgs: list[np.ndarray|PIL.Image|path], filename: str|None = None, fps: int = 60) -> None
-    Build an MP4 video from a list of image frames (in-memory arrays or paths) using moviepy.
+- animate(imgs, filename: str|None = None, fps: int|None = None, codec="libx264", preset="ultrafast", crf=None,
+          workers=None, gop=None, backend="auto", **encoder_options) -> None
+    Encode frames (list of arrays / PIL images / paths, an (N, H, W[, C]) stack, a `ppplt.framestore` store or a
+    ".ppfs" path) into a video or animated image. fps defaults to the store's fps, else 60.
     If filename is None: derives base name from caller file + timestamp.
+    workers=N switches to the parallel segmented encoder below.
+- encode_video(frames, filename, fps=60, codec="libx264", preset="medium", crf=18, pix_fmt="yuv420p", gop=None,
+               workers=None, segments=None, ffmpeg=None) -> None
+    Split frames into GOP-aligned segments, encode them in parallel ffmpeg processes (raw rgb24 over stdin) and
+    join them with the concat demuxer without re-encoding.
+- plan_segments(n_frames, gop, segments) -> list[(start, stop)]; find_ffmpeg() -> str
+- Encoder backends: FFmpegEncoder ("ffmpeg", subprocess pipe), OpenCVEncoder ("opencv", cv2.VideoWriter),
+  PILEncoder ("pil", animated GIF / APNG / WebP), MoviePyEncoder ("moviepy", fallback).
+    ENCODERS (name -> class, auto-selection order), register_encoder(cls), available_encoders(),
+    select_encoder(filename, backend="auto"), iter_rgb24(imgs)
 - save_img_arr(arr: np.ndarray, filename: str = "img.png") -> None
     Save a single numpy array as an image file.
+- ImageWriter(workers=1, queue_size=64, png_compress_level=1, jpeg_quality=90, webp_lossless=True, keep_uint16=True)
+    Threaded batch writer: write(arr, filename) enqueues (blocking when the bounded queue is full), flush() waits,
+    close() drains and stops, stats() reports frames, bytes, busy time and throughput.
 
 Utility Classes:
 - Timer: Lightweight hierarchical timing / profiling helper with pretty console output.
 - Rate: Sleep helper to maintain a target loop frequency.
-- FPSTracker: Exponential moving average FPS estimator emitting logs.
+- FPSTracker: EMA FPS estimator with rolling-window frame-time stats (min/mean/p95/max) and throttled logging.
 - create_timer(name: str|None, new: bool=False, level:int=0, ti_sync:bool=False, skip_first_call: bool=False)
     Factory returning (and caching) Timer instances; unnamed timers are always new.
 
 Behavior:
-- Video writing uses libx264 ultrafast preset for development speed.
+- Video writing defaults to the libx264 ultrafast preset for development speed; codec / preset / crf are
+  configurable. backend="auto" picks the first available backend that supports the extension: ffmpeg (PATH or
+  imageio-ffmpeg), then OpenCV, then moviepy for videos; Pillow for .gif / .apng / .png / .webp. moviepy is only
+  imported when it is the chosen backend.
+- Frames are converted to rgb24 once before reaching the backend (vectorized over the whole stack for array
+  input): RGBA drops alpha, grayscale is broadcast, float / bool / uint16 are mapped to uint8 as below. The ffmpeg
+  and OpenCV backends stream frames without buffering the sequence.
+- Segmented encodes force a fixed GOP (`-g`, `-keyint_min`, `-sc_threshold 0`) and cut segments on GOP
+  boundaries, so keyframes land where a single-pass encode with the same settings puts them; the concat step is a
+  stream copy. ffmpeg is found via $PPPLT_FFMPEG, PATH or imageio-ffmpeg.
+- Arrays are converted once, vectorized: float in [0, 1] -> uint8 (* 255), bool -> {0, 255}, uint16 is kept for PNG
+  grayscale / scaled to uint8 (>> 8) elsewhere, other integers are cast when they fit 0-255. Out-of-range float or
+  integer data raises ValueError instead of being clipped / wrapped.
+- ImageWriter encodes in worker threads (PIL releases the GIL in zlib / libjpeg / libwebp); a low PNG compression
+  level keeps the encoder from being the bottleneck. Worker errors are re-raised from flush() / close().
 - Logging integrates with ppplt.logger to provide uniform styled output.
 - Future TODO markers kept for potential watermark / audio / subtitle extensions.
 """
 
+import importlib.util
 import inspect
 import os
+import queue
+import shutil
+import subprocess
+import tempfile
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from PIL import Image
@@ -32,16 +68,41 @@ from PIL import Image
 import ppplt
 
 
-def animate(imgs, filename=None, fps=60):
+def animate(
+    imgs,
+    filename=None,
+    fps=None,
+    codec="libx264",
+    preset="ultrafast",
+    crf=None,
+    workers=None,
+    gop=None,
+    backend="auto",
+    **encoder_options,
+):
     """
     Create a video from a list of images.
 
     Args:
-        imgs (list): List of input images.
+        imgs (list | np.ndarray | FrameStore | FrameView | str): Input images (arrays, PIL images or paths), an
+            (N, H, W[, C]) stack, a frame store or a ".ppfs" path.
         filename (str, optional): Name of the output video file. If not provided, the name will be default to the name of the caller file, with a timestamp and '.mp4' extension.
+        fps (int, optional): Frame rate; defaults to the frame store's fps, else 60.
+        codec, preset, crf: Encoder choices for the ffmpeg / moviepy backends (crf=None keeps the encoder default).
+        workers (int, optional): Encode GOP-aligned segments in this many parallel ffmpeg processes
+            (see `encode_video`); None streams through a single encoder backend.
+        gop (int, optional): Keyframe interval; the segmented encode defaults to 2 seconds of frames.
+        backend (str): "auto" or a name in `ENCODERS` ("ffmpeg", "opencv", "pil", "moviepy").
+        **encoder_options: Extra keyword arguments for the backend (e.g. fourcc for opencv, loop for pil).
     """
-    assert isinstance(imgs, list)
-    if len(imgs) == 0:
+    from .framestore import FrameStore, FrameView
+
+    if isinstance(imgs, (str, os.PathLike)) and str(imgs).endswith(".ppfs"):
+        imgs = FrameStore(imgs)
+    if isinstance(imgs, (FrameStore, FrameView)):
+        fps = fps or imgs.fps
+    fps = fps or 60
+    if hasattr(imgs, "__len__") and len(imgs) == 0:
         ppplt.logger.warning("No image to save.")
         return
 
@@ -52,28 +113,580 @@ def animate(imgs, filename=None, fps=60):
     os.makedirs(os.path.abspath(os.path.dirname(filename)), exist_ok=True)
 
     ppplt.logger.info(f'Saving video to ~<"{filename}">~...')
-    from moviepy import ImageSequenceClip
+    if workers is not None:
+        encode_video(imgs, filename, fps=fps, codec=codec, preset=preset, crf=crf, workers=workers, gop=gop)
+        ppplt.logger.info("Video saved.")
+        return
+
+    cls = select_encoder(filename, backend)
+    options = {k: v for k, v in dict(codec=codec, preset=preset, crf=crf, gop=gop).items() if k in cls.options}
+    options.update(encoder_options)
+    frames = iter_rgb24(imgs)
+    first = next(frames, None)
+    if first is None:
+        ppplt.logger.warning("No image to save.")
+        return
+    t0 = time.perf_counter()
+    with cls(filename, fps, (first.shape[1], first.shape[0]), **options) as encoder:
+        encoder.write(first)
+        n = 1
+        for frame in frames:
+            encoder.write(frame)
+            n += 1
+    elapsed = time.perf_counter() - t0
+    ppplt.logger.event(
+        "encode",
+        f"🎞️  Encoded {n} frames with {cls.name}",
+        backend=cls.name,
+        frames=n,
+        fps=n / elapsed if elapsed > 0 else 0.0,
+        duration_ms=elapsed * 1000.0,
+    )
+    ppplt.logger.info("Video saved.")
+
+
+def find_ffmpeg():
+    """Path of the ffmpeg executable: $PPPLT_FFMPEG, then PATH, then the imageio-ffmpeg bundled binary."""
+    exe = os.environ.get("PPPLT_FFMPEG") or shutil.which("ffmpeg")
+    if exe:
+        return exe
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        raise ppplt.PaperPlotException("未找到 ffmpeg：请安装 ffmpeg 或 imageio-ffmpeg，或设置 PPPLT_FFMPEG") from None
+
+
+def _to_rgb24(arr, stacked=False):
+    """
+    Frames as contiguous (..., H, W, 3) uint8, the rawvideo rgb24 layout encoders read. With stacked=True a 3-D
+    input is an (N, H, W) grayscale stack rather than one (H, W, C) frame.
+    """
+    arr = _to_image_array(np.asarray(arr), ".mp4", keep_uint16=False)
+    if arr.ndim - stacked == 2:
+        arr = np.repeat(arr[..., None], 3, axis=-1)
+    elif arr.shape[-1] == 4:
+        arr = arr[..., :3]
+    elif arr.shape[-1] == 1:
+        arr = np.repeat(arr, 3, axis=-1)
+    return np.ascontiguousarray(arr)
+
+
+def iter_rgb24(imgs):
+    """
+    Yield (H, W, 3) uint8 frames from arrays, PIL images or image paths. An (N, H, W[, C]) array is converted in
+    one vectorized pass; other inputs are converted frame by frame.
+    """
+    if isinstance(imgs, np.ndarray):
+        yield from _to_rgb24(imgs, stacked=True)
+        return
+    for img in imgs:
+        yield _frame_rgb24(img)
+
+
+def _frame_rgb24(img):
+    """One frame given as an array, a PIL image or an image path, as (H, W, 3) uint8."""
+    if isinstance(img, (str, os.PathLike)):
+        with Image.open(img) as im:
+            img = np.asarray(im.convert("RGB"))
+    elif isinstance(img, Image.Image):
+        img = np.asarray(img.convert("RGB"))
+    return _to_rgb24(img)
+
+
+def plan_segments(n_frames, gop, segments):
+    """
+    Split `n_frames` into at most `segments` contiguous [start, stop) ranges whose boundaries fall on multiples of
+    `gop`, so every segment starts on the keyframe a single-pass encode with the same GOP would place there.
+    """
+    if gop < 1 or segments < 1:
+        raise ValueError(f"gop and segments must be >= 1, got gop={gop}, segments={segments}.")
+    gops = -(-n_frames // gop)
+    per_segment = -(-gops // segments) * gop
+    return [(start, min(start + per_segment, n_frames)) for start in range(0, n_frames, per_segment)]
+
+
+def _encoder_args(codec, preset, crf, gop, pix_fmt):
+    args = ["-c:v", codec]
+    if preset is not None:
+        args += ["-preset", preset]
+    if crf is not None:
+        args += ["-crf", str(crf)]
+    if gop is not None:
+        # fixed GOP without scene-cut keyframes: the keyframe layout depends only on the frame index
+        args += ["-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0"]
+    return args + ["-pix_fmt", pix_fmt]
+
+
+def _check_ffmpeg(proc, err):
+    if proc.returncode != 0:
+        tail = err.decode(errors="replace").strip().splitlines()[-5:]
+        raise ppplt.PaperPlotException(f"ffmpeg 编码失败 (exit {proc.returncode}): " + " | ".join(tail))
+
+
+def _run_ffmpeg(cmd):
+    proc = subprocess.Popen(cmd, stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+    _check_ffmpeg(proc, err)
 
-    imgs = ImageSequenceClip(imgs, fps=fps)
-    imgs.write_videofile(
+
+_ANIMATED_IMAGE_EXTS = (".gif", ".apng", ".png", ".webp")
+
+
+class Encoder:
+    """
+    Streaming encoder backend: constructed with (filename, fps, (width, height), **options), fed contiguous
+    (H, W, 3) uint8 frames through write(), finalized by close(). Leaving the context manager on an exception
+    calls abort() instead.
+    """
+
+    name = None
+    options = ()  # animate() keywords (codec / preset / crf / gop) this backend understands
+
+    @classmethod
+    def available(cls):
+        return True
+
+    @classmethod
+    def supports(cls, ext):
+        return ext not in _ANIMATED_IMAGE_EXTS
+
+    def __init__(self, filename, fps, size):
+        self.filename, self.fps, self.size = filename, fps, size
+
+    def write(self, frame):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def abort(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class FFmpegEncoder(Encoder):
+    """Raw rgb24 frames piped to an ffmpeg subprocess."""
+
+    name = "ffmpeg"
+    options = ("codec", "preset", "crf", "gop")
+
+    @classmethod
+    def available(cls):
+        try:
+            find_ffmpeg()
+        except ppplt.PaperPlotException:
+            return False
+        return True
+
+    def __init__(
+        self,
         filename,
-        fps=fps,
-        logger=None,
+        fps,
+        size,
         codec="libx264",
         preset="ultrafast",
-        # ffmpeg_params=["-crf", "0"],
-    )
-    ppplt.logger.info("Video saved.")
+        crf=None,
+        gop=None,
+        pix_fmt="yuv420p",
+        ffmpeg=None,
+    ):
+        super().__init__(filename, fps, size)
+        cmd = [ffmpeg or find_ffmpeg(), "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24"]
+        cmd += ["-s", f"{size[0]}x{size[1]}", "-r", str(fps), "-i", "-"]
+        cmd += _encoder_args(codec, preset, crf, gop, pix_fmt) + [filename]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def write(self, frame):
+        try:
+            self._proc.stdin.write(frame)
+        except BrokenPipeError:
+            self.close()  # ffmpeg exited early; close() raises with its stderr
+            raise
+
+    def close(self):
+        if self._proc.returncode is None:
+            _, err = self._proc.communicate()  # flushes and closes stdin itself
+            _check_ffmpeg(self._proc, err)
+
+    def abort(self):
+        self._proc.kill()
+        self._proc.communicate()
+
+
+class OpenCVEncoder(Encoder):
+    """cv2.VideoWriter; fourcc defaults to MJPG for .avi, mp4v otherwise."""
+
+    name = "opencv"
+
+    @classmethod
+    def available(cls):
+        return importlib.util.find_spec("cv2") is not None
+
+    def __init__(self, filename, fps, size, fourcc=None):
+        import cv2
+
+        super().__init__(filename, fps, size)
+        fourcc = fourcc or ("MJPG" if filename.lower().endswith(".avi") else "mp4v")
+        self._cv2 = cv2
+        self._writer = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*fourcc), fps, tuple(size))
+        if not self._writer.isOpened():
+            raise ppplt.PaperPlotException(f"OpenCV 无法打开视频写入器: {filename} (fourcc={fourcc})")
+
+    def write(self, frame):
+        self._writer.write(self._cv2.cvtColor(frame, self._cv2.COLOR_RGB2BGR))
+
+    def close(self):
+        self._writer.release()
+
+
+class PILEncoder(Encoder):
+    """Animated GIF / APNG (.png, .apng) / WebP via Pillow; frames are buffered and written on close()."""
+
+    name = "pil"
+
+    @classmethod
+    def supports(cls, ext):
+        return ext in _ANIMATED_IMAGE_EXTS
+
+    def __init__(self, filename, fps, size, loop=0, lossless=True, quality=90):
+        super().__init__(filename, fps, size)
+        self.params = {"loop": loop, "duration": 1000.0 / fps}
+        ext = os.path.splitext(filename)[1].lower()
+        if ext == ".webp":
+            self.params.update(lossless=lossless, quality=quality)
+        elif ext == ".apng":
+            self.params["format"] = "PNG"
+        self._frames = []
+
+    def write(self, frame):
+        self._frames.append(Image.fromarray(frame))
+
+    def close(self):
+        if self._frames:
+            first, rest = self._frames[0], self._frames[1:]
+            first.save(self.filename, save_all=True, append_images=rest, **self.params)
+            self._frames = []
+
+
+class MoviePyEncoder(Encoder):
+    """moviepy ImageSequenceClip fallback; frames are buffered and encoded on close()."""
+
+    name = "moviepy"
+    options = ("codec", "preset", "crf")
+
+    @classmethod
+    def available(cls):
+        return importlib.util.find_spec("moviepy") is not None
+
+    def __init__(self, filename, fps, size, codec="libx264", preset="ultrafast", crf=None):
+        super().__init__(filename, fps, size)
+        self.codec, self.preset, self.crf = codec, preset, crf
+        self._frames = []
+
+    def write(self, frame):
+        self._frames.append(frame)
+
+    def close(self):
+        if not self._frames:
+            return
+        from moviepy import ImageSequenceClip
+
+        clip = ImageSequenceClip(self._frames, fps=self.fps)
+        clip.write_videofile(
+            self.filename,
+            fps=self.fps,
+            logger=None,
+            codec=self.codec,
+            preset=self.preset,
+            ffmpeg_params=["-crf", str(self.crf)] if self.crf is not None else None,
+        )
+        self._frames = []
+
+    def abort(self):
+        self._frames = []
+
+
+# auto-selection order: the first available backend that supports the file extension wins
+ENCODERS = {cls.name: cls for cls in (FFmpegEncoder, OpenCVEncoder, PILEncoder, MoviePyEncoder)}
+
+
+def register_encoder(cls):
+    """Register an Encoder subclass under cls.name (appended to the auto-selection order)."""
+    if not (isinstance(cls, type) and issubclass(cls, Encoder)) or not cls.name:
+        raise ValueError(f"{cls!r} is not a named Encoder subclass.")
+    ENCODERS[cls.name] = cls
+    return cls
+
+
+def available_encoders():
+    return [name for name, cls in ENCODERS.items() if cls.available()]
+
+
+def select_encoder(filename, backend="auto"):
+    ext = os.path.splitext(filename)[1].lower()
+    if backend != "auto":
+        if backend not in ENCODERS:
+            raise ValueError(f"Unknown encoder backend '{backend}', expected one of {list(ENCODERS)}.")
+        cls = ENCODERS[backend]
+        if not cls.supports(ext):
+            raise ValueError(f"Encoder backend '{backend}' cannot write '{ext}' files.")
+        if not cls.available():
+            raise ppplt.PaperPlotException(f"编码后端 {backend} 不可用（依赖未安装）")
+        return cls
+    for cls in ENCODERS.values():
+        if cls.supports(ext) and cls.available():
+            return cls
+    raise ppplt.PaperPlotException(f"没有可写入 {ext} 的编码后端：请安装 ffmpeg、opencv-python 或 moviepy")
+
+
+def encode_video(
+    frames,
+    filename,
+    fps=60,
+    codec="libx264",
+    preset="medium",
+    crf=18,
+    pix_fmt="yuv420p",
+    gop=None,
+    workers=None,
+    segments=None,
+    ffmpeg=None,
+):
+    """
+    Encode frames with ffmpeg, splitting them into GOP-aligned segments encoded by parallel ffmpeg processes and
+    joined with the concat demuxer (stream copy, no re-encode).
+
+    Args:
+        frames: Random-access frame sequence (list of arrays / PIL images / image paths, (N, H, W[, C]) array,
+            FrameStore / FrameView); other iterables are materialized first.
+        gop (int, optional): Keyframe interval; defaults to 2 seconds of frames.
+        workers (int, optional): Concurrent ffmpeg processes; defaults to the CPU count.
+        segments (int, optional): Number of segments; defaults to `workers`. One segment encodes straight to
+            `filename`.
+    """
+    if not hasattr(frames, "__getitem__") or not hasattr(frames, "__len__"):
+        frames = list(frames)
+    n = len(frames)
+    if n == 0:
+        raise ValueError("No frame to encode.")
+    ffmpeg = ffmpeg or find_ffmpeg()
+    gop = gop or max(1, int(round(2 * fps)))
+    workers = workers or os.cpu_count() or 1
+    plan = plan_segments(n, gop, segments or workers)
+    height, width = _frame_rgb24(frames[0]).shape[:2]
+    options = dict(codec=codec, preset=preset, crf=crf, gop=gop, pix_fmt=pix_fmt, ffmpeg=ffmpeg)
+    _ensure_dir(filename)
+
+    def encode(start, stop, out):
+        with FFmpegEncoder(out, fps, (width, height), **options) as encoder:
+            for i in range(start, stop):
+                encoder.write(_frame_rgb24(frames[i]))
+
+    t0 = time.perf_counter()
+    if len(plan) == 1:
+        encode(0, n, filename)
+    else:
+        tmp = tempfile.mkdtemp(prefix="ppplt-segments-", dir=os.path.dirname(os.path.abspath(filename)))
+        try:
+            ext = os.path.splitext(filename)[1] or ".mp4"
+            paths = [os.path.join(tmp, f"seg_{k:05d}{ext}") for k in range(len(plan))]
+            # threads only feed frames; the encoding itself runs in the ffmpeg child processes
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for f in [pool.submit(encode, a, b, p) for (a, b), p in zip(plan, paths)]:
+                    f.result()
+            listing = os.path.join(tmp, "segments.txt")
+            with open(listing, "w", encoding="utf-8") as f:
+                f.writelines(f"file '{os.path.basename(p)}'\n" for p in paths)
+            concat = [ffmpeg or find_ffmpeg(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0"]
+            _run_ffmpeg(concat + ["-i", listing, "-c", "copy", filename])
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    elapsed = time.perf_counter() - t0
+    logger = getattr(ppplt, "logger", None)
+    if logger is not None:
+        logger.event(
+            "encode",
+            f"🎞️  Encoded {n} frames in {len(plan)} segment(s)",
+            frames=n,
+            segments=len(plan),
+            workers=workers,
+            fps=n / elapsed if elapsed > 0 else 0.0,
+            duration_ms=elapsed * 1000.0,
+        )
+
+
+def _ensure_dir(filename):
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+
+
+# rounding slack for float images computed in [0, 1]
+_FLOAT_TOL = 1e-6
+
+
+def _to_image_array(arr, ext, keep_uint16=True):
+    if arr.dtype == np.uint8:
+        return arr
+    if arr.dtype == np.bool_:
+        return arr.view(np.uint8) * np.uint8(255)
+    if arr.dtype == np.uint16:
+        if keep_uint16 and ext == ".png" and arr.ndim == 2:
+            return arr
+        return (arr >> 8).astype(np.uint8)
+    if arr.size == 0:
+        return arr.astype(np.uint8)
+    lo, hi = arr.min(), arr.max()
+    if np.issubdtype(arr.dtype, np.floating):
+        if lo < -_FLOAT_TOL or hi > 1.0 + _FLOAT_TOL:
+            raise ValueError(f"Float images must be in [0, 1], got [{lo:g}, {hi:g}]; rescale or convert to uint8.")
+        out = arr * 255.0
+        out += 0.5
+        np.clip(out, 0.0, 255.0, out=out)
+        return out.astype(np.uint8)
+    if lo < 0 or hi > 255:
+        raise ValueError(f"{arr.dtype} image values [{lo}, {hi}] do not fit uint8; rescale or convert first.")
+    return arr.astype(np.uint8)
+
+
+def _encode_params(ext, png_compress_level=6, jpeg_quality=90, webp_lossless=True):
+    if ext == ".png":
+        return {"compress_level": png_compress_level}
+    if ext in (".jpg", ".jpeg"):
+        return {"quality": jpeg_quality}
+    if ext == ".webp":
+        return {"lossless": webp_lossless, "quality": 100 if webp_lossless else jpeg_quality, "method": 0}
+    return {}
+
+
+def _write_image(arr, filename, keep_uint16=True, **params):
+    ext = os.path.splitext(filename)[1].lower()
+    arr = _to_image_array(arr, ext, keep_uint16)
+    _ensure_dir(filename)
+    Image.fromarray(arr).save(filename, **_encode_params(ext, **params))
 
 
 def save_img_arr(arr, filename="img.png"):
     assert isinstance(arr, np.ndarray)
-    os.makedirs(os.path.abspath(os.path.dirname(filename)), exist_ok=True)
-    img = Image.fromarray(arr)
-    img.save(filename)
+    _write_image(arr, filename)
     ppplt.logger.info(f"Image saved to ~<{filename}>~.")
 
 
+class ImageWriter:
+    """
+    Batched, threaded image writer for large frame dumps.
+
+    Usage:
+        with ImageWriter(workers=2) as writer:
+            for i, frame in enumerate(frames):
+                writer.write(frame, f"out/frame_{i:06d}.png")
+        print(writer.stats())
+    """
+
+    def __init__(
+        self,
+        workers=1,
+        queue_size=64,
+        png_compress_level=1,
+        jpeg_quality=90,
+        webp_lossless=True,
+        keep_uint16=True,
+    ):
+        self.params = dict(
+            png_compress_level=png_compress_level, jpeg_quality=jpeg_quality, webp_lossless=webp_lossless
+        )
+        self.keep_uint16 = keep_uint16
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._error = None
+        self._frames = 0
+        self._bytes = 0
+        self._busy = 0.0
+        self._start = time.perf_counter()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"ppplt-imgwriter-{i}", daemon=True) for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def write(self, arr, filename):
+        if self._threads is None:
+            raise RuntimeError("ImageWriter is closed.")
+        self._raise_pending()
+        ext = os.path.splitext(filename)[1].lower()
+        out = _to_image_array(np.asarray(arr), ext, self.keep_uint16)
+        # the caller may reuse its buffer for the next frame; conversions already produced a private copy
+        self._queue.put((out.copy() if out is arr else out, filename))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                arr, filename = item
+                t0 = time.perf_counter()
+                try:
+                    _write_image(arr, filename, self.keep_uint16, **self.params)
+                    size = os.path.getsize(filename)
+                except Exception as e:
+                    with self._lock:
+                        self._error = self._error or e
+                    continue
+                with self._lock:
+                    self._frames += 1
+                    self._bytes += size
+                    self._busy += time.perf_counter() - t0
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self):
+        self._queue.join()
+        self._raise_pending()
+
+    def close(self):
+        if self._threads is None:
+            return
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        self._threads = None
+        self._raise_pending()
+
+    def stats(self):
+        with self._lock:
+            elapsed = time.perf_counter() - self._start
+            return {
+                "frames": self._frames,
+                "bytes": self._bytes,
+                "busy_s": self._busy,
+                "elapsed_s": elapsed,
+                "fps": self._frames / elapsed if elapsed > 0 else 0.0,
+                "mb_per_s": self._bytes / elapsed / 1e6 if elapsed > 0 else 0.0,
+                "queued": self._queue.qsize(),
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 class Timer:
     def __init__(self, skip=False, level=0):
         self.accu_log = dict()
@@ -153,25 +766,79 @@ class Rate:
 
 
 class FPSTracker:
-    def __init__(self, alpha=0.95):
+    """
+    Frame-rate tracker keeping an EMA estimate and a rolling window of frame times.
+
+    Measurement (`step`) never formats or logs anything by itself; a summary is logged at most once per
+    `report_interval` seconds (pass `None` to disable logging entirely and poll `stats()` instead).
+    """
+
+    def __init__(self, alpha=0.95, window=120, report_interval=1.0):
         self.last_time = None
         self.dt_ema = None
         self.alpha = alpha
+        self.total_fps = None
+        self.report_interval = report_interval
+        self._dts = deque(maxlen=window)
+        self._last_report = None
+
+    def reset(self):
+        self.last_time = None
+        self.dt_ema = None
+        self.total_fps = None
+        self._dts.clear()
+        self._last_report = None
 
     def step(self):
         current_time = time.perf_counter()
 
-        if self.last_time:
-            dt = current_time - self.last_time
-        else:
-            self.last_time = current_time
-            return
+        if self.last_time is None:
+            self.last_time = self._last_report = current_time
+            return None
+
+        dt = current_time - self.last_time
+        self.last_time = current_time
+        self._dts.append(dt)
 
         if self.dt_ema:
             self.dt_ema = self.alpha * self.dt_ema + (1 - self.alpha) * dt
         else:
             self.dt_ema = dt
-        fps = 1 / self.dt_ema
-        self.total_fps = fps
-        ppplt.logger.info(f"FPS: ~<{fps:.2f}>~ .")
-        self.last_time = current_time
+        self.total_fps = 1 / self.dt_ema if self.dt_ema > 0 else float("inf")
+
+        if self.report_interval is not None and current_time - self._last_report >= self.report_interval:
+            self._last_report = current_time
+            self.report()
+        return self.total_fps
+
+    @property
+    def fps(self):
+        return self.total_fps
+
+    def stats(self):
+        """
+        Return frame-time statistics over the rolling window (times in milliseconds).
+
+        Keys: ``count``, ``fps`` (EMA), ``min``, ``mean``, ``p95``, ``max``. Time fields are `None` until at
+        least one frame interval has been recorded.
+        """
+        if not self._dts:
+            return {"count": 0, "fps": self.total_fps, "min": None, "mean": None, "p95": None, "max": None}
+        dts = np.fromiter(self._dts, dtype=np.float64, count=len(self._dts)) * 1000.0
+        return {
+            "count": int(dts.size),
+            "fps": self.total_fps,
+            "min": float(dts.min()),
+            "mean": float(dts.mean()),
+            "p95": float(np.percentile(dts, 95)),
+            "max": float(dts.max()),
+        }
+
+    def report(self):
+        s = self.stats()
+        if s["count"] == 0:
+            return
+        ppplt.logger.info(
+            f"FPS: ~<{s['fps']:.2f}>~ | frame ms min/mean/p95/max: "
+            f"~<{s['min']:.2f}/{s['mean']:.2f}/{s['p95']:.2f}/{s['max']:.2f}>~ ."
+        )
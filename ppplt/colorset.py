@@ -5,16 +5,24 @@ API:
 - list_color_sets() -> list[str]
 - get_color_set(name: str) -> list[str]
 - apply_color_set(name: str) -> None
+- register_color_set(name: str, colors: list[str], aliases=(), overwrite: bool = False) -> None
+- is_grayscale_discriminable(name: str, min_delta: float = 8.0, metric: str = "luma") -> bool
 
 Behavior:
-- Names are case-insensitive.
+- Names are case-, space- and '-'/'_'-insensitive, resolved in O(1) through `COLOR_SETS` (a ppplt.registry.Registry).
 - apply_color_set sets Matplotlib axes.prop_cycle to the chosen scheme.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List
+import re
+from typing import Dict, List, Sequence
 
+import numpy as np
+
+from .registry import Registry
+
+_HEX = re.compile(r"#[0-9A-Fa-f]{6}")
 
 colorsets: Dict[str, List[str]] = {
     "Contrast Set 1": [
@@ -135,21 +143,29 @@ colorsets: Dict[str, List[str]] = {
 }
 
 
+def _validate_colors(name: str, colors: List[str]) -> List[str]:
+    bad = [c for c in colors if not (isinstance(c, str) and _HEX.fullmatch(c))]
+    if not colors or bad:
+        raise ValueError(f"Color set '{name}' must be a non-empty list of '#RRGGBB' strings, got invalid: {bad}")
+    return [c.upper() for c in colors]
+
+
+# `colorsets` stays the backing dict; the registry adds the normalized-name index and aliases on top
+COLOR_SETS = Registry("color set", colorsets, validate=_validate_colors)
+
+
 def list_color_sets() -> List[str]:
-    return list(colorsets.keys())
+    return COLOR_SETS.names()
 
 
 def get_color_set(name: str) -> List[str]:
-    # Case-insensitive lookup
-    key = None
-    lname = name.lower()
-    for k in colorsets.keys():
-        if k.lower() == lname:
-            key = k
-            break
-    if key is None:
-        raise ValueError(f"Color set '{name}' not found. Available: {list_color_sets()}")
-    return list(colorsets[key])
+    # Case-insensitive O(1) lookup through the normalized index
+    return list(COLOR_SETS.get(name))
+
+
+def register_color_set(name: str, colors: List[str], *, aliases: Sequence[str] = (), overwrite: bool = False) -> None:
+    """Add a user color set; names share the case-insensitive namespace of the built-in sets."""
+    COLOR_SETS.register(name, list(colors), aliases=aliases, overwrite=overwrite)
 
 
 def apply_color_set(name: str) -> None:
@@ -160,27 +176,23 @@ def apply_color_set(name: str) -> None:
     rcParams["axes.prop_cycle"] = cycler(color=colors)
 
 
-def is_grayscale_discriminable(name: str, min_delta: float = 8.0) -> bool:
-    """Rudimentary grayscale discriminability check.
+def is_grayscale_discriminable(name: str, min_delta: float = 8.0, metric: str = "luma") -> bool:
+    """Grayscale discriminability check.
 
-    Converts hex colors to perceived luminance (Y) and checks if adjacent
-    colors differ by at least `min_delta` on 0-100 scale.
+    Converts the whole set in one vectorized pass and checks that every pair of colors differs by at least
+    `min_delta` on a 0-100 scale. metric="luma" (default) uses Rec. 709 luma of the gamma-encoded values;
+    metric="lightness" uses CIE L* (lightness of the linearized luminance), the scale `palette_report` and
+    `generate_palette(grayscale=True)` work in. See `ppplt.colorspace.palette_report` for the full perceptual /
+    color-blindness audit.
     """
-    import colorsys
-
-    def luminance_hex(h: str) -> float:
-        h = h.lstrip("#")
-        r = int(h[0:2], 16) / 255.0
-        g = int(h[2:4], 16) / 255.0
-        b = int(h[4:6], 16) / 255.0
-        # Rec. 709 luma approximation scaled 0-100
-        y = 0.2126 * r + 0.7152 * g + 0.0722 * b
-        return y * 100.0
-
-    cols = get_color_set(name)
-    ys = [luminance_hex(c) for c in cols]
-    ys_sorted = sorted(ys)
-    for a, b in zip(ys_sorted, ys_sorted[1:]):
-        if abs(b - a) < min_delta:
-            return False
-    return True
+    from .colorspace import _LUMA_709, lightness, to_rgb
+
+    rgb = to_rgb(get_color_set(name))
+    if metric == "luma":
+        ys = rgb @ _LUMA_709 * 100.0
+    elif metric == "lightness":
+        ys = lightness(rgb)
+    else:
+        raise ValueError(f"Unknown metric '{metric}', expected 'luma' or 'lightness'.")
+    ys = np.sort(ys)
+    return bool(np.all(np.diff(ys) >= min_delta))
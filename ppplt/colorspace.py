@@ -0,0 +1,306 @@
+"""
+Vectorized color-space engine for palette analysis.
+
+API:
+Conversions (all accept ``(..., 3)`` arrays, so whole palettes or stacks of palettes convert in one call):
+- to_rgb(colors) -> np.ndarray: Hex strings / Matplotlib color specs -> sRGB in [0, 1], shape (N, 3).
+- srgb_to_linear(rgb) / linear_to_srgb(lin): sRGB transfer function and its inverse.
+- linear_to_xyz(lin) / xyz_to_lab(xyz): Linear sRGB -> CIE XYZ (D65, Y in [0, 1]) -> CIELAB.
+- rgb_to_lab(rgb): sRGB -> CIELAB.
+- rgb_to_cam02ucs(rgb): sRGB -> CAM02-UCS (J', a', b'), sRGB viewing conditions (L_A = 64/pi/5, Y_b = 20).
+- relative_luminance(rgb) -> np.ndarray: Rec. 709 luminance of linearized sRGB.
+
+Simulation:
+- simulate_cvd(rgb, kind, severity=1.0): Protanopia / deuteranopia / tritanopia (Machado et al. 2009), or grayscale.
+
+Metrics & reports:
+- pairwise_delta_e(x) -> np.ndarray: Euclidean ΔE matrix over the color axis, shape (..., N, N).
+- min_delta_e(x) -> np.ndarray: Smallest off-diagonal ΔE per palette, shape (...).
+- PaletteReport / palette_report(colors_or_name, space="cam02ucs"): Full audit of one palette.
+
+Behavior:
+- Everything is pure numpy; no per-color Python loops beyond parsing the input strings once.
+- ΔE is computed in CAM02-UCS by default ("lab" gives CIE76).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+# sRGB (D65) -> XYZ
+_M_RGB2XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+_LUMA_709 = np.array([0.2126, 0.7152, 0.0722])
+
+# Machado, Oliveira & Fernandes (2009), severity 1.0, applied in linear RGB
+_CVD_MATRICES = {
+    "protanopia": np.array(
+        [
+            [0.152286, 1.052583, -0.204868],
+            [0.114503, 0.786281, 0.099216],
+            [-0.003882, -0.048116, 1.051998],
+        ]
+    ),
+    "deuteranopia": np.array(
+        [
+            [0.367322, 0.860646, -0.227968],
+            [0.280085, 0.672501, 0.047413],
+            [-0.011820, 0.042940, 0.968881],
+        ]
+    ),
+    "tritanopia": np.array(
+        [
+            [1.255528, -0.076749, -0.178779],
+            [-0.078411, 0.930809, 0.147602],
+            [0.004733, 0.691367, 0.303900],
+        ]
+    ),
+}
+CVD_KINDS = ("protanopia", "deuteranopia", "tritanopia", "grayscale")
+
+
+# ---------------------------
+# Parsing & transfer functions
+# ---------------------------
+def to_rgb(colors: Union[str, Sequence]) -> np.ndarray:
+    if isinstance(colors, np.ndarray):
+        return np.asarray(colors, dtype=np.float64)[..., :3]
+    if isinstance(colors, str):
+        colors = [colors]
+    colors = list(colors)
+    if all(isinstance(c, str) and c.startswith("#") and len(c) == 7 for c in colors):
+        # fast path: decode all '#RRGGBB' strings in one buffer
+        raw = bytes.fromhex("".join(c[1:] for c in colors))
+        return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3) / 255.0
+    from matplotlib.colors import to_rgba_array
+
+    return to_rgba_array(colors)[:, :3].astype(np.float64)
+
+
+def to_hex(rgb: np.ndarray) -> List[str]:
+    rgb8 = np.clip(np.rint(np.asarray(rgb)[..., :3] * 255.0), 0, 255).astype(np.uint8).reshape(-1, 3)
+    return ["#" + bytes(c).hex().upper() for c in rgb8]
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(lin: np.ndarray) -> np.ndarray:
+    lin = np.clip(np.asarray(lin, dtype=np.float64), 0.0, 1.0)
+    return np.where(lin <= 0.0031308, lin * 12.92, 1.055 * lin ** (1 / 2.4) - 0.055)
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    return srgb_to_linear(rgb) @ _LUMA_709
+
+
+# ---------------------------
+# CIE XYZ / CIELAB
+# ---------------------------
+def linear_to_xyz(lin: np.ndarray) -> np.ndarray:
+    return np.asarray(lin, dtype=np.float64) @ _M_RGB2XYZ.T
+
+
+def xyz_to_lab(xyz: np.ndarray) -> np.ndarray:
+    t = np.asarray(xyz, dtype=np.float64) / _WHITE_D65
+    delta = 6.0 / 29.0
+    f = np.where(t > delta**3, np.cbrt(t), t / (3 * delta**2) + 4.0 / 29.0)
+    L = 116.0 * f[..., 1] - 16.0
+    a = 500.0 * (f[..., 0] - f[..., 1])
+    b = 200.0 * (f[..., 1] - f[..., 2])
+    return np.stack([L, a, b], axis=-1)
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    return xyz_to_lab(linear_to_xyz(srgb_to_linear(rgb)))
+
+
+def lightness(rgb: np.ndarray) -> np.ndarray:
+    """CIE L* (0-100) of sRGB colors, i.e. what is left after grayscale printing."""
+    y = relative_luminance(rgb)
+    return np.where(y > (6.0 / 29.0) ** 3, 116.0 * np.cbrt(y) - 16.0, y * (29.0 / 3.0) ** 3)
+
+
+# ---------------------------
+# CIECAM02 / CAM02-UCS
+# ---------------------------
+_M_CAT02 = np.array([[0.7328, 0.4296, -0.1624], [-0.7036, 1.6975, 0.0061], [0.0030, 0.0136, 0.9834]])
+_M_HPE = np.array([[0.38971, 0.68898, -0.07868], [-0.22981, 1.18340, 0.04641], [0.0, 0.0, 1.0]])
+
+
+class _CAM02Conditions:
+    """Precomputed CIECAM02 viewing-condition constants (average surround)."""
+
+    def __init__(self, white=_WHITE_D65 * 100.0, L_A=64.0 / np.pi / 5.0, Y_b=20.0, F=1.0, c=0.69, Nc=1.0):
+        Y_w = white[1]
+        self.c, self.Nc = c, Nc
+        D = np.clip(F * (1 - (1 / 3.6) * np.exp((-L_A - 42) / 92)), 0.0, 1.0)
+        rgb_w = _M_CAT02 @ white
+        self.D_rgb = D * Y_w / rgb_w + 1 - D
+        k = 1 / (5 * L_A + 1)
+        self.F_L = 0.2 * k**4 * (5 * L_A) + 0.1 * (1 - k**4) ** 2 * (5 * L_A) ** (1 / 3)
+        self.n = Y_b / Y_w
+        self.z = 1.48 + np.sqrt(self.n)
+        self.N_bb = self.N_cb = 0.725 * (1 / self.n) ** 0.2
+        # chromatic adaptation + HPE in one matrix
+        self.M = _M_HPE @ np.linalg.inv(_M_CAT02) @ np.diag(self.D_rgb) @ _M_CAT02
+        rgb_aw = self._compress(self.M @ white)
+        self.A_w = (2 * rgb_aw[0] + rgb_aw[1] + rgb_aw[2] / 20 - 0.305) * self.N_bb
+
+    def _compress(self, rgb):
+        x = (self.F_L * np.abs(rgb) / 100.0) ** 0.42
+        return 400.0 * np.sign(rgb) * x / (x + 27.13) + 0.1
+
+    def jmh(self, xyz100):
+        rgb_a = self._compress(np.asarray(xyz100) @ self.M.T)
+        R, G, B = rgb_a[..., 0], rgb_a[..., 1], rgb_a[..., 2]
+        a = R - 12 * G / 11 + B / 11
+        b = (R + G - 2 * B) / 9
+        h = np.arctan2(b, a)
+        e_t = 0.25 * (np.cos(h + 2) + 3.8)
+        A = (2 * R + G + B / 20 - 0.305) * self.N_bb
+        J = 100.0 * np.maximum(A / self.A_w, 0.0) ** (self.c * self.z)
+        t = (50000 / 13 * self.Nc * self.N_cb * e_t * np.hypot(a, b)) / (R + G + 21 / 20 * B)
+        C = np.maximum(t, 0.0) ** 0.9 * np.sqrt(J / 100.0) * (1.64 - 0.29**self.n) ** 0.73
+        M = C * self.F_L**0.25
+        return J, M, h
+
+
+_SRGB_CONDITIONS = _CAM02Conditions()
+
+
+def rgb_to_cam02ucs(rgb: np.ndarray) -> np.ndarray:
+    J, M, h = _SRGB_CONDITIONS.jmh(linear_to_xyz(srgb_to_linear(rgb)) * 100.0)
+    c1, c2 = 0.007, 0.0228
+    Jp = (1 + 100 * c1) * J / (1 + c1 * J)
+    Mp = np.log1p(c2 * M) / c2
+    return np.stack([Jp, Mp * np.cos(h), Mp * np.sin(h)], axis=-1)
+
+
+_SPACES = {"cam02ucs": rgb_to_cam02ucs, "lab": rgb_to_lab}
+
+
+def convert(rgb: np.ndarray, space: str = "cam02ucs") -> np.ndarray:
+    try:
+        return _SPACES[space](rgb)
+    except KeyError:
+        raise ValueError(f"Unknown color space '{space}'. Available: {list(_SPACES)}") from None
+
+
+# ---------------------------
+# Simulation
+# ---------------------------
+def simulate_cvd(rgb: np.ndarray, kind: str, severity: float = 1.0) -> np.ndarray:
+    """Simulate color-vision deficiency (or grayscale printing) on sRGB colors; returns sRGB."""
+    lin = srgb_to_linear(rgb)
+    if kind == "grayscale":
+        y = lin @ _LUMA_709
+        return linear_to_srgb(np.repeat(y[..., None], 3, axis=-1))
+    if kind not in _CVD_MATRICES:
+        raise ValueError(f"Unknown deficiency '{kind}'. Available: {list(CVD_KINDS)}")
+    m = severity * _CVD_MATRICES[kind] + (1.0 - severity) * np.eye(3)
+    return linear_to_srgb(lin @ m.T)
+
+
+# ---------------------------
+# Metrics
+# ---------------------------
+def pairwise_delta_e(x: np.ndarray) -> np.ndarray:
+    """Euclidean distance matrix over the second-to-last axis of perceptual coordinates ``(..., N, 3)``."""
+    x = np.asarray(x, dtype=np.float64)
+    diff = x[..., :, None, :] - x[..., None, :, :]
+    return np.sqrt(np.einsum("...k,...k->...", diff, diff))
+
+
+def min_delta_e(x: np.ndarray) -> np.ndarray:
+    d = pairwise_delta_e(x)
+    n = d.shape[-1]
+    if n < 2:
+        return np.full(d.shape[:-2], np.inf)
+    d = d + np.diag(np.full(n, np.inf))
+    return d.min(axis=(-2, -1))
+
+
+@dataclass
+class PaletteReport:
+    colors: List[str]
+    space: str
+    coords: np.ndarray
+    delta_e: np.ndarray
+    min_delta_e: float
+    lightness: np.ndarray
+    min_lightness_delta: float
+    cvd_min_delta_e: Dict[str, float] = field(default_factory=dict)
+
+    def is_grayscale_discriminable(self, min_delta: float = 8.0) -> bool:
+        return self.min_lightness_delta >= min_delta
+
+    def is_cvd_safe(self, min_delta: float = 10.0) -> bool:
+        return all(self.cvd_min_delta_e[k] >= min_delta for k in ("protanopia", "deuteranopia", "tritanopia"))
+
+    def worst_pair(self):
+        """Indices of the two least distinguishable colors."""
+        d = self.delta_e + np.diag(np.full(len(self.colors), np.inf))
+        i, j = np.unravel_index(np.argmin(d), d.shape)
+        return int(min(i, j)), int(max(i, j))
+
+
+def palette_report(colors: Union[str, Sequence[str]], space: str = "cam02ucs") -> PaletteReport:
+    """
+    Audit a palette given as a color set name or a list of colors.
+
+    All simulations are stacked into a single ``(kinds, N, 3)`` array and converted/compared in one pass.
+    """
+    if isinstance(colors, str) and not colors.startswith("#"):
+        from .colorset import get_color_set
+
+        colors = get_color_set(colors)
+    rgb = to_rgb(colors)
+    kinds = CVD_KINDS[:-1]
+    sims = np.stack([rgb] + [simulate_cvd(rgb, k) for k in kinds])
+    coords = convert(sims, space)
+    mins = min_delta_e(coords)
+    L = lightness(rgb)
+    dL = np.abs(L[:, None] - L[None, :]) + np.diag(np.full(len(L), np.inf))
+    return PaletteReport(
+        colors=to_hex(rgb),
+        space=space,
+        coords=coords[0],
+        delta_e=pairwise_delta_e(coords[0]),
+        min_delta_e=float(mins[0]),
+        lightness=L,
+        min_lightness_delta=float(dL.min()) if len(L) > 1 else float("inf"),
+        cvd_min_delta_e={k: float(m) for k, m in zip(kinds, mins[1:])},
+    )
+
+
+__all__ = [
+    "CVD_KINDS",
+    "to_rgb",
+    "to_hex",
+    "srgb_to_linear",
+    "linear_to_srgb",
+    "relative_luminance",
+    "linear_to_xyz",
+    "xyz_to_lab",
+    "rgb_to_lab",
+    "lightness",
+    "rgb_to_cam02ucs",
+    "convert",
+    "simulate_cvd",
+    "pairwise_delta_e",
+    "min_delta_e",
+    "PaletteReport",
+    "palette_report",
+]
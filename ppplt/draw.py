@@ -3,9 +3,11 @@ Drawing utilities & pipeline steps.
 
 This module exposes:
   - draw(): Simple single/multi subplot creation with optional callback
-  - draw_grid(): Higher-level grid helper (titles, legend auto layout)
+  - draw_grid(): Higher-level grid helper (titles, legend auto layout, ragged mosaic layouts)
   - draw_step / draw_grid_step: pipeline (>> ) steps
   - LegendConfig: configure figure-level legend occupying extra vertical space
+  - collect_legend_entries(): deduplicated (optionally proxied) legend handles across a grid
+  - solve_legend_layout(): one-pass legend sizing (ncol / rows / extent) from cached label measurements
 
 Design goals:
   * Keep core __init__ small; advanced grid logic lives here.
@@ -15,8 +17,12 @@ Design goals:
 from __future__ import annotations
 from typing import Callable, Any, Optional, Tuple, Sequence, Iterable, List
 from dataclasses import dataclass, field
-import math
+import functools
+import time
+import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
 
 import ppplt as _core
 from .pipeline import Step
@@ -39,6 +45,7 @@ def draw(
     from . import _require_phase, _Phase, logger
 
     _require_phase(_Phase.STYLE_SET, _Phase.DRAWN, _Phase.SAVED)
+    t_start = time.perf_counter()
     fig, axes = plt.subplots(*subplots, figsize=figsize)  # type: ignore[arg-type]
     if plot_fn:
         try:
@@ -53,7 +60,13 @@ def draw(
     _core._last_fig = fig
     _core._last_axes = axes
     _core._phase = _Phase.DRAWN
-    logger.info("🖊️  Figure drawn")
+    logger.event(
+        "draw",
+        "🖊️  Figure drawn",
+        figure=fig.number,
+        axes=len(fig.axes),
+        duration_ms=(time.perf_counter() - t_start) * 1000.0,
+    )
     return (fig, axes) if return_axes else fig
 
 
@@ -74,12 +87,107 @@ class LegendConfig:
     handles: Optional[Sequence[Any]] = None
     loc: str = "lower center"
     ncol: Optional[int] = None
-    lg_width: float = 0.875
-    lg_height: float = 0.15
+    lg_width: float = 0.875  # legacy column-width heuristic, superseded by measured label extents
+    lg_height: float = 0.15  # legacy row-height heuristic, superseded by measured label extents
     border_layout: List[float] = field(default_factory=lambda: [0, 0, 1, 1])
     frameon: bool = False
-    bbox_to_anchor: Optional[Tuple[float, float, float, float]] = (0.45, -0.03, 0.1, 0.1)
+    bbox_to_anchor: Optional[Tuple[float, float, float, float]] = None  # explicit placement, skips the solver's
     extra_tight: Optional[dict] = None
+    edge: Optional[str] = None  # "bottom" | "top" | "left" | "right"; default derived from `loc`
+    fontsize: Optional[float] = None  # default: rcParams["legend.fontsize"]
+    grow: bool = True  # top / bottom: enlarge the figure height instead of shrinking the axes
+    dedup: Optional[str] = "label"  # auto-collected entries: "label" | "style" | None (keep duplicates)
+    proxies: bool = False  # auto-collected entries: legend keeps style-only copies instead of the data artists
+
+
+_EDGE_LOCS = {"bottom": "lower center", "top": "upper center", "left": "center left", "right": "center right"}
+_LOC_EDGES = {loc: edge for edge, loc in _EDGE_LOCS.items()}
+
+
+@dataclass(frozen=True)
+class LegendLayout:
+    ncol: int
+    nrows: int
+    width: float  # inches, including the legend's border padding
+    height: float
+
+
+def _text_extent(text: str, prop) -> Tuple[float, float]:
+    """(width, height) in points of one label rendered with `prop`; measured once per (text, font file)."""
+    from matplotlib.font_manager import findfont
+
+    # FontProperties hashes by generic family ("serif"), so the resolved file keys styles with other font lists
+    return _measure_text(text, prop, findfont(prop), mpl.rcParams["text.usetex"])
+
+
+@functools.lru_cache(maxsize=4096)
+def _measure_text(text: str, prop, font_file: str, usetex: bool) -> Tuple[float, float]:
+    from matplotlib import cbook
+    from matplotlib.textpath import text_to_path
+
+    ismath = "TeX" if usetex else cbook.is_math_text(text)
+    w, h, _ = text_to_path.get_text_width_height_descent(text, prop, ismath=ismath)
+    return w, h
+
+
+def solve_legend_layout(
+    labels: Sequence[str],
+    *,
+    edge: str = "bottom",
+    available: float,
+    ncol: Optional[int] = None,
+    fontsize: Optional[float] = None,
+) -> LegendLayout:
+    """
+    Size a legend in one pass.
+
+    `available` is the room along the edge in inches (width for top / bottom, height for left / right). Top / bottom
+    legends get the fewest rows that fit, using the fewest columns for that row count; left / right legends get the
+    fewest columns that fit. Columns are filled like Matplotlib does (np.array_split of the entries).
+    """
+    from matplotlib.font_manager import FontProperties
+
+    if edge not in _EDGE_LOCS:
+        raise ValueError(f"edge must be one of {list(_EDGE_LOCS)}, got {edge!r}")
+    rc = mpl.rcParams
+    prop = FontProperties(size=fontsize if fontsize is not None else rc["legend.fontsize"])
+    fs = prop.get_size_in_points()
+    extents = np.array([_text_extent(str(label), prop) for label in labels] or [(0.0, 0.0)])
+    entry_w = extents[:, 0] + (rc["legend.handlelength"] + rc["legend.handletextpad"]) * fs
+    row_h = max(extents[:, 1].max(), _text_extent("lp", prop)[1], rc["legend.handleheight"] * fs)
+    pad = 2 * rc["legend.borderpad"] * fs
+    n = len(labels)
+
+    def size(nc):
+        nr = -(-n // nc)
+        width = sum(col.max() for col in np.array_split(entry_w, nc)) + (nc - 1) * rc["legend.columnspacing"] * fs
+        height = nr * row_h + (nr - 1) * rc["legend.labelspacing"] * fs
+        return nr, (width + pad) / 72.0, (height + pad) / 72.0
+
+    if ncol is None:
+        ncol = 1
+        if edge in ("top", "bottom"):
+            best_rows = None
+            for nc in range(1, n + 1):
+                nr, w, _ = size(nc)
+                if w > available:
+                    break  # adding columns never makes the legend narrower
+                if best_rows is None or nr < best_rows:
+                    ncol, best_rows = nc, nr
+        else:
+            ncol = next((nc for nc in range(1, n + 1) if size(nc)[2] <= available), max(n, 1))
+    ncol = max(1, min(ncol or 1, max(n, 1)))
+    nrows, width, height = size(ncol)
+    return LegendLayout(ncol, nrows, width, height)
+
+
+def _mosaic_shape(mosaic) -> Tuple[int, int]:
+    """Top-level (rows, cols) of a subplot_mosaic spec (string or nested list)."""
+    if isinstance(mosaic, str):
+        lines = mosaic.split(";") if ";" in mosaic else mosaic.strip().splitlines()
+        rows = [line.strip() for line in lines if line.strip()]
+        return len(rows), len(rows[0])
+    return len(mosaic), len(mosaic[0])
 
 
 def _create_grid_figure(
@@ -92,13 +200,19 @@ def _create_grid_figure(
     layout: str = "tight",
     figsize: Optional[Tuple[float, float]] = None,
     tight_rect: Optional[Tuple[float, float, float, float]] = None,
+    mosaic: Any = None,
 ):
-    rows, cols = grid
+    rows, cols = _mosaic_shape(mosaic) if mosaic is not None else grid
     if figsize is None:
         fw = _FIG_WIDTHS.get(col_span, _FIG_WIDTHS[1])
         fh = (rows / cols) * base_height
         figsize = (fw, fh)
-    fig, axes = plt.subplots(nrows=rows, ncols=cols, layout=layout, figsize=figsize, sharex=sharex, sharey=sharey)
+    if mosaic is not None:
+        # only real cells become Axes; "." slots are left empty and never laid out
+        fig = plt.figure(layout=layout, figsize=figsize)
+        axes = fig.subplot_mosaic(mosaic, sharex=sharex, sharey=sharey, empty_sentinel=".")
+    else:
+        fig, axes = plt.subplots(nrows=rows, ncols=cols, layout=layout, figsize=figsize, sharex=sharex, sharey=sharey)
     if tight_rect is not None:
         try:
             fig.get_layout_engine().set(rect=tight_rect)  # type: ignore[attr-defined]
@@ -114,6 +228,9 @@ def _iterate_axes(axes) -> Iterable:
         if isinstance(axes, _np.ndarray):
             for ax in axes.flat:
                 yield ax
+        elif isinstance(axes, dict):  # subplot_mosaic: {cell key: Axes}
+            for ax in axes.values():
+                yield ax
         else:
             # could be list/tuple of axes (1-D) or single Axes
             if hasattr(axes, "__iter__") and not hasattr(axes, "plot"):
@@ -139,33 +256,252 @@ def _invoke_cell(fn: Callable, ax, r: int, c: int, idx: int, data):  # helper wi
         return fn(ax, r, c, idx)
 
 
-def _populate_grid(axes, plot_cell: Callable, *, titles: Optional[Sequence[str]] = None, data=None):
+def _grid_cells(axes) -> List[Tuple[Any, Any, int, int]]:
+    """(key, ax, row, col) for every real cell; keys are (r, c) for 2-D grids, mosaic labels for mosaics."""
+    if isinstance(axes, dict):
+        cells = []
+        for key, ax in axes.items():
+            spec = ax.get_subplotspec()
+            # position of the cell's top-left slot within its own (possibly nested) grid
+            cells.append((key, ax, spec.rowspan.start, spec.colspan.start))
+        return cells
     if hasattr(axes, "shape") and len(getattr(axes, "shape")) == 2:
         rows, cols = axes.shape
-        idx = 0
-        for r in range(rows):
-            for c in range(cols):
-                ax = axes[r, c]
-                _invoke_cell(plot_cell, ax, r, c, idx, data)
-                if titles and idx < len(titles):
-                    ax.set_title(titles[idx])
-                idx += 1
-    else:
-        idx = 0
-        for ax in _iterate_axes(axes):
-            _invoke_cell(plot_cell, ax, 0, idx, idx, data)
-            if titles and idx < len(titles):
-                ax.set_title(titles[idx])
-            idx += 1
+        return [((r, c), axes[r, c], r, c) for r in range(rows) for c in range(cols)]
+    return [(idx, ax, 0, idx) for idx, ax in enumerate(_iterate_axes(axes))]
+
+
+def _cell_title(titles, key, idx: int) -> Optional[str]:
+    if not titles:
+        return None
+    if isinstance(titles, dict):
+        return titles.get(key, titles.get(idx))
+    return titles[idx] if idx < len(titles) else None
+
 
+def _make_executor(executor, max_workers: Optional[int]):
+    """Return (executor, owned) for "thread" / "process" or a user-supplied concurrent.futures.Executor."""
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
-def _collect_line_handles_labels(axes):
+    if isinstance(executor, Executor):
+        return executor, False
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ppplt-cell"), True
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers), True
+    raise ValueError(f"executor must be 'thread', 'process' or an Executor, got {executor!r}")
+
+
+def _populate_grid(
+    axes,
+    plot_cell: Callable,
+    *,
+    titles=None,
+    data=None,
+    prepare_cell: Optional[Callable] = None,
+    executor: Any = "thread",
+    max_workers: Optional[int] = None,
+):
+    cells = _grid_cells(axes)
+    if prepare_cell is None:
+        for idx, (key, ax, r, c) in enumerate(cells):
+            _invoke_cell(plot_cell, ax, r, c, idx, data)
+            title = _cell_title(titles, key, idx)
+            if title is not None:
+                ax.set_title(title)
+        return
+    pool, owned = _make_executor(executor, max_workers)
+    futures: List[Any] = []
+    try:
+        futures += [pool.submit(prepare_cell, r, c, idx, data) for idx, (_, _, r, c) in enumerate(cells)]
+        # artists are created on this thread, in cell order, while later cells are still being prepared
+        for idx, ((key, ax, r, c), future) in enumerate(zip(cells, futures)):
+            plot_cell(ax, r, c, idx, future.result())
+            title = _cell_title(titles, key, idx)
+            if title is not None:
+                ax.set_title(title)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        if owned:
+            pool.shutdown(wait=True)
+
+
+class _CachedLocator(mticker.Locator):
+    """
+    Memoizing wrapper around a tick locator.
+
+    Ticks depend only on the view interval, the scale and the room for ticks, so they are keyed on exactly that.
+    Axes whose locators are configured identically share one `cache`, so a grid of cells with equal limits
+    computes its ticks once instead of once per cell and per layout pass.
+    """
+
+    _MAX_ENTRIES = 256
+
+    def __init__(self, base: mticker.Locator, cache: dict):
+        self.base = base
+        self.cache = cache
+
+    def set_axis(self, axis):
+        super().set_axis(axis)
+        self.base.set_axis(axis)
+
+    def __call__(self):
+        axis = self.axis
+        vmin, vmax = axis.get_view_interval()
+        key = (vmin, vmax, axis.get_scale(), axis.get_tick_space())
+        ticks = self.cache.get(key)
+        if ticks is None:
+            if len(self.cache) >= self._MAX_ENTRIES:
+                self.cache.clear()
+            ticks = self.cache[key] = np.asarray(self.base())
+        return ticks.copy()
+
+    def tick_values(self, vmin, vmax):
+        return self.base.tick_values(vmin, vmax)
+
+    def set_params(self, **kwargs):
+        # `ax.locator_params(...)`: reconfigure the wrapped locator and leave the shared cache, whose entries were
+        # computed with the old configuration (other axes keep using it)
+        self.base.set_params(**kwargs)
+        self.cache = {}
+
+    def nonsingular(self, v0, v1):
+        return self.base.nonsingular(v0, v1)
+
+    def view_limits(self, vmin, vmax):
+        return self.base.view_limits(vmin, vmax)
+
+
+def _locator_signature(name: str, locator) -> tuple:
+    params = {k: v for k, v in vars(locator).items() if k != "axis"}
+    return (name, type(locator), repr(sorted(params.items(), key=lambda kv: kv[0])))
+
+
+def _share_tick_locators(cells) -> None:
+    """Wrap every major locator in a _CachedLocator, with one cache per identically configured locator group."""
+    caches: dict = {}
+    seen = set()
+    for _, ax, _, _ in cells:
+        for name, axis in (("x", ax.xaxis), ("y", ax.yaxis)):
+            locator = axis.get_major_locator()
+            if isinstance(locator, _CachedLocator) or id(locator) in seen:
+                continue  # already wrapped, or a Ticker shared through sharex / sharey
+            seen.add(id(locator))
+            cache = caches.setdefault(_locator_signature(name, locator), {})
+            axis.set_major_locator(_CachedLocator(locator, cache))
+
+
+def _hide_inner_tick_labels(cells) -> None:
+    """Hide x tick labels above an aligned cell with the same x range, and y labels right of one with the same y."""
+    slots = []
+    for _, ax, _, _ in cells:
+        spec = ax.get_subplotspec()
+        if spec is None:
+            continue
+        slots.append((ax, spec.get_gridspec(), spec.rowspan, spec.colspan))
+    for ax, gs, rows, cols in slots:
+        for other, ogs, orows, ocols in slots:
+            if other is ax or ogs is not gs:
+                continue
+            if ocols == cols and orows.start == rows.stop and _same_range(ax, other, "x"):
+                ax.tick_params(axis="x", labelbottom=False)
+            if orows == rows and ocols.stop == cols.start and _same_range(ax, other, "y"):
+                ax.tick_params(axis="y", labelleft=False)
+
+
+def _same_range(a, b, name: str) -> bool:
+    if name == "x":
+        return a.get_xscale() == b.get_xscale() and np.allclose(a.get_xlim(), b.get_xlim())
+    return a.get_yscale() == b.get_yscale() and np.allclose(a.get_ylim(), b.get_ylim())
+
+
+def _style_key(handle) -> tuple:
+    """Hashable visual signature of a legend handle (what the legend swatch looks like)."""
+    from matplotlib import colors as mcolors
+    from matplotlib.collections import Collection
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+
+    if isinstance(handle, Line2D):
+        return (
+            "line",
+            mcolors.to_hex(handle.get_color(), keep_alpha=True),
+            handle.get_linestyle(),
+            handle.get_linewidth(),
+            str(handle.get_marker()),
+            handle.get_markersize(),
+        )
+    if isinstance(handle, Patch):
+        return (
+            "patch",
+            mcolors.to_hex(handle.get_facecolor(), keep_alpha=True),
+            mcolors.to_hex(handle.get_edgecolor(), keep_alpha=True),
+            handle.get_hatch(),
+        )
+    if isinstance(handle, Collection):
+        fc, ec = handle.get_facecolor(), handle.get_edgecolor()
+        return (
+            "collection",
+            mcolors.to_hex(fc[0], keep_alpha=True) if len(fc) else None,
+            mcolors.to_hex(ec[0], keep_alpha=True) if len(ec) else None,
+        )
+    return ("artist", id(handle))
+
+
+def _proxy_handle(handle):
+    """Data-free stand-in with the same legend appearance, so the legend does not keep large arrays alive."""
+    from matplotlib.collections import PathCollection
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch, Rectangle
+
+    if isinstance(handle, Line2D):
+        proxy = Line2D([], [])
+        proxy.update_from(handle)
+        return proxy
+    if isinstance(handle, Patch):
+        proxy = Rectangle((0, 0), 1, 1)
+        proxy.update_from(handle)
+        return proxy
+    if isinstance(handle, PathCollection):
+        fc, ec = handle.get_facecolor(), handle.get_edgecolor()
+        sizes = handle.get_sizes()
+        return Line2D(
+            [],
+            [],
+            linestyle="",
+            marker="o",
+            markerfacecolor=fc[0] if len(fc) else "none",
+            markeredgecolor=ec[0] if len(ec) else "none",
+            markersize=float(np.sqrt(sizes[0])) if len(sizes) else mpl.rcParams["lines.markersize"],
+        )
+    return handle  # containers etc. keep their own legend handler
+
+
+def collect_legend_entries(axes, *, dedup: Optional[str] = "label", proxies: bool = False):
+    """
+    Gather (handles, labels) from every axes in a grid.
+
+    dedup: "label" keeps the first handle per label, "style" keeps one handle per (label, appearance), None keeps
+    everything (the old behavior). Lookup is a dict index, so cost is linear in the number of artists.
+    proxies: replace Line2D / Patch / scatter handles with data-free copies of their style.
+    """
+    if dedup not in ("label", "style", None):
+        raise ValueError(f"dedup must be 'label', 'style' or None, got {dedup!r}")
+    index: dict = {}
     handles: List[Any] = []
     labels: List[str] = []
     for ax in _iterate_axes(axes):
-        h, l = ax.get_legend_handles_labels()
-        handles.extend(h)
-        labels.extend(l)
+        for h, l in zip(*ax.get_legend_handles_labels()):
+            if dedup is not None:
+                key = l if dedup == "label" else (l, _style_key(h))
+                if key in index:
+                    continue
+                index[key] = len(handles)
+            handles.append(_proxy_handle(h) if proxies else h)
+            labels.append(l)
     return handles, labels
 
 
@@ -175,43 +511,73 @@ def _apply_legend(fig, axes, cfg: LegendConfig):
     handles = list(cfg.handles) if cfg.handles is not None else None
     labels = list(cfg.labels) if cfg.labels is not None else None
     if handles is None or labels is None:
-        auto_h, auto_l = _collect_line_handles_labels(axes)
+        auto_h, auto_l = collect_legend_entries(axes, dedup=cfg.dedup, proxies=cfg.proxies)
         if handles is None:
             handles = auto_h
         if labels is None:
             labels = auto_l
     if not handles or not labels:
         return None
-    figure_size = fig.get_size_inches()
-    legend_col = cfg.ncol or max(1, int(round(figure_size[0] / cfg.lg_width)))
-    legend_row = math.ceil(len(labels) / legend_col)
-    updated_figure_size = (figure_size[0], legend_row * cfg.lg_height + figure_size[1])
-    border_ratio = cfg.lg_height * legend_row / updated_figure_size[1]
+    edge = cfg.edge or _LOC_EDGES.get(cfg.loc, "bottom")
+    horizontal = edge in ("top", "bottom")
+    width, height = fig.get_size_inches()
     border = list(cfg.border_layout)
-    if cfg.loc == "upper center":
-        border[3] -= border_ratio
-    elif cfg.loc == "lower center":
-        border[1] += border_ratio
+    available = width * (border[2] - border[0]) if horizontal else height * (border[3] - border[1])
+    layout = solve_legend_layout(labels, edge=edge, available=available, ncol=cfg.ncol, fontsize=cfg.fontsize)
+    fs = _legend_fontsize(cfg)
+    gap = mpl.rcParams["legend.borderaxespad"] * fs / 72.0  # inches between the figure edge and the legend
+    band = (layout.height if horizontal else layout.width) + 2 * gap
+    if horizontal and cfg.grow:
+        # keep the axes area: the figure grows by exactly the legend band
+        height += band
+        border[1] = border[1] * (height - band) / height
+        border[3] = 1 - (1 - border[3]) * (height - band) / height
+    if edge == "bottom":
+        border[1] += band / height
+        anchor = ((border[0] + border[2]) / 2, gap / height)
+    elif edge == "top":
+        border[3] -= band / height
+        anchor = ((border[0] + border[2]) / 2, 1 - gap / height)
+    elif edge == "left":
+        border[0] += band / width
+        anchor = (gap / width, (border[1] + border[3]) / 2)
+    else:
+        border[2] -= band / width
+        anchor = (1 - gap / width, (border[1] + border[3]) / 2)
     tight_params = {"pad": 0.1, "w_pad": 0.5, "h_pad": 0.5}
     if cfg.extra_tight:
         tight_params.update(cfg.extra_tight)
     tight_params["rect"] = border
     try:
-        fig.set_size_inches(updated_figure_size)
+        if horizontal and cfg.grow:
+            fig.set_size_inches((width, height))
         fig.get_layout_engine().set(**tight_params)  # type: ignore[attr-defined]
     except Exception:
         pass
+    if cfg.bbox_to_anchor is not None:
+        loc, anchor, borderaxespad = cfg.loc, cfg.bbox_to_anchor, None
+    else:
+        loc, borderaxespad = _EDGE_LOCS[edge], 0.0
     legend = fig.legend(
         handles,
         labels,
-        loc=cfg.loc,
-        bbox_to_anchor=cfg.bbox_to_anchor,
-        ncol=legend_col,
+        loc=loc,
+        bbox_to_anchor=anchor,
+        ncol=layout.ncol,
         frameon=cfg.frameon,
+        fontsize=fs,
+        borderaxespad=borderaxespad,
     )
     return legend
 
 
+def _legend_fontsize(cfg: LegendConfig) -> float:
+    from matplotlib.font_manager import FontProperties
+
+    size = cfg.fontsize if cfg.fontsize is not None else mpl.rcParams["legend.fontsize"]
+    return FontProperties(size=size).get_size_in_points()
+
+
 def draw_grid(
     plot_cell: Callable[[Any, int, int, int], Any],
     *,
@@ -221,20 +587,65 @@ def draw_grid(
     sharex: bool = False,
     sharey: bool = False,
     legend: Optional[LegendConfig] = None,
-    titles: Optional[Sequence[str]] = None,
+    titles: Optional[Sequence[str] | dict] = None,
     tight: bool = True,
     return_axes: bool = False,
     figsize: Optional[Tuple[float, float]] = None,
     data: Any = None,
+    mosaic: Any = None,
+    share_ticks: bool = False,
+    hide_inner_labels: bool = False,
+    prepare_cell: Optional[Callable[[int, int, int, Any], Any]] = None,
+    executor: Any = "thread",
+    max_workers: Optional[int] = None,
 ):
+    """
+    Draw a grid of subplots, calling `plot_cell(ax, r, c, idx[, data])` once per cell.
+
+    `mosaic` (a Figure.subplot_mosaic spec, "." for empty slots) replaces the rectangular `grid`: cells may span
+    several slots, specs may nest, and empty slots create no Axes. Axes are then returned as {key: Axes}, `r, c`
+    are the cell's top-left slot in its own grid, and `ax.get_label()` is the cell key. `titles` is a sequence
+    (by `idx`) or a dict keyed by cell key ((r, c) for rectangular grids, the mosaic label otherwise).
+
+    `share_ticks=True` memoizes tick locations per group of identically configured locators (same limits, scale and
+    size -> computed once); `ax.locator_params(...)` still works on a cell afterwards. `hide_inner_labels=True` hides tick labels of a cell whose neighbor below (x) / to the left (y)
+    spans the same slots with the same limits and scale.
+
+    `prepare_cell(r, c, idx, data)` moves the numerics out of `plot_cell`: it runs for all cells concurrently on
+    `executor` ("thread", "process" or any concurrent.futures.Executor, which is then not shut down), and its
+    result replaces `data` in `plot_cell(ax, r, c, idx, prepared)`. Matplotlib is only touched from the calling
+    thread. With "process", `prepare_cell` and `data` must be picklable (module-level function).
+    """
     from . import _require_phase, _Phase, logger
 
     _require_phase(_Phase.STYLE_SET, _Phase.DRAWN, _Phase.SAVED)
+    t_start = time.perf_counter()
     fig, axes = _create_grid_figure(
-        grid, col_span=col_span, base_height=base_height, sharex=sharex, sharey=sharey, figsize=figsize
+        grid,
+        col_span=col_span,
+        base_height=base_height,
+        sharex=sharex,
+        sharey=sharey,
+        figsize=figsize,
+        mosaic=mosaic,
     )
-    _populate_grid(axes, plot_cell, titles=titles, data=data)
-    if tight:
+    _populate_grid(
+        axes,
+        plot_cell,
+        titles=titles,
+        data=data,
+        prepare_cell=prepare_cell,
+        executor=executor,
+        max_workers=max_workers,
+    )
+    if share_ticks or hide_inner_labels:
+        cells = _grid_cells(axes)
+        if share_ticks:
+            _share_tick_locators(cells)
+        if hide_inner_labels:
+            _hide_inner_tick_labels(cells)
+    # with a legend the layout engine runs once at draw time with the solved rect; a pass here would be wasted
+    if tight and not legend:
         try:
             fig.tight_layout()
         except Exception:
@@ -244,7 +655,14 @@ def draw_grid(
     _core._last_fig = fig
     _core._last_axes = axes
     _core._phase = _Phase.DRAWN
-    logger.info("🖊️  Grid figure drawn")
+    logger.event(
+        "draw",
+        "🖊️  Grid figure drawn",
+        figure=fig.number,
+        axes=len(fig.axes),
+        grid=list(_mosaic_shape(mosaic) if mosaic is not None else grid),
+        duration_ms=(time.perf_counter() - t_start) * 1000.0,
+    )
     return (fig, axes) if return_axes else fig
 
 
@@ -258,4 +676,7 @@ __all__ = [
     "draw_grid",
     "draw_grid_step",
     "LegendConfig",
+    "LegendLayout",
+    "collect_legend_entries",
+    "solve_legend_layout",
 ]
@@ -0,0 +1,121 @@
+"""
+Per-process cache of font subsets for PDF / PS exports.
+
+Matplotlib re-reads and subsets every embedded TrueType font (Type 42) for each saved file; with the bundled CJK
+font this dominates export time of GB-style figures. This module wraps Matplotlib's subsetting hook so a subset is
+computed once per (font file, face, glyph set) and reused by every later figure that needs the same glyphs.
+
+API:
+- install() -> bool / uninstall(): Enable / disable the cache (idempotent; `ppplt.save` installs it). install()
+  returns False and leaves Matplotlib untouched when its subsetting hook has an unsupported contract.
+- supported() -> bool: Whether this Matplotlib has the subsetting hook the cache wraps.
+- clear(): Drop all cached subsets.
+- stats() -> dict: hits, misses, entries, bytes.
+
+Behavior:
+- Only the subsetting step is cached; Type 3 output (pdf.fonttype: 3) builds glyph procedures per file and is
+  unaffected. SVG either keeps text as text (svg.fonttype: none) or draws glyph paths, so it embeds no font.
+- The cache is an LRU bounded by `MAX_BYTES` of subset data.
+- The hook is private Matplotlib API; the cache only installs on versions whose `get_glyphs_subset` is a context
+  manager yielding `SubsetResults` (Matplotlib >= 3.10). Older versions export uncached.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from io import BytesIO
+
+MAX_BYTES = 64 * 1024 * 1024
+
+_lock = threading.Lock()
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "bytes": 0}
+_original = None
+
+
+def _key(fontfile, glyphs):
+    return (str(fontfile), getattr(fontfile, "face_index", 0), frozenset(glyphs))
+
+
+def _store(key, data, index_map):
+    with _lock:
+        _cache[key] = (data, index_map)
+        _stats["bytes"] += len(data)
+        while _stats["bytes"] > MAX_BYTES and len(_cache) > 1:
+            _, (old, _) = _cache.popitem(last=False)
+            _stats["bytes"] -= len(old)
+
+
+@contextmanager
+def _cached_glyphs_subset(fontfile, glyphs):
+    from fontTools.ttLib import TTFont
+    from matplotlib.backends import _backend_pdf_ps
+
+    glyphs = list(glyphs)
+    key = _key(fontfile, glyphs)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+        else:
+            _stats["misses"] += 1
+    if entry is None:
+        with _original(fontfile, glyphs) as result:
+            data = _backend_pdf_ps.font_as_file(result.font).getvalue()
+            index_map = dict(result.glyph_index_map or {})
+        _store(key, data, index_map)
+        entry = (data, index_map)
+
+    data, index_map = entry
+    # tables are parsed lazily and re-saved from their raw bytes, so this is cheap
+    font = TTFont(BytesIO(data))
+    try:
+        yield _backend_pdf_ps.SubsetResults(font, dict(index_map))
+    finally:
+        font.close()
+
+
+def supported() -> bool:
+    from matplotlib.backends import _backend_pdf_ps
+
+    return hasattr(_backend_pdf_ps, "get_glyphs_subset") and hasattr(_backend_pdf_ps, "SubsetResults")
+
+
+def install() -> bool:
+    global _original
+    from matplotlib.backends import _backend_pdf_ps
+
+    if not supported():
+        return False
+    with _lock:
+        if _original is None:
+            _original = _backend_pdf_ps.get_glyphs_subset
+            _backend_pdf_ps.get_glyphs_subset = _cached_glyphs_subset
+    return True
+
+
+def uninstall() -> None:
+    global _original
+    from matplotlib.backends import _backend_pdf_ps
+
+    with _lock:
+        if _original is not None:
+            _backend_pdf_ps.get_glyphs_subset = _original
+            _original = None
+
+
+def clear() -> None:
+    with _lock:
+        _cache.clear()
+        _stats.update(hits=0, misses=0, bytes=0)
+
+
+def stats() -> dict:
+    with _lock:
+        return dict(_stats, entries=len(_cache))
+
+
+__all__ = ["install", "uninstall", "supported", "clear", "stats", "MAX_BYTES"]
@@ -0,0 +1,279 @@
+"""
+Chunked, compressed frame store: one file per frame sequence with random access by frame index.
+
+API:
+- FrameWriter(path, *, fps=30.0, codec="auto", level=None, chunk_frames=16, append=False)
+    - append(frame) / extend(frames): Add frames (all with the shape / dtype of the first one).
+    - close(): Flush the last chunk and write the index (also via the context manager).
+- FrameStore(path)
+    - len(store), store[i], store[a:b:step] (stacked array), iter(store)
+    - fps, shape, dtype, codec, chunk_frames, duration
+    - retimed(fps) -> FrameView: Same duration at another frame rate, for re-encoding (frames dropped / repeated).
+    - close()
+- open_frames(path) -> FrameStore
+
+Layout:
+    b"PPFRAME1" | index offset (u64) | index length (u64) | chunk 0 | chunk 1 | ... | index (JSON)
+Each chunk holds up to `chunk_frames` consecutive raw frames compressed as one block; the index stores every
+chunk's offset, length and frame count plus shape / dtype / fps / codec. The header pointer is written last.
+
+Behavior:
+- Codecs: "zstd" (zstandard) and "lz4" (lz4.frame) when installed, else the standard library "zlib" / "lzma";
+  "none" stores raw bytes. "auto" picks zstd, then lz4, then zlib. Compression is lossless.
+- Reading memory-maps the file and decodes only the chunk holding the requested frame; the last decoded chunk is
+  cached, so sequential scrubbing decodes each chunk once.
+- `ppplt.animate.animate` accepts a FrameStore / FrameView (or a ".ppfs" path) and uses its fps by default.
+- append=True reopens an existing store (possibly empty) and writes new chunks and a new index after the old
+  index; only the final header update in close() switches readers over. Until then, including after a crash, the
+  file still opens as the previous store. A new writer that was never closed leaves no index; such a file cannot
+  be opened.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+MAGIC = b"PPFRAME1"
+_POINTER = struct.Struct("<QQ")
+_HEADER_SIZE = len(MAGIC) + _POINTER.size
+_VERSION = 1
+
+
+def _codec(name: str, level: Optional[int]):
+    """(name, compress, decompress) for a codec name ("auto" resolved)."""
+    if name == "auto":
+        for candidate in ("zstd", "lz4"):
+            try:
+                return _codec(candidate, level)
+            except ImportError:
+                continue
+        name = "zlib"
+    if name == "zstd":
+        import zstandard
+
+        cctx = zstandard.ZstdCompressor(level=3 if level is None else level)
+        dctx = zstandard.ZstdDecompressor()
+        return name, cctx.compress, dctx.decompress
+    if name == "lz4":
+        import lz4.frame
+
+        return name, lambda b: lz4.frame.compress(b, compression_level=level or 0), lz4.frame.decompress
+    if name == "zlib":
+        import zlib
+
+        return name, lambda b: zlib.compress(b, 1 if level is None else level), zlib.decompress
+    if name == "lzma":
+        import lzma
+
+        return name, lambda b: lzma.compress(b, preset=0 if level is None else level), lzma.decompress
+    if name == "none":
+        return name, bytes, bytes
+    raise ValueError(f"Unknown codec '{name}', expected auto / zstd / lz4 / zlib / lzma / none.")
+
+
+def _read_pointer(header) -> tuple:
+    if len(header) < _HEADER_SIZE or header[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a ppplt frame store.")
+    offset, length = _POINTER.unpack(header[len(MAGIC) : _HEADER_SIZE])
+    if length == 0:
+        raise ValueError("Frame store has no index (writer was not closed?).")
+    return offset, length
+
+
+def _read_index(buf) -> dict:
+    offset, length = _read_pointer(buf[:_HEADER_SIZE])
+    return json.loads(bytes(buf[offset : offset + length]).decode())
+
+
+class FrameWriter:
+    def __init__(
+        self,
+        path: str,
+        *,
+        fps: float = 30.0,
+        codec: str = "auto",
+        level: Optional[int] = None,
+        chunk_frames: int = 16,
+        append: bool = False,
+    ):
+        self.path = str(path)
+        self._pending: List[bytes] = []
+        self._chunks: List[List[int]] = []  # [offset, length, n_frames]
+        self.frames = 0
+        self.shape = None
+        self.dtype = None
+        if append and os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                # header and index only; the chunks may be gigabytes
+                offset, length = _read_pointer(f.read(_HEADER_SIZE))
+                f.seek(offset)
+                index = json.loads(f.read(length).decode())
+            codec, self.fps = index["codec"], index["fps"]
+            self.chunk_frames = index["chunk_frames"]
+            if index["frames"]:
+                self.shape, self.dtype = tuple(index["shape"]), np.dtype(index["dtype"])
+            self._chunks, self.frames = index["chunks"], index["frames"]
+            # the old index stays where it is (and valid) until close() repoints the header
+            self._file = open(self.path, "r+b")
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self.fps, self.chunk_frames = float(fps), int(chunk_frames)
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "wb")
+            self._file.write(MAGIC + _POINTER.pack(0, 0))
+        self.codec, self._compress, _ = _codec(codec, level)
+
+    def append(self, frame) -> None:
+        frame = np.asarray(frame)
+        if self.shape is None:
+            self.shape, self.dtype = frame.shape, frame.dtype
+        elif frame.shape != self.shape or frame.dtype != self.dtype:
+            raise ValueError(
+                f"Frame {self.frames} has shape {frame.shape} / {frame.dtype}, expected {self.shape} / {self.dtype}."
+            )
+        self._pending.append(np.ascontiguousarray(frame).tobytes())
+        self.frames += 1
+        if len(self._pending) == self.chunk_frames:
+            self._flush_chunk()
+
+    def extend(self, frames: Iterable) -> None:
+        for frame in frames:
+            self.append(frame)
+
+    def _flush_chunk(self) -> None:
+        if not self._pending:
+            return
+        data = self._compress(b"".join(self._pending))
+        self._chunks.append([self._file.tell(), len(data), len(self._pending)])
+        self._file.write(data)
+        self._pending.clear()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush_chunk()
+        index = {
+            "version": _VERSION,
+            "codec": self.codec,
+            "fps": self.fps,
+            "chunk_frames": self.chunk_frames,
+            "shape": list(self.shape) if self.shape is not None else None,
+            "dtype": np.dtype(self.dtype).str if self.dtype is not None else None,
+            "frames": self.frames,
+            "chunks": self._chunks,
+        }
+        payload = json.dumps(index, separators=(",", ":")).encode()
+        offset = self._file.tell()
+        self._file.write(payload)
+        # chunks and index must be on disk before the header points at them
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.seek(len(MAGIC))
+        self._file.write(_POINTER.pack(offset, len(payload)))
+        self._file.close()
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class FrameStore:
+    def __init__(self, path: str):
+        self.path = str(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        index = _read_index(self._map)
+        self.codec, _, self._decompress = _codec(index["codec"], None)
+        self.fps = index["fps"]
+        self.chunk_frames = index["chunk_frames"]
+        self.shape = tuple(index["shape"]) if index["shape"] is not None else None
+        self.dtype = np.dtype(index["dtype"]) if index["dtype"] is not None else None
+        self._chunks = index["chunks"]
+        self._frames = index["frames"]
+        # first frame of every chunk; chunks may be short after an append to a partially filled store
+        self._starts = np.cumsum([0] + [c[2] for c in self._chunks])
+        self._cached = (-1, None)
+
+    def __len__(self) -> int:
+        return self._frames
+
+    def _chunk(self, k: int) -> np.ndarray:
+        cached = self._cached  # one read: concurrent readers (parallel encoders) may swap the cache
+        if cached[0] != k:
+            offset, length, n = self._chunks[k]
+            raw = self._decompress(self._map[offset : offset + length])
+            cached = (k, np.frombuffer(raw, dtype=self.dtype).reshape((n, *self.shape)))
+            self._cached = cached
+        return cached[1]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return np.stack([self[j] for j in range(*i.indices(len(self)))])
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"Frame {i} out of range (0..{len(self) - 1}).")
+        k = int(np.searchsorted(self._starts, i, side="right")) - 1
+        return self._chunk(k)[i - self._starts[k]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def duration(self) -> float:
+        return len(self) / self.fps
+
+    def retimed(self, fps: float) -> "FrameView":
+        """Same duration at another frame rate: frames are dropped / repeated (nearest earlier frame)."""
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}.")
+        n = max(1, int(round(self.duration * fps)))
+        indices = np.minimum((np.arange(n) * self.fps / fps).astype(np.int64), len(self) - 1)
+        return FrameView(self, indices, float(fps))
+
+    def close(self) -> None:
+        self._cached = (-1, None)
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "FrameStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class FrameView:
+    """Frames of a store picked by index, with their own fps (see FrameStore.retimed)."""
+
+    def __init__(self, store: FrameStore, indices, fps: float):
+        self.store, self.indices, self.fps = store, np.asarray(indices), fps
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return np.stack([self.store[j] for j in self.indices[i]])
+        return self.store[self.indices[i]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for j in self.indices:
+            yield self.store[j]
+
+
+def open_frames(path: str) -> FrameStore:
+    return FrameStore(path)
+
+
+__all__ = ["FrameWriter", "FrameStore", "FrameView", "open_frames"]
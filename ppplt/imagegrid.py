@@ -0,0 +1,161 @@
+"""
+Image grids as one composite raster (thumbnail sheets, model sample grids).
+
+API:
+- compose_image_grid(images, *, ncols=None, pad=2, pad_value=255, labels=None, label_color=None) -> np.ndarray
+    Tile images into one preallocated canvas, no Matplotlib involved; the result can go straight to
+    `ppplt.animate.save_img_arr`.
+- draw_image_grid(images, *, ncols=None, pad=2, pad_value=255, labels=None, col_span=1, figsize=None,
+                  interpolation="nearest", return_axes=False) -> Figure
+    Show the composite as a single image artist in one axes (pipeline phase DRAWN, like `draw`).
+- draw_image_grid_step(...): Pipeline step.
+
+Behavior:
+- `images` is an (N, H, W[, C]) array or an iterable (a generator works) of (H, W[, C]) arrays, read once. Tiles
+  smaller than the largest one are centered in their slot; grayscale tiles are broadcast when other tiles have color
+  channels.
+- A uniform (N, H, W, C) stack is placed with a single strided copy; sequences are copied tile by tile.
+- `ncols` defaults to ceil(sqrt(N)); unused slots keep `pad_value`.
+- compose_image_grid burns `labels` into the raster (PIL default font); draw_image_grid draws them as text
+  artists so they stay vector in PDF / SVG output.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+import ppplt as _core
+from .pipeline import Step
+
+
+def _as_tiles(images) -> Tuple[Any, int, int, int, int]:
+    """(tiles, n, tile_h, tile_w, channels); channels is 0 for grayscale-only input."""
+    if isinstance(images, np.ndarray) and images.ndim in (3, 4):
+        n, h, w = images.shape[:3]
+        return images, n, h, w, images.shape[3] if images.ndim == 4 else 0
+    tiles = [np.asarray(img) for img in images]
+    if not tiles:
+        raise ValueError("No image to compose.")
+    h = max(t.shape[0] for t in tiles)
+    w = max(t.shape[1] for t in tiles)
+    channels = max((t.shape[2] for t in tiles if t.ndim == 3), default=0)
+    return tiles, len(tiles), h, w, channels
+
+
+def _layout(n: int, ncols: Optional[int], h: int, w: int, pad: int):
+    ncols = max(1, min(ncols or math.ceil(math.sqrt(n)), n))
+    nrows = math.ceil(n / ncols)
+    return nrows, ncols, nrows * (h + pad) + pad, ncols * (w + pad) + pad
+
+
+def tile_origins(n: int, tile_shape: Tuple[int, int], *, ncols: Optional[int] = None, pad: int = 2):
+    """Top-left (y, x) pixel of every tile slot in the composite."""
+    h, w = tile_shape
+    _, ncols, _, _ = _layout(n, ncols, h, w, pad)
+    idx = np.arange(n)
+    return np.stack([pad + (idx // ncols) * (h + pad), pad + (idx % ncols) * (w + pad)], axis=1)
+
+
+def compose_image_grid(
+    images,
+    *,
+    ncols: Optional[int] = None,
+    pad: int = 2,
+    pad_value=255,
+    labels: Optional[Sequence[str]] = None,
+    label_color=None,
+) -> np.ndarray:
+    tiles, n, h, w, channels = _as_tiles(images)
+    nrows, ncols, height, width = _layout(n, ncols, h, w, pad)
+    dtype = tiles.dtype if isinstance(tiles, np.ndarray) else np.result_type(*[t.dtype for t in tiles])
+    shape = (height, width, channels) if channels else (height, width)
+    canvas = np.full(shape, pad_value, dtype=dtype)
+
+    if isinstance(tiles, np.ndarray) and n == nrows * ncols:
+        # every slot is filled: write all tiles through one strided view of the canvas
+        view = canvas[pad:, pad:].reshape(nrows, h + pad, ncols, w + pad, *shape[2:])
+        view[:, :h, :, :w] = tiles.reshape(nrows, ncols, h, w, *shape[2:]).swapaxes(1, 2)
+    else:
+        for (y, x), tile in zip(tile_origins(n, (h, w), ncols=ncols, pad=pad), tiles):
+            th, tw = tile.shape[:2]
+            y, x = y + (h - th) // 2, x + (w - tw) // 2
+            if channels and tile.ndim == 2:
+                tile = tile[..., None]
+            canvas[y : y + th, x : x + tw] = tile
+
+    if labels:
+        canvas = _burn_labels(canvas, labels, tile_origins(n, (h, w), ncols=ncols, pad=pad), label_color)
+    return canvas
+
+
+def _burn_labels(canvas: np.ndarray, labels, origins, color) -> np.ndarray:
+    from PIL import Image, ImageDraw
+
+    if canvas.dtype != np.uint8:
+        raise ValueError("Raster labels need a uint8 canvas; use draw_image_grid for vector labels.")
+    img = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(img)
+    fill = color if color is not None else (255 if canvas.ndim == 2 else (255,) * canvas.shape[2])
+    for (y, x), label in zip(origins, labels):
+        if label:
+            draw.text((int(x) + 2, int(y) + 1), str(label), fill=fill)
+    return np.asarray(img)
+
+
+def draw_image_grid(
+    images,
+    *,
+    ncols: Optional[int] = None,
+    pad: int = 2,
+    pad_value=255,
+    labels: Optional[Sequence[str]] = None,
+    col_span: int = 1,
+    figsize: Optional[Tuple[float, float]] = None,
+    interpolation: str = "nearest",
+    cmap: Optional[str] = "gray",
+    fontsize: Optional[float] = None,
+    return_axes: bool = False,
+):
+    import matplotlib.pyplot as plt
+    from . import _require_phase, _Phase, logger
+    from .draw import _FIG_WIDTHS
+
+    _require_phase(_Phase.STYLE_SET, _Phase.DRAWN, _Phase.SAVED)
+    t_start = time.perf_counter()
+    tiles, n, h, w, _ = _as_tiles(images)  # once: `images` may be a one-shot iterable
+    canvas = compose_image_grid(tiles, ncols=ncols, pad=pad, pad_value=pad_value)
+    height, width = canvas.shape[:2]
+    if figsize is None:
+        fw = _FIG_WIDTHS.get(col_span, _FIG_WIDTHS[1])
+        figsize = (fw, fw * height / width)
+    fig = plt.figure(figsize=figsize)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.imshow(canvas, cmap=cmap if canvas.ndim == 2 else None, interpolation=interpolation)
+    ax.set_axis_off()
+    if labels:
+        for (y, x), label in zip(tile_origins(n, (h, w), ncols=ncols, pad=pad), labels):
+            if label:
+                ax.text(x + 1, y + 1, str(label), va="top", ha="left", fontsize=fontsize, color="white")
+    _core._last_fig = fig
+    _core._last_axes = ax
+    _core._phase = _Phase.DRAWN
+    logger.event(
+        "draw",
+        "🖊️  Image grid drawn",
+        figure=fig.number,
+        axes=1,
+        tiles=n,
+        duration_ms=(time.perf_counter() - t_start) * 1000.0,
+    )
+    return (fig, ax) if return_axes else fig
+
+
+def draw_image_grid_step(*args, **kwargs):
+    return Step(draw_image_grid, *args, **kwargs)
+
+
+__all__ = ["compose_image_grid", "draw_image_grid", "draw_image_grid_step", "tile_origins"]
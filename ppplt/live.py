@@ -0,0 +1,283 @@
+"""
+Live figures: keep a drawn figure alive and stream new points into it.
+
+API:
+- RingBuffer(capacity=None, dtype=float): Append-only numpy buffer; bounded (oldest points dropped) or growing.
+- LiveFigure(fig=None, *, save_path=None, formats=None, save_interval=5.0, background=False, margin=0.05,
+             **savefig_kwargs)
+    - line(ax, *, capacity=None, **plot_kwargs) -> LiveLine: New line artist fed from a ring buffer; `ax` is an
+      Axes or an index into `fig.axes`.
+    - attach(line, *, capacity=None) -> LiveLine: Stream into an existing Line2D (e.g. created in `plot_cell`).
+    - LiveLine.append(x, y): Append one point or arrays of points.
+    - update(): Push buffered points to the artists, update limits and re-save if `save_interval` has elapsed.
+    - save(): Push and re-save immediately.
+    - close(): Stop the background saver and write a final save.
+- live(fig=None, **kwargs) -> LiveFigure: Same as LiveFigure(...), defaulting to the last drawn figure.
+
+Behavior:
+- `append` only writes into the buffers (O(new points)); artists are touched when the figure is pushed.
+- Axes limits follow the live lines. Data limits are kept per line and widened from each new chunk; a full rescan
+  of one line only happens when an evicted point was one of its extremes (bounded buffers).
+- Saves are throttled to one per `save_interval` seconds. With `background=True` a daemon thread pushes and saves,
+  so the training loop only pays for `append`; create lines before the first save.
+- Files are written to a temporary name and renamed, so readers never see a partial image.
+"""
+
+from __future__ import annotations
+
+import os
+import logging as _logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+import ppplt as _core
+
+
+class RingBuffer:
+    def __init__(self, capacity: Optional[int] = None, dtype=float):
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.total = 0  # points ever appended
+        # bounded: every point is stored twice (i and i + capacity) so the window is always one contiguous slice
+        self._data = np.empty(2 * capacity if capacity else 1024, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.total if self.capacity is None else min(self.total, self.capacity)
+
+    def extend(self, values) -> np.ndarray:
+        """Append `values` and return the points evicted to make room for them."""
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        k = values.size
+        if self.capacity is None:
+            if self.total + k > self._data.size:
+                grown = np.empty(max(2 * self._data.size, self.total + k), dtype=self._data.dtype)
+                grown[: self.total] = self._data[: self.total]
+                self._data = grown
+            self._data[self.total : self.total + k] = values
+            self.total += k
+            return values[:0]
+        cap = self.capacity
+        n_old = len(self)
+        n_evicted = max(0, n_old + k - cap)
+        evicted = self.view()[: min(n_evicted, n_old)].copy()
+        if k > cap:
+            evicted = np.concatenate([evicted, values[: k - cap]])
+            self.total += k - cap
+            values = values[k - cap :]
+            k = cap
+        idx = (self.total + np.arange(k)) % cap
+        self._data[idx] = values
+        self._data[idx + cap] = values
+        self.total += k
+        return evicted
+
+    def view(self) -> np.ndarray:
+        """Current contents, oldest first (a view, valid until the next `extend`)."""
+        if self.capacity is None:
+            return self._data[: self.total]
+        end = self.total % self.capacity + self.capacity
+        return self._data[end - len(self) : end]
+
+
+class LiveLine:
+    def __init__(self, owner: "LiveFigure", artist, capacity: Optional[int]):
+        self._owner = owner
+        self.artist = artist
+        self.x = RingBuffer(capacity)
+        self.y = RingBuffer(capacity)
+        self._lim = np.array([np.inf, -np.inf, np.inf, -np.inf])  # xmin, xmax, ymin, ymax
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.y)
+
+    def append(self, x, y) -> None:
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        if x.shape != y.shape:
+            raise ValueError(f"x and y must have the same shape, got {x.shape} and {y.shape}")
+        with self._owner._lock:
+            ex, ey = self.x.extend(x), self.y.extend(y)
+            lim = self._lim
+            if _touches(ex, lim[0], lim[1]) or _touches(ey, lim[2], lim[3]):
+                lim[:] = _extent(self.x.view(), self.y.view())
+            else:
+                lim[:] = _merge(lim, _extent(x, y))
+            self._dirty = True
+
+    def _push(self) -> bool:
+        if not self._dirty:
+            return False
+        self.artist.set_data(self.x.view(), self.y.view())
+        self._dirty = False
+        return True
+
+
+def _extent(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        if x.size == 0:
+            return np.array([np.inf, -np.inf, np.inf, -np.inf])
+        return np.array([np.nanmin(x), np.nanmax(x), np.nanmin(y), np.nanmax(y)])
+
+
+def _merge(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.array([min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3])])
+
+
+def _touches(evicted: np.ndarray, lo: float, hi: float) -> bool:
+    return evicted.size > 0 and bool(np.any((evicted <= lo) | (evicted >= hi)))
+
+
+class LiveFigure:
+    def __init__(
+        self,
+        fig=None,
+        *,
+        save_path: Optional[str] = None,
+        formats: Optional[Sequence[str]] = None,
+        save_interval: float = 5.0,
+        background: bool = False,
+        margin: float = 0.05,
+        **savefig_kwargs: Any,
+    ):
+        if fig is None:
+            from . import _require_phase, _Phase
+
+            _require_phase(_Phase.DRAWN, _Phase.SAVED)
+            fig = _core._last_fig
+            if fig is None:
+                raise _core.PaperPlotException("当前没有可更新的图形 (last_fig is None)")
+        self.fig = fig
+        self.margin = margin
+        self.save_interval = save_interval
+        self.savefig_kwargs = savefig_kwargs
+        self.save_paths: List[str] = []
+        if save_path is not None:
+            base, ext = os.path.splitext(save_path)
+            if formats is None and not ext:
+                raise _core.PaperPlotException("未提供格式且路径无扩展名")
+            self.save_paths = [save_path] if formats is None else [f"{base}.{f.lstrip('.')}" for f in formats]
+        self.lines: List[LiveLine] = []
+        self.saves = 0
+        self._lock = threading.RLock()  # buffers and artists
+        self._save_lock = threading.Lock()  # rendering
+        self._last_save = time.perf_counter()
+        self._dirty_since_save = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if background and self.save_paths:
+            self._thread = threading.Thread(target=self._run, name="ppplt-live", daemon=True)
+            self._thread.start()
+
+    def _axes(self, ax):
+        return self.fig.axes[ax] if isinstance(ax, int) else ax
+
+    def line(self, ax=0, *, capacity: Optional[int] = None, **plot_kwargs: Any) -> LiveLine:
+        (artist,) = self._axes(ax).plot([], [], **plot_kwargs)
+        return self.attach(artist, capacity=capacity)
+
+    def attach(self, line, *, capacity: Optional[int] = None) -> LiveLine:
+        live = LiveLine(self, line, capacity)
+        x, y = line.get_data()
+        if len(x):
+            live.append(x, y)
+        with self._lock:
+            self.lines.append(live)
+        return live
+
+    def push(self) -> bool:
+        """Copy buffered points into the artists and refresh the limits of every touched axes."""
+        with self._lock:
+            touched = {live.artist.axes for live in self.lines if live._push()}
+            if not touched:
+                return False
+            limits: Dict[Any, np.ndarray] = {}
+            for live in self.lines:
+                ax = live.artist.axes
+                if ax in touched and len(live):
+                    limits[ax] = _merge(limits[ax], live._lim) if ax in limits else live._lim
+            for ax, lim in limits.items():
+                if np.all(np.isfinite(lim)):
+                    ax.set_xlim(*_pad(lim[0], lim[1], self.margin))
+                    ax.set_ylim(*_pad(lim[2], lim[3], self.margin))
+            self._dirty_since_save = True
+            return True
+
+    def update(self) -> bool:
+        """Push pending points; re-save when `save_interval` has elapsed. Returns True if a save happened."""
+        if self._thread is not None:
+            return False  # the background thread owns pushing and saving
+        self.push()  # cheap (only dirty lines); only the save is throttled
+        if time.perf_counter() - self._last_save < self.save_interval:
+            return False
+        return self.save()
+
+    def save(self) -> bool:
+        with self._save_lock:
+            # set_data copies the buffers, so appends may continue while the figure is rendered
+            self.push()
+            with self._lock:
+                if not self.save_paths or not self._dirty_since_save:
+                    return False
+                self._dirty_since_save = False
+            t_start = time.perf_counter()
+            for path in self.save_paths:
+                base, ext = os.path.splitext(path)
+                tmp = f"{base}.tmp{ext}"
+                self.fig.savefig(tmp, format=ext.lstrip(".") or None, **self.savefig_kwargs)
+                os.replace(tmp, path)
+            self._last_save = time.perf_counter()
+            self.saves += 1
+        logger = getattr(_core, "logger", None)  # live figures also work without ppplt.init()
+        if logger is None:
+            return True
+        logger.event(
+            "live_save",
+            f"💾 Live figure saved: {', '.join(self.save_paths)}",
+            level=_logging.DEBUG,
+            figure=getattr(self.fig, "number", None),
+            paths=self.save_paths,
+            points=[len(l) for l in self.lines],
+            duration_ms=(self._last_save - t_start) * 1000.0,
+        )
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.save_interval):
+            try:
+                self.save()
+            except Exception as e:  # keep the training loop alive
+                logger = getattr(_core, "logger", None)
+                if logger is not None:
+                    logger.warning(f"Live figure save failed: {e}")
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.save()
+
+    def __enter__(self) -> "LiveFigure":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _pad(lo: float, hi: float, margin: float):
+    span = hi - lo
+    if span == 0:
+        span = abs(lo) or 1.0
+    return lo - span * margin, hi + span * margin
+
+
+def live(fig=None, **kwargs: Any) -> LiveFigure:
+    return LiveFigure(fig, **kwargs)
+
+
+__all__ = ["RingBuffer", "LiveLine", "LiveFigure", "live"]
@@ -7,12 +7,19 @@ Functions:
 
 Classes:
 - TimeElapser: Context manager-like helper (used via logger.timer) to show live elapsed time updates.
+  All elapsers share one ticker thread, which only runs while an elapser is active on an interactive stream.
 - PaperPlotFormatter(logging.Formatter): Color + time formatting, inline emphasis markers (~<text>~ variants).
+- AsyncStreamHandler(logging.Handler): Enqueue-only handler; a worker thread formats and writes records in batches.
+- JsonLogHandler(logging.Handler): Structured sink writing one JSON object per record (JSON lines).
 - Logger: Facade wrapping Python logging with ANSI styling, timer integration, and raw writes.
 
 Logger Methods (selected):
 - debug/info/warning/error/critical(msg): Standard level logging with styling.
 - raw(message: str): Write raw (optionally styled) text without level/time prefix.
+- event(name, message=None, level=INFO, **fields): Log a message carrying machine-readable fields (paths, durations...).
+- add_json_sink(target): Attach a JsonLogHandler writing to a path, "-" (stdout) or an open stream.
+- flush() / close(): Drain pending (async) output / detach the handlers.
+- set_palette(palette): Switch to another precomputed ppplt.style.Palette.
 - timer(msg, refresh_rate=10, end_msg=""): Start a TimeElapser for live progress time display.
 - lock_timer(): Internal context manager coordinating timer vs. normal log output.
 
@@ -20,88 +27,153 @@ Styling Markers:
 - Replace sequences: ~< ... >~, ~~< ... >~~, etc. to apply color + emphasis (bold / italic / underline) layers.
 
 Behavior:
-- TimeElapser periodically rewrites same line until completion, then prints a success mark.
+- TimeElapser periodically rewrites same line until completion, then prints a success mark. On non-TTY streams or
+  with the `dumb` theme nothing is redrawn; a single completion line with the elapsed time is logged instead.
 - Formatter shortens level names to single letters, aligns with minimal console footprint.
+- Per-level formatters are built once; markup is expanded in a single regex pass.
+- With async=True the calling thread only enqueues; output order (records and raw writes) is preserved.
 """
 
+import re
 import sys
+import json
 import time
+import queue
 import logging
 import threading
 import numpy as np
 from contextlib import contextmanager
 
-from ppplt.style import colors, formats
+from ppplt import style
 
 
 def get_clock(t, speed=10):
     return "🕐🕑🕒🕓🕔🕕🕖🕗🕘🕙🕚🕛"[int(t * speed) % 12]
 
 
+class _Ticker:
+    """
+    Single background thread shared by all live TimeElapsers.
+
+    Only the innermost (most recently entered) elapser is redrawn; the thread is started on demand and exits as
+    soon as no elapser is registered.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._elapsers = []
+        self._thread = None
+
+    def add(self, elapser):
+        with self._cond:
+            self._elapsers.append(elapser)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ppplt-timer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def remove(self, elapser):
+        with self._cond:
+            if elapser in self._elapsers:
+                self._elapsers.remove(elapser)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._elapsers:
+                    self._thread = None
+                    return
+                top = self._elapsers[-1]
+            top.redraw()
+            with self._cond:
+                if self._elapsers and self._elapsers[-1] is top:
+                    self._cond.wait(top.dt)
+
+
+_ticker = _Ticker()
+
+
 class TimeElapser:
     """
-    A tool that can be called with `with` statement, and starts a separate thread that continuously outputs logger message with elasped time.
+    A tool that can be called with `with` statement, and keeps the last logger message updated with the elapsed time.
+
+    Redraws are driven by one shared ticker thread and only happen on an interactive (TTY, non-`dumb`) stream;
+    otherwise a single completion line with the total time is logged on exit.
     """
 
     def __init__(self, logger, refresh_rate, end_msg):
         self.logger = logger
         self.dt = 1.0 / refresh_rate
-        self.n = np.ceil(np.log10(refresh_rate)).astype(int)
-        self._stop = threading.Event()
+        self.n = max(int(np.ceil(np.log10(refresh_rate))), 0)
+        self.end_msg = end_msg
+        self.t_start = None
+        self._active = False
+        self._drawn_at = None
 
         self.last_logger_output = self.logger.last_output
-        # re-print the logger message without the reset character
-        self.start_msg = self.last_logger_output[:-4]
-        # adding back the reset character
-        self.end_msg = end_msg + self.last_logger_output[-4:] + "\n"
+        reset = logger._formatter.palette.RESET
+        # re-print the logger message without the reset character, which is added back at the end
+        if reset and self.last_logger_output.endswith(reset):
+            self.start_msg = self.last_logger_output[: -len(reset)]
+        else:
+            self.start_msg = self.last_logger_output
+        self.reset = reset
+        self.interactive = logger.is_interactive
+
+    @property
+    def elapsed(self):
+        return 0.0 if self.t_start is None else time.perf_counter() - self.t_start
 
     def __enter__(self):
-        self.thread = threading.Thread(target=self.run)
-        self.thread.start()
+        self.t_start = time.perf_counter()
+        # the line to rewrite is the one logged right before entering
+        self._line = self.logger._line_count - 1
+        if self.interactive:
+            with self.logger.lock_timer():
+                self._active = True
+                self.logger._active_timers += 1
+            _ticker.add(self)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self._stop.set()
-        self.thread.join()
+        if not self.interactive:
+            end = f"{self.end_msg} " if self.end_msg else ""
+            self.logger.info(f"✅ {end}~<{self.elapsed:.{self.n}f}s>~")
+            return
+        _ticker.remove(self)
+        with self.logger.lock_timer():
+            self._active = False
+            self.logger._active_timers -= 1
+            self._draw(f"✅ {self.end_msg}{self.reset}\n")
+
+    def redraw(self):
+        with self.logger.lock_timer():
+            if self._active:
+                self._draw(f"{get_clock(self.elapsed)} ")
+
+    def _draw(self, suffix):
+        # must be called with the timer lock held
+        logger = self.logger
+        if self._drawn_at is None and logger._line_count - 1 == self._line and logger._is_new_line:
+            # first draw: move back onto the line we are timing
+            prefix = "\x1b[1F"
+        elif logger._is_new_line:
+            # something else was printed since; restart on a fresh line
+            prefix = ""
+        else:
+            prefix = "\r"
+        logger.raw(f"{prefix}{self.start_msg} ~<{self.elapsed:.{self.n}f}s>~ {suffix}")
+        self._drawn_at = logger._line_count
 
-    def __enter__(self):
-        pass
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        pass
-
-    def run(self):
-        # re-print logger msg from the beginning of the previous line
-        self.logger.raw("\x1b[1F" + self.start_msg + " ")
-        t_start = time.perf_counter()
-        t_elapsed = time.perf_counter() - t_start
-        self.logger.raw(f"~<{t_elapsed:.{self.n}f}s>~ {get_clock(t_elapsed)} ")
-        prev_width = len(f"{t_elapsed:.{self.n}f}s ") + 3
-        while not self._stop.is_set():
-            time.sleep(self.dt)
-            with self.logger.lock_timer():
-                t_elapsed = time.perf_counter() - t_start
-                # check if something in the main thread has moved the cursor to a new line
-                if self.logger._is_new_line:
-                    self.logger.raw(self.start_msg + " ")
-                else:
-                    self.logger.raw("\b" * prev_width)
-                self.logger.raw(f"~<{t_elapsed:.{self.n}f}s>~ {get_clock(t_elapsed)} ")
-                prev_width = len(f"{t_elapsed:.{self.n}f}s ") + 3
-        self.logger.raw("\b\b\b✅ " + self.end_msg)
+_MARKUP = re.compile(r"~{1,4}<|>~{1,4}")
 
 
 class PaperPlotFormatter(logging.Formatter):
-    def __init__(self, log_time=True, verbose_time=True):
+    def __init__(self, log_time=True, verbose_time=True, palette=None):
         super(PaperPlotFormatter, self).__init__()
 
-        self.mapping = {
-            logging.DEBUG: colors.GREEN,
-            logging.INFO: colors.BLUE,
-            logging.WARNING: colors.YELLOW,
-            logging.ERROR: colors.RED,
-            logging.CRITICAL: colors.RED,
-        }
         self.log_time = log_time
         if verbose_time:
             self.TIME = "%(asctime)s.%(msecs)03d"
@@ -123,51 +195,245 @@ class PaperPlotFormatter(logging.Formatter):
         self.last_output = ""
         self.last_color = ""
 
-    def colored_fmt(self, color):
-        self.last_color = color
-        if self.log_time:
-            return f"{color}[Pplt] [{self.TIME}] [{self.LEVEL}] {self.MESSAGE}{formats.RESET}"
-        return f"{color}[Pplt] [{self.LEVEL}] {self.MESSAGE}{formats.RESET}"
+        self.set_palette(style.palette if palette is None else palette)
 
-    def extra_fmt(self, msg):
-        msg = msg.replace("~~~~<", colors.MINT + formats.BOLD + formats.ITALIC)
-        msg = msg.replace("~~~<", colors.MINT + formats.ITALIC)
-        msg = msg.replace("~~<", colors.MINT + formats.UNDERLINE)
-        msg = msg.replace("~<", colors.MINT)
+    def set_palette(self, palette):
+        mapping = {
+            logging.DEBUG: palette.GREEN,
+            logging.INFO: palette.BLUE,
+            logging.WARNING: palette.YELLOW,
+            logging.ERROR: palette.RED,
+            logging.CRITICAL: palette.RED,
+        }
+        markup_open = {
+            "~~~~<": palette.MINT + palette.BOLD + palette.ITALIC,
+            "~~~<": palette.MINT + palette.ITALIC,
+            "~~<": palette.MINT + palette.UNDERLINE,
+            "~<": palette.MINT,
+        }
+        # (palette, level colors, markup openers, per-level formatters built on first use), swapped as one
+        # reference so a concurrent `format` never mixes two themes
+        self._tables = (palette, mapping, markup_open, {})
 
-        msg = msg.replace(">~~~~", formats.RESET + self.last_color)
-        msg = msg.replace(">~~~", formats.RESET + self.last_color)
-        msg = msg.replace(">~~", formats.RESET + self.last_color)
-        msg = msg.replace(">~", formats.RESET + self.last_color)
+    @property
+    def palette(self):
+        return self._tables[0]
 
-        return msg
+    @property
+    def mapping(self):
+        return self._tables[1]
+
+    def colored_fmt(self, color, level=None, reset=None):
+        self.last_color = color
+        level = self.LEVEL if level is None else level
+        reset = self.palette.RESET if reset is None else reset
+        if self.log_time:
+            return f"{color}[Pplt] [{self.TIME}] [{level}] {self.MESSAGE}{reset}"
+        return f"{color}[Pplt] [{level}] {self.MESSAGE}{reset}"
+
+    def _formatter_for(self, tables, levelno, levelname):
+        formatters = tables[3]
+        formatter = formatters.get(levelno)
+        if formatter is None:
+            # bake the single-letter level into the format so the shared record is never mutated
+            color = tables[1].get(levelno, "")
+            fmt = self.colored_fmt(color, levelname[:1], tables[0].RESET)
+            formatter = logging.Formatter(fmt, datefmt=self.DATE_FORMAT)
+            formatters[levelno] = formatter
+        return formatter
+
+    def extra_fmt(self, msg, tables=None):
+        if "~" not in msg:
+            return msg
+        palette, _, opening, _ = self._tables if tables is None else tables
+        closing = palette.RESET + self.last_color
+        return _MARKUP.sub(lambda m: opening.get(m.group(0), closing), msg)
 
     def format(self, record):
-        log_fmt = self.colored_fmt(self.mapping.get(record.levelno))
-        record.levelname = record.levelname[0]
-        formatter = logging.Formatter(log_fmt, datefmt=self.DATE_FORMAT)
-        msg = self.extra_fmt(formatter.format(record))
+        tables = self._tables
+        self.last_color = tables[1].get(record.levelno, "")
+        msg = self.extra_fmt(self._formatter_for(tables, record.levelno, record.levelname).format(record), tables)
         self.last_output = msg
         return msg
 
 
+class AsyncStreamHandler(logging.Handler):
+    """
+    QueueHandler/QueueListener-style handler: `emit` only enqueues, and a daemon worker thread formats and writes
+    whatever has accumulated as one batch followed by a single flush.
+
+    Plain strings can be enqueued with `write` so that raw output keeps its position relative to log records.
+    """
+
+    _STOP = object()
+
+    def __init__(self, stream=None, writer=None, batch_size=256):
+        super().__init__()
+        self.stream = sys.stderr if stream is None else stream
+        self._writer = writer
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="ppplt-logger", daemon=True)
+        self._thread.start()
+
+    def emit(self, record):
+        # resolve `msg % args` on the caller thread so later mutation of the arguments cannot leak into the output
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        self._queue.put_nowait(record)
+
+    def write(self, text):
+        self._queue.put_nowait(text)
+
+    def _run(self):
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            chunks = []
+            stop = False
+            for item in batch:
+                if item is self._STOP:
+                    stop = True
+                elif isinstance(item, str):
+                    chunks.append(item)
+                else:
+                    try:
+                        chunks.append(self.format(item) + "\n")
+                    except Exception:
+                        self.handleError(item)
+            if chunks:
+                try:
+                    self._write("".join(chunks))
+                except Exception:
+                    # report through the logging error hook (stderr traceback) instead of dropping silently
+                    records = [item for item in batch if isinstance(item, logging.LogRecord)]
+                    self.handleError(records[0] if records else logging.makeLogRecord({"msg": chunks[0]}))
+            for _ in batch:
+                q.task_done()
+            if stop:
+                return
+
+    def _write(self, text):
+        if self._writer is not None:
+            self._writer(text)
+            return
+        if getattr(self.stream, "closed", False):
+            return
+        self.stream.write(text)
+        self.stream.flush()
+
+    def flush(self):
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put_nowait(self._STOP)
+            self._thread.join()
+        super().close()
+
+
+class JsonLogHandler(logging.Handler):
+    """
+    Structured sink emitting one JSON object per record.
+
+    Every line carries ``ts``, ``level``, ``msg`` (markup stripped) and the current ``phase``; records logged via
+    `Logger.event` additionally carry ``event`` and its fields (``figure``, ``paths``, ``bytes``, ``duration_ms``...).
+    Writes are buffered and flushed at most every `flush_interval` seconds to stay cheap on hot paths.
+    """
+
+    def __init__(self, target="-", level=logging.NOTSET, flush_interval=1.0):
+        super().__init__(level)
+        if target == "-":
+            self.stream, self._owns_stream = sys.stdout, False
+        elif isinstance(target, str) or hasattr(target, "__fspath__"):
+            self.stream, self._owns_stream = open(target, "a", encoding="utf-8"), True
+        else:
+            self.stream, self._owns_stream = target, False
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def to_dict(self, record):
+        import ppplt
+
+        phase = getattr(ppplt, "_phase", None)
+        obj = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "msg": _MARKUP.sub("", record.getMessage()),
+            "phase": phase.name if phase is not None else None,
+        }
+        event = getattr(record, "ppplt_event", None)
+        if event is not None:
+            obj["event"] = event
+            obj.update(record.ppplt_fields)
+        return obj
+
+    def emit(self, record):
+        try:
+            line = json.dumps(self.to_dict(record), ensure_ascii=False, default=str)
+            self.acquire()
+            try:
+                self.stream.write(line + "\n")
+                now = time.monotonic()
+                if now - self._last_flush >= self.flush_interval:
+                    self.stream.flush()
+                    self._last_flush = now
+            finally:
+                self.release()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if not getattr(self.stream, "closed", False):
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        if self._owns_stream:
+            self.stream.close()
+        super().close()
+
+
 class Logger:
-    def __init__(self, logging_level, log_time, verbose_time):
+    def __init__(self, logging_level, log_time, verbose_time, async_=False, palette=None):
         if isinstance(logging_level, str):
             logging_level = logging_level.upper()
 
         self._logger = logging.getLogger("ppplot")
         self._logger.setLevel(logging_level)
 
-        self._formatter = PaperPlotFormatter(log_time, verbose_time)
+        self._formatter = PaperPlotFormatter(log_time, verbose_time, palette)
 
-        self._handler = logging.StreamHandler(sys.stdout)
+        self._async = async_
+        self._stream = sys.stdout
+        if async_:
+            self._handler = AsyncStreamHandler(self._stream, writer=self._write_batch)
+        else:
+            self._handler = logging.StreamHandler(self._stream)
         self._handler.setLevel(logging_level)
         self._handler.setFormatter(self._formatter)
         self._logger.addHandler(self._handler)
+        self._sinks = []
 
-        self._stream = self._handler.stream
         self._is_new_line = True
+        # number of log records written so far (used by TimeElapser to find its line)
+        self._line_count = 0
+        # number of live TimeElapsers; the timer lock is only taken while one may be redrawing
+        self._active_timers = 0
 
         self.timer_lock = threading.Lock()
 
@@ -186,15 +452,28 @@ class Logger:
 
     @contextmanager
     def log_wrapper(self):
+        # Unlocked read on purpose: a timer starting concurrently with this record can at worst redraw its line
+        # once around the record (cosmetic interleaving); the counter itself is only mutated under timer_lock.
+        if not self._active_timers:
+            if not self._is_new_line:
+                self._write("\r")
+            try:
+                yield
+            finally:
+                self._is_new_line = True
+                self._line_count += 1
+            return
+
         self.timer_lock.acquire()
 
         # swap with timer output
-        if not self._is_new_line and not self._stream.closed:
-            self._stream.write("\r")
+        if not self._is_new_line:
+            self._write("\r")
         try:
             yield
         finally:
             self._is_new_line = True
+            self._line_count += 1
             self.timer_lock.release()
 
     @contextmanager
@@ -205,15 +484,32 @@ class Logger:
         finally:
             self.timer_lock.release()
 
+    def _write(self, text):
+        if self._async:
+            self._handler.write(text)
+        elif not self._stream.closed:
+            self._stream.write(text)
+
+    def _write_batch(self, text):
+        if not self._stream.closed:
+            self._stream.write(text)
+            self._stream.flush()
+
     def log(self, level, msg, *args, **kwargs):
+        if not self._logger.isEnabledFor(level):
+            return
         with self.log_wrapper():
             self._logger.log(level, msg, *args, **kwargs)
 
     def debug(self, message):
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         with self.log_wrapper():
             self._logger.debug(message)
 
     def info(self, message):
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         with self.log_wrapper():
             self._logger.info(message)
 
@@ -229,18 +525,67 @@ class Logger:
         with self.log_wrapper():
             self._logger.critical(message)
 
+    def event(self, name, message=None, level=logging.INFO, **fields):
+        """Log `message` (default: `name`) and attach `fields` for structured sinks."""
+        if not self._logger.isEnabledFor(level):
+            return
+        with self.log_wrapper():
+            self._logger.log(
+                level, name if message is None else message, extra={"ppplt_event": name, "ppplt_fields": fields}
+            )
+
+    def add_json_sink(self, target="-", level=logging.NOTSET):
+        sink = JsonLogHandler(target, level)
+        self._logger.addHandler(sink)
+        self._sinks.append(sink)
+        return sink
+
     def raw(self, message):
-        self._stream.write(self._formatter.extra_fmt(message))
-        self._stream.flush()
+        if self._async:
+            self._handler.write(self._formatter.extra_fmt(message))
+        else:
+            self._stream.write(self._formatter.extra_fmt(message))
+            self._stream.flush()
         if message.endswith("\n"):
             self._is_new_line = True
         else:
             self._is_new_line = False
 
+    def flush(self):
+        self._handler.flush()
+        for sink in self._sinks:
+            sink.flush()
+
+    def close(self):
+        for handler in (self._handler, *self._sinks):
+            try:
+                handler.flush()
+            except (ValueError, OSError):
+                # stream already closed (e.g. at interpreter exit or by a capturing test harness)
+                pass
+            self._logger.removeHandler(handler)
+            handler.close()
+        self._sinks.clear()
+
     def timer(self, msg, refresh_rate=10, end_msg=""):
         self.info(msg)
+        # the elapser re-prints the formatted line, so it must have been rendered already
+        self.flush()
         return TimeElapser(self, refresh_rate, end_msg)
 
+    def set_palette(self, palette):
+        self._formatter.set_palette(palette)
+
+    @property
+    def is_interactive(self):
+        if not self._formatter.palette.RESET:
+            # `dumb` palette: no escape sequences available to redraw with
+            return False
+        try:
+            return self._stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
     @property
     def handler(self):
         return self._handler
@@ -0,0 +1,196 @@
+"""
+Palette generator: maximally distinct color sets in a perceptual space.
+
+API:
+- generate_palette(n, *, cvd_safe=False, grayscale=False, min_delta=8.0, anchors=(), background="#FFFFFF",
+                   lightness_range=(15.0, 90.0), iterations=2000, seed=0, name=None,
+                   overwrite=False) -> list[str]
+
+Behavior:
+- Candidates are a fixed 16^3 sRGB grid converted once to CAM02-UCS (and to each simulated color-vision deficiency
+  when `cvd_safe`); the conversion is cached per process.
+- The distance between two colors is their smallest ΔE across every considered view (normal + simulations), and
+  the objective is the smallest such distance over all pairs (and to `background`).
+- A vectorized greedy farthest-point pass seeds the palette, then simulated annealing swaps single colors.
+- `grayscale=True` is a hard constraint: every pair must differ by at least `min_delta` in CIE L*. The L* range is
+  split into `n` evenly spaced bands, one color per band, with anchors claiming the band closest to their L*.
+- `anchors` are kept verbatim at the front of the palette.
+- Results are memoized by parameters; `name=` also registers the result as a color set
+  (an existing set, built-in or not, is only replaced with overwrite=True).
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import colorspace as cs
+from .colorset import register_color_set
+
+_GRID_LEVELS = 16
+
+
+@functools.lru_cache(maxsize=4)
+def _candidate_pool(cvd_safe: bool, grid_levels: int = _GRID_LEVELS):
+    levels = np.linspace(0.0, 1.0, grid_levels)
+    rgb = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    return rgb, _views(rgb, cvd_safe), cs.lightness(rgb)
+
+
+def _views(rgb: np.ndarray, cvd_safe: bool) -> np.ndarray:
+    """Perceptual coordinates of `rgb` under every considered view, shape (views, N, 3)."""
+    sims = [rgb]
+    if cvd_safe:
+        sims += [cs.simulate_cvd(rgb, k) for k in ("protanopia", "deuteranopia", "tritanopia")]
+    return cs.rgb_to_cam02ucs(np.stack(sims))
+
+
+def _dist_to(views: np.ndarray, point: np.ndarray) -> np.ndarray:
+    # views: (V, N, 3), point: (V, 3) -> (N,) smallest ΔE over views
+    diff = views - point[:, None, :]
+    return np.sqrt(np.einsum("vnk,vnk->vn", diff, diff)).min(axis=0)
+
+
+def generate_palette(
+    n: int,
+    *,
+    cvd_safe: bool = False,
+    grayscale: bool = False,
+    min_delta: float = 8.0,
+    anchors: Sequence[str] = (),
+    background: Optional[str] = "#FFFFFF",
+    lightness_range: Tuple[float, float] = (15.0, 90.0),
+    iterations: int = 2000,
+    seed: int = 0,
+    name: Optional[str] = None,
+    overwrite: bool = False,
+) -> List[str]:
+    """
+    Solve for `n` maximally separated colors (hex strings).
+
+    Raises ValueError when the constraints cannot be met, e.g. `grayscale=True` with more colors than fit into
+    `lightness_range` at `min_delta` spacing, or when `name` is already a color set and `overwrite` is False.
+    """
+    anchors = tuple(c.upper() for c in cs.to_hex(cs.to_rgb(list(anchors)))) if anchors else ()
+    colors = list(
+        _solve(
+            n,
+            cvd_safe,
+            grayscale,
+            float(min_delta),
+            anchors,
+            background,
+            tuple(lightness_range),
+            iterations,
+            seed,
+        )
+    )
+    if name is not None:
+        register_color_set(name, colors, overwrite=overwrite)
+    return colors
+
+
+def _lightness_bands(n, min_delta, lightness_range):
+    """Evenly spaced target L* levels and the half-width of the band around each one."""
+    lo, hi = lightness_range
+    spacing = (hi - lo) / (n - 1) if n > 1 else hi - lo
+    if spacing < min_delta:
+        raise ValueError(
+            f"Cannot fit {n} grayscale-discriminable colors into L* range {lightness_range} with min_delta={min_delta}"
+            f" (at most {int((hi - lo) // min_delta) + 1})."
+        )
+    levels = np.linspace(lo, hi, n) if n > 1 else np.array([(lo + hi) / 2])
+    # colors from different bands are then at least `min_delta` apart
+    return levels, max((spacing - min_delta) / 2 * 0.999, 0.0)
+
+
+@functools.lru_cache(maxsize=64)
+def _solve(n, cvd_safe, grayscale, min_delta, anchors, background, lightness_range, iterations, seed):
+    if n < len(anchors):
+        raise ValueError(f"n={n} is smaller than the number of anchors ({len(anchors)}).")
+    # grayscale bands can be narrow, so sample the sRGB cube more densely
+    pool_rgb, pool_views, pool_L = _candidate_pool(cvd_safe, 2 * _GRID_LEVELS if grayscale else _GRID_LEVELS)
+    n_pool = len(pool_rgb)
+
+    # append anchors and background to the pool so everything is addressed by index
+    extra = list(anchors) + ([background] if background else [])
+    if extra:
+        extra_rgb = cs.to_rgb(extra)
+        views = np.concatenate([pool_views, _views(extra_rgb, cvd_safe)], axis=1)
+        L = np.concatenate([pool_L, cs.lightness(extra_rgb)])
+        rgb = np.concatenate([pool_rgb, extra_rgb])
+    else:
+        views, L, rgb = pool_views, pool_L, pool_rgb
+    anchor_idx = list(range(n_pool, n_pool + len(anchors)))
+    fixed = anchor_idx + ([n_pool + len(anchors)] if background else [])
+
+    valid = np.zeros(len(rgb), dtype=bool)
+    valid[:n_pool] = (pool_L >= lightness_range[0]) & (pool_L <= lightness_range[1])
+    # band[i]: index of the L* level candidate i may fill (-1: none); everything is one band without grayscale
+    band = np.where(valid, 0, -1)
+    free_bands = {0}
+    if grayscale:
+        levels, half = _lightness_bands(n, min_delta, lightness_range)
+        nearest = np.abs(L[:, None] - levels[None, :]).argmin(axis=1)
+        band = np.where(valid & (np.abs(L - levels[nearest]) <= half), nearest, -1)
+        free_bands = set(range(n))
+        for i in anchor_idx:
+            # an anchor claims the closest level still unclaimed
+            claimed = min(free_bands, key=lambda k: abs(levels[k] - L[i]))
+            free_bands.discard(claimed)
+            valid &= np.abs(L - L[i]) >= min_delta
+
+    # ---- greedy farthest-point seeding ----
+    dmin = np.full(len(rgb), np.inf)
+    for i in fixed:
+        dmin = np.minimum(dmin, _dist_to(views, views[:, i]))
+    selected = list(anchor_idx)
+    while len(selected) < n:
+        allowed = valid & np.isin(band, list(free_bands))
+        score = np.where(allowed, dmin, -np.inf)
+        best = int(np.argmax(score))
+        if not np.isfinite(score[best]):
+            raise ValueError(
+                f"Cannot place {n} colors under the given constraints "
+                f"(grayscale={grayscale}, min_delta={min_delta}, lightness_range={lightness_range})."
+            )
+        selected.append(best)
+        valid[best] = False
+        if grayscale:
+            free_bands.discard(int(band[best]))
+        dmin = np.minimum(dmin, _dist_to(views, views[:, best]))
+
+    # ---- simulated annealing over the free slots ----
+    members = selected + ([fixed[-1]] if background else [])
+    dist = np.stack([_dist_to(views[:, members], views[:, i]) for i in members])
+    np.fill_diagonal(dist, np.inf)
+    free = list(range(len(anchor_idx), n))
+    candidates = np.flatnonzero(valid)
+    rng = np.random.default_rng(seed)
+    score = dist.min()
+    best_members, best_score = list(members), score
+    if free and iterations > 0 and len(candidates):
+        temps = max(score, 1.0) * 0.05 * np.geomspace(1.0, 1e-3, iterations)
+        slots = rng.choice(free, size=iterations)
+        picks = rng.choice(candidates, size=iterations)
+        for t, slot, c in zip(temps, slots, picks):
+            # a swap must stay within the slot's L* band (always true without grayscale)
+            if band[c] != band[members[slot]] or c in members:
+                continue
+            row = _dist_to(views[:, members], views[:, c])
+            row[slot] = np.inf
+            rest = np.delete(np.delete(dist, slot, axis=0), slot, axis=1)
+            new_score = min(rest.min(), row.min())
+            if new_score >= score or rng.random() < np.exp((new_score - score) / t):
+                members[slot] = int(c)
+                dist[slot, :] = row
+                dist[:, slot] = row
+                score = new_score
+                if score > best_score:
+                    best_members, best_score = list(members), score
+    return tuple(cs.to_hex(rgb[best_members[:n]]))
+
+
+__all__ = ["generate_palette"]
@@ -4,7 +4,12 @@ Style & preset utilities (expanded).
 Includes:
 1. Low level style/font helpers (moved from __init__):
     - styles_dir / fonts_dir / available_styles / register_fonts / apply_style / set_style
-2. Preset registry & application combining style + color set.
+2. Style & preset registries (ppplt.registry.Registry) combining style + color set:
+    - names are normalized (case / space / '-' / '_'), support aliases and are validated at registration
+    - resolved rcParams are memoized per style / preset (get_style_rc / get_preset_rc)
+    - preset(name): context manager applying a preset's precompiled rcParams delta and restoring it on exit
+    - user extensions: register_style / register_paper_preset, load_presets_dir (*.mplstyle, TOML, JSON),
+      entry points in group "ppplt.presets" and directories listed in $PPPLT_PRESETS_PATH
 3. style_step: pipeline step (uses Step from pipeline module).
 
 NOTE: These functions access global state (_phase, logger, etc.) defined in ppplt.__init__.
@@ -12,7 +17,8 @@ NOTE: These functions access global state (_phase, logger, etc.) defined in pppl
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -21,7 +27,8 @@ import importlib
 # Import shared state & helpers lazily to avoid circular import at module import time.
 import ppplt as _core
 from .pipeline import Step
-from .colorset import apply_color_set
+from .colorset import COLOR_SETS
+from .registry import Registry
 
 # ---------------------------
 # Font & style filesystem helpers
@@ -50,15 +57,20 @@ def fonts_dir() -> Path:
 
 
 def available_styles() -> List[str]:
-    d = styles_dir()
-    if not d.exists():
-        return []
-    return [p.stem for p in d.glob("*.mplstyle")]
+    _ensure_plugins()
+    return STYLES.names()
 
 
-def register_fonts() -> None:
+_fonts_registered = False
+
+
+def register_fonts(*, force: bool = False) -> None:
+    """Add the bundled fonts to Matplotlib's font manager (once per process unless `force`)."""
+    global _fonts_registered
     from matplotlib import font_manager as fm
 
+    if _fonts_registered and not force:
+        return
     fdir = fonts_dir()
     if not fdir.exists():
         return
@@ -69,21 +81,18 @@ def register_fonts() -> None:
                 fm.fontManager.addfont(str(fp))
             except Exception:
                 pass
-    try:
-        fm._load_fontmanager(try_read_cache=False)  # type: ignore[attr-defined]
-    except Exception:
-        fm.fontManager.refresh_fonts()
+    # `addfont` only clears the lookup cache on newer Matplotlib; rebuilding the whole manager is not needed
+    cache = getattr(fm.fontManager, "_findfont_cached", None)
+    if cache is not None and hasattr(cache, "cache_clear"):
+        cache.cache_clear()
+    _fonts_registered = True
 
 
 def apply_style(name: str, *, register_font: bool = True) -> None:
-    import matplotlib as mpl
-
+    rc = get_style_rc(name)  # raises ValueError for unknown styles
     if register_font:
         register_fonts()
-    target = styles_dir() / f"{name.upper()}.mplstyle"
-    if not target.exists():
-        raise ValueError(f"Style '{name}' not found. Available: {available_styles()}")
-    mpl.style.use(str(target))
+    _apply_rc(rc)
 
 
 def set_style(*, style: Optional[str] = None, preset: Optional[str] = None, register_font: bool = True) -> None:
@@ -106,10 +115,36 @@ def set_style(*, style: Optional[str] = None, preset: Optional[str] = None, regi
 
 
 # ---------------------------
-# Presets registry
+# Style / preset registries
 # ---------------------------
 
 
+def _validate_style(name: str, value):
+    # a style is either a .mplstyle path or a mapping of rcParams
+    if isinstance(value, (str, Path)):
+        path = Path(value)
+        if not path.is_file():
+            raise ValueError(f"Style '{name}': file '{path}' does not exist")
+        return path
+    from matplotlib import RcParams
+
+    try:
+        RcParams(dict(value))  # validates keys and values
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValueError(f"Style '{name}' has invalid rcParams: {e}") from e
+    return dict(value)
+
+
+def _validate_preset(name: str, value):
+    info = dict(value)
+    if set(info) - {"style", "colors"} or not {"style", "colors"} <= set(info):
+        raise ValueError(f"Preset '{name}' must define exactly 'style' and 'colors', got {sorted(info)}")
+    # store canonical names so later lookups skip normalization
+    return {"style": STYLES.resolve(info["style"]), "colors": COLOR_SETS.resolve(info["colors"])}
+
+
+STYLES = Registry("style", {p.stem: p for p in sorted(styles_dir().glob("*.mplstyle"))}, validate=_validate_style)
+
 _PRESETS: Dict[str, Dict[str, str]] = {
     # name: {style, colors}
     "ieee-modern": {"style": "IEEE", "colors": "Modern Scientific"},
@@ -123,22 +158,223 @@ _PRESETS: Dict[str, Dict[str, str]] = {
     "gb-gray": {"style": "GB", "colors": "Grayscale-Safe"},
 }
 
+PRESETS = Registry("preset", _PRESETS, validate=_validate_preset)
+
+
+def _style_blacklist() -> frozenset:
+    """Matplotlib's own set of rcParams that style files must not touch (not about style)."""
+    try:
+        from matplotlib.style import _STYLE_BLACKLIST as blacklist  # Matplotlib >= 3.11
+    except ImportError:
+        from matplotlib.style.core import STYLE_BLACKLIST as blacklist
+    return frozenset(blacklist)
+
+
+# resolved rcParams, keyed by canonical style / preset name
+_STYLE_RC: Dict[str, Dict[str, Any]] = {}
+_PRESET_RC: Dict[str, Dict[str, Any]] = {}
+
+
+def _drop_rc_caches(_name: str = "") -> None:
+    # styles and color sets feed into presets, so any change invalidates every resolved preset
+    _STYLE_RC.clear()
+    _PRESET_RC.clear()
+
+
+for _registry in (STYLES, COLOR_SETS, PRESETS):
+    _registry.add_listener(_drop_rc_caches)
+
+
+def get_style_rc(name: str) -> Dict[str, Any]:
+    """Parsed and validated rcParams of a style (memoized)."""
+    _ensure_plugins()
+    key = STYLES.resolve(name)
+    rc = _STYLE_RC.get(key)
+    if rc is None:
+        import matplotlib as mpl
+
+        value = STYLES.get(key)
+        if isinstance(value, Path):
+            params = mpl.rc_params_from_file(str(value), use_default_template=False)
+        else:
+            params = mpl.RcParams(value)
+        # same filtering as `matplotlib.style.use`: keys unrelated to style are ignored
+        blacklist = _style_blacklist()
+        rc = {k: params[k] for k in params.keys() if k not in blacklist}
+        _STYLE_RC[key] = rc
+    return rc
+
+
+def get_preset_rc(name: str) -> Dict[str, Any]:
+    """Style rcParams plus the color cycle of a preset, resolved once and memoized."""
+    _ensure_plugins()
+    key = PRESETS.resolve(name)
+    rc = _PRESET_RC.get(key)
+    if rc is None:
+        from cycler import cycler
+
+        info = PRESETS.get(key)
+        rc = dict(get_style_rc(info["style"]))
+        rc["axes.prop_cycle"] = cycler(color=COLOR_SETS.get(info["colors"]))
+        _PRESET_RC[key] = rc
+    return rc
+
+
+def register_style(name: str, style, *, aliases: Sequence[str] = (), overwrite: bool = False) -> None:
+    """Register a style from a ``.mplstyle`` path or a dict of rcParams (validated now)."""
+    STYLES.register(name, style, aliases=aliases, overwrite=overwrite)
+
+
+def register_paper_preset(
+    name: str, *, style: str, colors: str, aliases: Sequence[str] = (), overwrite: bool = False
+) -> None:
+    """Register a preset; `style` and `colors` must already be registered."""
+    PRESETS.register(name, {"style": style, "colors": colors}, aliases=aliases, overwrite=overwrite)
+
 
 def list_paper_presets() -> List[str]:
-    return list(_PRESETS.keys())
+    _ensure_plugins()
+    return PRESETS.names()
 
 
 def get_paper_preset(name: str) -> Dict[str, str]:
-    key = name.lower()
-    if key not in _PRESETS:
-        raise ValueError(f"Preset '{name}' not found. Available: {list_paper_presets()}")
-    return dict(_PRESETS[key])
+    _ensure_plugins()
+    return dict(PRESETS.get(name))
 
 
 def apply_paper_preset(name: str) -> None:
-    info = get_paper_preset(name)
-    apply_style(info["style"])  # also registers fonts
-    apply_color_set(info["colors"])  # set color cycle
+    rc = get_preset_rc(name)
+    register_fonts()
+    _apply_rc(rc)
+
+
+def _apply_rc(rc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Write already-validated values straight into `matplotlib.rcParams`, skipping per-key validation.
+
+    Returns the previous values of exactly those keys, so the change can be undone with another `_apply_rc`.
+    """
+    import matplotlib as mpl
+
+    params = mpl.rcParams
+    get = getattr(params, "_get", None) or (lambda k: dict.__getitem__(params, k))
+    put = getattr(params, "_set", None) or (lambda k, v: dict.__setitem__(params, k, v))
+    previous = {k: get(k) for k in rc}
+    for k, v in rc.items():
+        put(k, v)
+    return previous
+
+
+@contextmanager
+def preset(name: str, *, register_font: bool = True):
+    """
+    Temporarily switch to a preset: ``with ppplt.preset("gb-okabe"): ...``.
+
+    Applies the memoized, prevalidated rcParams delta of the preset and restores the previous values of those keys
+    on exit. Figures keep the fonts/colors they were created with, but save-time settings (``savefig.*``) are read
+    when saving, so save inside the block. An INITIALIZED phase is advanced to STYLE_SET for the block and restored
+    on exit. Yields a read-only view of the applied rcParams.
+    """
+    from types import MappingProxyType
+
+    from . import _Phase
+
+    rc = get_preset_rc(name)
+    if register_font:
+        register_fonts()
+    previous = _apply_rc(rc)
+    advanced = _core._phase == _Phase.INITIALIZED
+    if advanced:
+        _core._phase = _Phase.STYLE_SET
+    try:
+        # the dict itself is the memoized cache entry: callers must not be able to mutate it
+        yield MappingProxyType(rc)
+    finally:
+        _apply_rc(previous)
+        if advanced:
+            _core._phase = _Phase.INITIALIZED
+
+
+# ---------------------------
+# User extensions
+# ---------------------------
+PLUGIN_GROUP = "ppplt.presets"
+PRESETS_PATH_ENV = "PPPLT_PRESETS_PATH"
+_plugins_loaded = False
+
+
+def _read_registry_file(path: Path) -> Dict[str, Any]:
+    if path.suffix == ".json":
+        import json
+
+        return json.loads(path.read_text(encoding="utf-8"))
+    try:
+        import tomllib  # Python >= 3.11
+    except ImportError:  # pragma: no cover
+        try:
+            import tomli as tomllib  # type: ignore[no-redef]
+        except ImportError:
+            raise ImportError(f"Reading '{path}' needs Python >= 3.11 or the 'tomli' package") from None
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_presets_dir(path, *, overwrite: bool = False) -> List[str]:
+    """
+    Register everything found in a directory and return the names added.
+
+    - ``*.mplstyle`` files become styles named after the file stem.
+    - ``*.toml`` / ``*.json`` files may define ``color_sets`` (name -> list of hex), ``styles`` (name -> rcParams)
+      and ``presets`` (name -> {style, colors, aliases?}); color sets and styles are registered before presets.
+    """
+    d = Path(path)
+    if not d.is_dir():
+        raise ValueError(f"Preset directory '{d}' does not exist")
+    added: List[str] = []
+    for fp in sorted(d.glob("*.mplstyle")):
+        register_style(fp.stem, fp, overwrite=overwrite)
+        added.append(fp.stem)
+    tables = [_read_registry_file(fp) for fp in sorted(d.iterdir()) if fp.suffix in (".toml", ".json")]
+    for table in tables:
+        for cname, colors in table.get("color_sets", {}).items():
+            COLOR_SETS.register(cname, list(colors), overwrite=overwrite)
+            added.append(cname)
+        for sname, rc in table.get("styles", {}).items():
+            register_style(sname, rc, overwrite=overwrite)
+            added.append(sname)
+    for table in tables:
+        for pname, spec in table.get("presets", {}).items():
+            spec = dict(spec)
+            aliases = spec.pop("aliases", ())
+            PRESETS.register(pname, spec, aliases=aliases, overwrite=overwrite)
+            added.append(pname)
+    return added
+
+
+def _ensure_plugins() -> None:
+    """Load entry-point plugins and `PPPLT_PRESETS_PATH` directories once, on first registry use."""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    import os
+
+    for entry in filter(None, os.environ.get(PRESETS_PATH_ENV, "").split(os.pathsep)):
+        load_presets_dir(entry)
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=PLUGIN_GROUP):
+        # an entry point is either a callable that registers things itself or a directory path
+        obj = ep.load()
+        if callable(obj):
+            obj()
+        else:
+            load_presets_dir(obj)
+
+
+# color sets are looked up through ppplt.colorset too: any registry miss / listing loads the plugins first
+for _registry in (STYLES, COLOR_SETS, PRESETS):
+    _registry.add_loader(_ensure_plugins)
 
 
 # ---------------------------
@@ -160,6 +396,12 @@ __all__ = [
     "list_paper_presets",
     "get_paper_preset",
     "apply_paper_preset",
+    "preset",
+    "register_style",
+    "register_paper_preset",
+    "load_presets_dir",
+    "get_style_rc",
+    "get_preset_rc",
     # pipeline
     "style_step",
 ]
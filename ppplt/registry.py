@@ -0,0 +1,132 @@
+"""
+Name registry shared by color sets, styles and paper presets.
+
+API:
+- normalize_name(name: str) -> str: Case-, whitespace-, '_' and '-'-insensitive key ("Okabe Ito" == "okabe-ito").
+- Registry(kind, items=None, validate=None): Mapping of canonical names to values with a normalized index.
+    - register(name, value, *, aliases=(), overwrite=False): Validate and add (or replace) an entry.
+    - alias(alias, name): Add another lookup name for an existing entry.
+    - resolve(name) -> str: Canonical name for `name` or one of its aliases (ValueError if unknown).
+    - get(name): Value for `name`; O(1) via the index.
+    - names() -> list[str]: Canonical names in registration order.
+    - add_listener(fn): Call `fn(canonical_name)` after every (re-)registration, e.g. to drop derived caches.
+    - add_loader(fn): Call `fn()` once, the first time a lookup misses or the names are listed (lazy plugins).
+
+Behavior:
+- Values are validated when registered, so a bad entry fails at load time rather than at first use.
+- `items` may be an existing dict; it is used as the backing store, and direct edits to it are picked up on the
+  next lookup miss (the index is rebuilt once).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+_SEP = re.compile(r"[\s_\-]+")
+
+
+def normalize_name(name: str) -> str:
+    return _SEP.sub("-", name.strip().lower())
+
+
+class Registry:
+    def __init__(
+        self,
+        kind: str,
+        items: Optional[Dict[str, Any]] = None,
+        validate: Optional[Callable[[str, Any], Any]] = None,
+    ):
+        self.kind = kind
+        self._items: Dict[str, Any] = {} if items is None else items
+        self._validate = validate
+        self._aliases: Dict[str, str] = {}
+        self._listeners: List[Callable[[str], None]] = []
+        self._loaders: List[Callable[[], None]] = []
+        self._index: Dict[str, str] = {}
+        if self._validate is not None:
+            for name, value in list(self._items.items()):
+                self._items[name] = self._validate(name, value)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        index = {normalize_name(k): k for k in self._items}
+        for alias, target in self._aliases.items():
+            if target in self._items:
+                index.setdefault(alias, target)
+        self._index = index
+
+    def _lookup(self, name: str) -> Optional[str]:
+        key = normalize_name(name)
+        canonical = self._index.get(key)
+        if canonical is None or canonical not in self._items:
+            self._reindex()
+            canonical = self._index.get(key)
+        return canonical
+
+    def register(self, name: str, value: Any, *, aliases: Iterable[str] = (), overwrite: bool = False) -> None:
+        existing = self._lookup(name)
+        if existing is not None and not overwrite:
+            raise ValueError(
+                f"{self.kind.capitalize()} '{existing}' already exists (pass overwrite=True to replace it)."
+            )
+        if self._validate is not None:
+            value = self._validate(name, value)
+        if existing is not None and existing != name:
+            del self._items[existing]
+            self._aliases = {a: (name if t == existing else t) for a, t in self._aliases.items()}
+        self._items[name] = value
+        self._reindex()
+        for alias in aliases:
+            self.alias(alias, name)
+        for listener in self._listeners:
+            listener(name)
+
+    def alias(self, alias: str, name: str) -> None:
+        canonical = self.resolve(name)
+        key = normalize_name(alias)
+        owner = self._index.get(key)
+        if owner is not None and owner != canonical:
+            raise ValueError(f"Alias '{alias}' already refers to {self.kind} '{owner}'.")
+        self._aliases[key] = canonical
+        self._index[key] = canonical
+
+    def _load_pending(self) -> bool:
+        """Run pending loaders (each once); True if any ran."""
+        loaders, self._loaders = self._loaders, []
+        for loader in loaders:
+            loader()
+        return bool(loaders)
+
+    def resolve(self, name: str) -> str:
+        canonical = self._lookup(name)
+        if canonical is None and self._load_pending():
+            canonical = self._lookup(name)
+        if canonical is None:
+            raise ValueError(f"{self.kind.capitalize()} '{name}' not found. Available: {self.names()}")
+        return canonical
+
+    def get(self, name: str) -> Any:
+        return self._items[self.resolve(name)]
+
+    def names(self) -> List[str]:
+        self._load_pending()
+        return list(self._items.keys())
+
+    def add_listener(self, fn: Callable[[str], None]) -> None:
+        self._listeners.append(fn)
+
+    def add_loader(self, fn: Callable[[], None]) -> None:
+        self._loaders.append(fn)
+
+    def __contains__(self, name: str) -> bool:
+        canonical = self._lookup(name)
+        if canonical is None and self._load_pending():
+            canonical = self._lookup(name)
+        return canonical is not None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+__all__ = ["normalize_name", "Registry"]
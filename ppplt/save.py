@@ -2,11 +2,21 @@
 Save utilities for last drawn figure.
 
 Includes save() and save_step for pipeline.
+
+PDF/PS exports reuse font subsets across figures through ppplt.fontcache; `fonttype=3|42` forces one embedding
+type for both PDF and PS regardless of the active style.
+
+PdfBook collects many figures as pages of one PDF: each page is written to disk as it is added, while fonts and
+other shared resources are embedded once for the whole document when the book is closed.
 """
 
 from __future__ import annotations
 from typing import Optional, Sequence, Any, List
 import os as _os
+import time as _time
+import logging as _logging
+
+import matplotlib as _mpl
 
 import ppplt as _core
 from .pipeline import Step
@@ -18,34 +28,168 @@ def save(
     dpi: Optional[int] = None,
     formats: Optional[Sequence[str]] = None,
     bbox_inches: Optional[str] = "tight",
+    fonttype: Optional[int] = None,
     **kwargs: Any,
 ) -> List[str]:
     from . import _require_phase, _Phase, logger
+    from . import fontcache
 
     _require_phase(_Phase.DRAWN, _Phase.SAVED)
     if _core._last_fig is None:
         raise _core.PaperPlotException("当前没有可保存的图形 (last_fig is None)")
     base, ext = _os.path.splitext(path)
-    written: List[str] = []
     if formats is None:
         if not ext:
             raise _core.PaperPlotException("未提供格式且路径无扩展名")
-        out_path = path
-        _core._last_fig.savefig(out_path, dpi=dpi, bbox_inches=bbox_inches, **kwargs)
-        written.append(out_path)
+        out_paths = [path]
     else:
-        for f in formats:
-            f = f.lstrip(".")
-            out_path = f"{base}.{f}"
+        out_paths = [f"{base}.{f.lstrip('.')}" for f in formats]
+    rc = _fonttype_rc(fonttype)
+    fontcache.install()
+    written: List[str] = []
+    durations: List[float] = []
+    with _mpl.rc_context(rc):
+        for out_path in out_paths:
+            t_start = _time.perf_counter()
             _core._last_fig.savefig(out_path, dpi=dpi, bbox_inches=bbox_inches, **kwargs)
+            durations.append((_time.perf_counter() - t_start) * 1000.0)
             written.append(out_path)
     _core._phase = _Phase.SAVED
-    logger.info("💾 Figure saved: " + ", ".join(written))
+    logger.event(
+        "save",
+        "💾 Figure saved: " + ", ".join(written),
+        figure=getattr(_core._last_fig, "number", None),
+        paths=written,
+        bytes=[_os.path.getsize(p) if _os.path.exists(p) else None for p in written],
+        duration_ms=durations,
+    )
     return written
 
 
+def _fonttype_rc(fonttype: Optional[int]) -> dict:
+    if fonttype is None:
+        return {}
+    if fonttype not in (3, 42):
+        raise _core.PaperPlotException(f"fonttype 只能为 3 或 42, got {fonttype}")
+    return {"pdf.fonttype": fonttype, "ps.fonttype": fonttype}
+
+
 def save_step(*args, **kwargs):
     return Step(save, *args, **kwargs)
 
 
-__all__ = ["save", "save_step"]
+class PdfBook:
+    """
+    Multi-page PDF collector.
+
+    Usage:
+        with PdfBook("appendix.pdf") as book:
+            for data in datasets:
+                draw(...)
+                book.add()
+
+    - add(fig=None, **savefig_kwargs) -> int: Append `fig` (default: last drawn figure) as the next page and return
+      its 1-based page number. The page content is flushed to disk immediately; with `close_figures=True` the
+      figure is closed afterwards so memory stays bounded by one figure.
+    - close(): Embed the shared fonts / resources and finalize the file (called by the context manager).
+    - Each font is embedded once with the union of glyphs used by all pages, instead of once per file.
+    - `fonttype` is fixed for the whole document because every page shares the same font objects.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fonttype: Optional[int] = None,
+        metadata: Optional[dict] = None,
+        bbox_inches: Optional[str] = "tight",
+        dpi: Optional[int] = None,
+        close_figures: bool = True,
+    ):
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        if _os.path.splitext(path)[1].lower() != ".pdf":
+            path = f"{path}.pdf"
+        self.path = path
+        self.bbox_inches = bbox_inches
+        self.dpi = dpi
+        self.close_figures = close_figures
+        self._rc = _fonttype_rc(fonttype)
+        self._duration_ms = 0.0
+        self._pages = 0
+        self._pdf = PdfPages(path, metadata=metadata)
+
+    @property
+    def pages(self) -> int:
+        return self._pdf.get_pagecount() if self._pdf is not None else self._pages
+
+    def add(self, fig=None, **kwargs: Any) -> int:
+        from . import _Phase, logger
+
+        if self._pdf is None:
+            raise _core.PaperPlotException(f"PdfBook 已关闭: {self.path}")
+        if fig is None:
+            from . import _require_phase
+
+            _require_phase(_Phase.DRAWN, _Phase.SAVED)
+            fig = _core._last_fig
+            if fig is None:
+                raise _core.PaperPlotException("当前没有可保存的图形 (last_fig is None)")
+        kwargs.setdefault("bbox_inches", self.bbox_inches)
+        if self.dpi is not None:
+            kwargs.setdefault("dpi", self.dpi)
+        t_start = _time.perf_counter()
+        with _mpl.rc_context(self._rc):
+            self._pdf.savefig(fig, **kwargs)
+        duration = (_time.perf_counter() - t_start) * 1000.0
+        self._duration_ms += duration
+        page = self._pdf.get_pagecount()
+        if fig is _core._last_fig and _core._phase == _Phase.DRAWN:
+            _core._phase = _Phase.SAVED
+        if self.close_figures:
+            import matplotlib.pyplot as plt
+
+            plt.close(fig)
+        logger.event(
+            "save_page",
+            f"📄 Page ~<{page}>~ added to {self.path}",
+            level=_logging.DEBUG,
+            figure=getattr(fig, "number", None),
+            path=self.path,
+            page=page,
+            duration_ms=duration,
+        )
+        return page
+
+    def add_step(self, *args, **kwargs) -> Step:
+        return Step(self.add, *args, **kwargs)
+
+    def close(self) -> None:
+        if self._pdf is None:
+            return
+        from . import logger
+
+        t_start = _time.perf_counter()
+        self._pages = self._pdf.get_pagecount()
+        with _mpl.rc_context(self._rc):
+            # fonts are embedded here, and the font type is read again at this point
+            self._pdf.close()
+        self._pdf = None
+        self._duration_ms += (_time.perf_counter() - t_start) * 1000.0
+        logger.event(
+            "save",
+            f"💾 PDF book saved: {self.path} ({self._pages} pages)",
+            paths=[self.path],
+            pages=self._pages,
+            bytes=[_os.path.getsize(self.path) if _os.path.exists(self.path) else None],
+            duration_ms=[self._duration_ms],
+        )
+
+    def __enter__(self) -> "PdfBook":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+__all__ = ["save", "save_step", "PdfBook"]
@@ -3,94 +3,147 @@ Terminal color & text formatting utilities for PaperPlot.
 
 API:
 Classes / Singletons:
-- COLORS: Provides color escape sequences adapted to current theme (ppplt._theme in {"dark","light","dumb"}).
-- FORMATS: Provides style escape sequences (BOLD, ITALIC, UNDERLINE, RESET) also theme-aware.
+- Palette: Immutable table of every escape sequence for one theme (colors + BOLD / ITALIC / UNDERLINE / RESET).
+- COLORS: Provides color escape sequences of the active palette (kept for backward compatibility).
+- FORMATS: Provides style escape sequences (BOLD, ITALIC, UNDERLINE, RESET) of the active palette.
 
 Functions:
+- detect_theme(stream=None) -> str: "dumb" when NO_COLOR is set, TERM=dumb or the stream is not a TTY, else "dark".
+- resolve_theme(theme: str) -> str: Concrete theme; NO_COLOR / TERM=dumb turn any colored theme into "dumb".
+- get_palette(theme: str) -> Palette: Precomputed palette for {"dark","light","dumb","auto"} (after resolve_theme).
+- set_palette(theme: str) -> Palette: Atomically swap the active palette.
 - styless(text: str) -> str: Remove ANSI escape sequences from text.
 
 Instances:
+- palette: The active Palette (replaced as a whole, never mutated).
 - colors: Singleton instance of COLORS.
 - formats: Singleton instance of FORMATS.
 
 Behavior:
+- Palettes are built once at import; switching theme only rebinds `palette`, so readers never observe a mix.
 - When theme is "dumb" all escape sequences become empty strings (no color control characters in output).
 - Designed for logger / console pretty printing without leaking escape sequences into captured logs.
 """
 
+import os
 import re
-import ppplt
+import sys
+from dataclasses import dataclass
 
 
-class COLORS:
+@dataclass(frozen=True)
+class Palette:
     # Reference:
     # https://talyian.github.io/ansicolors/
     # https://bixense.com/clicolors/
+    GREEN: str = ""
+    BLUE: str = ""
+    YELLOW: str = ""
+    RED: str = ""
+    CORN: str = ""
+    GRAY: str = ""
+    MINT: str = ""
+    BOLD: str = ""
+    ITALIC: str = ""
+    UNDERLINE: str = ""
+    RESET: str = ""
+
+
+_ANSI_FORMATS = dict(BOLD="\x1b[1m", ITALIC="\x1b[3m", UNDERLINE="\x1b[4m", RESET="\x1b[0m")
+
+PALETTES = {
+    "dark": Palette(
+        GREEN="\x1b[38;5;119m",
+        BLUE="\x1b[38;5;159m",
+        YELLOW="\x1b[38;5;226m",
+        RED="\x1b[38;5;9m",
+        CORN="\x1b[38;5;11m",
+        GRAY="\x1b[38;5;247m",
+        MINT="\x1b[38;5;121m",
+        **_ANSI_FORMATS,
+    ),
+    "light": Palette(
+        GREEN="\x1b[38;5;2m",
+        BLUE="\x1b[38;5;17m",
+        YELLOW="\x1b[38;5;3m",
+        RED="\x1b[38;5;1m",
+        CORN="\x1b[38;5;178m",
+        GRAY="\x1b[38;5;239m",
+        MINT="\x1b[38;5;23m",
+        **_ANSI_FORMATS,
+    ),
+    "dumb": Palette(),
+}
+
+THEMES = ("dark", "light", "dumb", "auto")
+
+
+def detect_theme(stream=None):
+    if color_disabled():
+        return "dumb"
+    stream = sys.stdout if stream is None else stream
+    try:
+        is_tty = stream.isatty()
+    except (AttributeError, ValueError):
+        is_tty = False
+    return "dark" if is_tty else "dumb"
+
+
+def color_disabled():
+    return bool(os.environ.get("NO_COLOR")) or os.environ.get("TERM") == "dumb"
+
+
+def resolve_theme(theme):
+    """Concrete theme name: "auto" is detected, and NO_COLOR / TERM=dumb force "dumb" for every colored theme."""
+    if theme == "auto":
+        return detect_theme()
+    return "dumb" if color_disabled() else theme
+
+
+def get_palette(theme):
+    return PALETTES[resolve_theme(theme)]
+
+
+palette = PALETTES["dark"]
+
+
+def set_palette(theme):
+    global palette
+    palette = get_palette(theme)
+    return palette
+
+
+class COLORS:
     def __init__(self) -> None:
         pass
 
     @property
     def GREEN(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;119m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;2m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.GREEN
 
     @property
     def BLUE(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;159m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;17m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.BLUE
 
     @property
     def YELLOW(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;226m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;3m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.YELLOW
 
     @property
     def RED(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;9m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;1m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.RED
 
     @property
     def CORN(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;11m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;178m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.CORN
 
     @property
     def GRAY(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;247m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;239m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.GRAY
 
     @property
     def MINT(self):
-        if ppplt._theme == "dark":
-            return "\x1b[38;5;121m"
-        elif ppplt._theme == "light":
-            return "\x1b[38;5;23m"
-        elif ppplt._theme == "dumb":
-            return ""
+        return palette.MINT
 
 
 class FORMATS:
@@ -99,31 +152,19 @@ class FORMATS:
 
     @property
     def BOLD(self):
-        if ppplt._theme == "dumb":
-            return ""
-        else:
-            return "\x1b[1m"
+        return palette.BOLD
 
     @property
     def ITALIC(self):
-        if ppplt._theme == "dumb":
-            return ""
-        else:
-            return "\x1b[3m"
+        return palette.ITALIC
 
     @property
     def UNDERLINE(self):
-        if ppplt._theme == "dumb":
-            return ""
-        else:
-            return "\x1b[4m"
+        return palette.UNDERLINE
 
     @property
     def RESET(self):
-        if ppplt._theme == "dumb":
-            return ""
-        else:
-            return "\x1b[0m"
+        return palette.RESET
 
 
 def styless(text):
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from ppplt.aggregate import binned_stats, histogram2d, iter_chunks, open_array
+
+
+@pytest.fixture
+def points(tmp_path):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 10, 50_000)
+    y = np.sin(x) + rng.normal(0, 0.1, x.size)
+    np.save(tmp_path / "x.npy", x)
+    np.save(tmp_path / "y.npy", y)
+    return x, y, tmp_path / "x.npy", tmp_path / "y.npy"
+
+
+def test_histogram2d_matches_numpy_from_memmap_chunks(points):
+    x, y, xp, yp = points
+    hist = histogram2d(xp, yp, bins=(40, 30), chunk_size=4096)
+    expected, xe, ye = np.histogram2d(x, y, bins=(40, 30), range=[(x.min(), x.max()), (y.min(), y.max())])
+    np.testing.assert_array_equal(hist.counts, expected.T)
+    np.testing.assert_allclose(hist.x_edges, xe)
+    assert isinstance(open_array(xp), np.memmap)
+
+
+def test_binned_stats_from_one_shot_iterator(points):
+    x, y, _, _ = points
+    chunks = ((x[i : i + 7000], y[i : i + 7000]) for i in range(0, x.size, 7000))
+    with pytest.raises(ValueError):
+        binned_stats(iter(chunks), bins=10)
+    chunks = ((x[i : i + 7000], y[i : i + 7000]) for i in range(0, x.size, 7000))
+    stats = binned_stats(chunks, bins=10, range=(0, 10))
+    idx = np.minimum((x // 1).astype(int), 9)
+    for b in range(10):
+        sel = y[idx == b]
+        assert stats.count[b] == sel.size
+        assert stats.min[b] == sel.min() and stats.max[b] == sel.max()
+        assert stats.mean[b] == pytest.approx(sel.mean())
+
+
+def test_values_just_below_upper_edge_land_in_last_bin():
+    lo, hi, n = -1.3210486329130189, 1.257302210933933, 616  # floor((hi⁻ - lo) * n / (hi - lo)) == n
+    v = np.array([np.nextafter(hi, lo), hi, lo])
+    stats = binned_stats(v, v, bins=n, range=(lo, hi))
+    assert stats.count[-1] == 2 and stats.count[0] == 1 and stats.count.sum() == 3
+    hist = histogram2d(v, v, bins=(n, n), range=((lo, hi), (lo, hi)))
+    assert hist.counts[-1, -1] == 2 and hist.counts.sum() == 3
+
+
+def test_iter_chunks_index_and_nan_handling():
+    y = np.array([1.0, np.nan, 3.0, 4.0, 5.0])
+    xs = np.concatenate([xc for xc, _ in iter_chunks(y, chunk_size=2)])
+    np.testing.assert_array_equal(xs, np.arange(5))
+    stats = binned_stats(y, bins=5)
+    assert stats.count.tolist() == [1, 0, 1, 1, 1]
+    assert np.isnan(stats.mean[1])
+
+
+def test_density_is_pixel_aligned_single_image(points, tmp_path):
+    import matplotlib.pyplot as plt
+
+    from ppplt.aggregate import density
+
+    x, y, _, _ = points
+    fig, ax = plt.subplots(figsize=(2, 1.5))
+    try:
+        image = density(ax, x, y, dpi=100, colorbar=True)
+        assert len(ax.images) == 1 and not ax.collections
+        h, w = image.get_array().shape
+        bbox = ax.get_position()
+        assert (w, h) == (round(bbox.width * 200), round(bbox.height * 150))
+        assert int(image.get_array().sum()) == x.size
+        assert image.get_extent() == [x.min(), x.max(), y.min(), y.max()]
+        assert image.colorbar.vmax == pytest.approx(image.get_array().max())
+        mean = density(ax, x, y, values=y, agg="mean", bins=16, norm="linear")
+        assert np.nanmax(mean.get_array()) <= y.max()
+        fig.savefig(tmp_path / "density.pdf")
+    finally:
+        plt.close(fig)
+
+
+def test_density_is_sized_after_layout_engine(points):
+    import matplotlib.pyplot as plt
+
+    from ppplt.aggregate import density
+
+    x, y, _, _ = points
+    fig, ax = plt.subplots(figsize=(2, 1.5), layout="constrained")
+    try:
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        image = density(ax, x, y, dpi=100, colorbar=True)
+        fig.canvas.draw()
+        bbox = ax.get_position()
+        h, w = image.get_array().shape
+        assert abs(w - bbox.width * 200) <= 1 and abs(h - bbox.height * 150) <= 1
+    finally:
+        plt.close(fig)
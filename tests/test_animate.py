@@ -0,0 +1,220 @@
+import time
+
+from ppplt.animate import FPSTracker
+
+
+def test_fps_tracker_window_stats_without_logging():
+    tracker = FPSTracker(window=5, report_interval=None)
+    assert tracker.stats()["count"] == 0
+    for _ in range(8):
+        tracker.step()
+        time.sleep(0.001)
+    s = tracker.stats()
+    assert s["count"] == 5  # bounded by window
+    assert 0 < s["min"] <= s["mean"] <= s["max"]
+    assert s["min"] <= s["p95"] <= s["max"]
+    assert tracker.fps and tracker.fps > 0
+
+
+def test_fps_tracker_reset():
+    tracker = FPSTracker(report_interval=None)
+    tracker.step()
+    tracker.step()
+    tracker.reset()
+    assert tracker.fps is None and tracker.stats()["count"] == 0
+
+
+def test_image_writer_converts_and_writes_all_formats(tmp_path):
+    import numpy as np
+    from PIL import Image
+
+    from ppplt.animate import ImageWriter
+
+    frame = np.linspace(0, 1, 64 * 48 * 3).reshape(48, 64, 3)
+    with ImageWriter(workers=2, queue_size=4) as writer:
+        for i in range(6):
+            writer.write(frame, str(tmp_path / "sub" / f"f{i}.png"))
+        writer.write(frame, str(tmp_path / "f.jpg"))
+        writer.write(frame, str(tmp_path / "f.webp"))
+        writer.write((frame[..., 0] * 65535).astype(np.uint16), str(tmp_path / "deep.png"))
+        writer.flush()
+        assert writer.stats()["frames"] == 9
+    png = np.asarray(Image.open(tmp_path / "sub" / "f5.png"))
+    assert png.dtype == np.uint8 and png[-1, -1, -1] == 255 and png[0, 0, 0] == 0
+    np.testing.assert_array_equal(np.asarray(Image.open(tmp_path / "f.webp")), png)  # lossless
+    assert np.asarray(Image.open(tmp_path / "deep.png")).max() > 255
+
+
+def test_image_writer_reraises_worker_errors(tmp_path):
+    import numpy as np
+    import pytest
+
+    from ppplt.animate import ImageWriter
+
+    writer = ImageWriter()
+    writer.write(np.zeros((4, 4), np.uint8), str(tmp_path / "bad.unknownext"))
+    with pytest.raises(Exception):
+        writer.flush()
+    writer.close()
+
+
+def test_plan_segments_are_gop_aligned():
+    from ppplt.animate import plan_segments
+
+    plan = plan_segments(1000, gop=120, segments=4)
+    assert plan[0][0] == 0 and plan[-1][1] == 1000
+    assert all(a % 120 == 0 for a, _ in plan)
+    assert all(b == a2 for (_, b), (a2, _) in zip(plan, plan[1:]))
+    assert len(plan) <= 4
+    assert plan_segments(10, gop=120, segments=4) == [(0, 10)]
+
+
+def test_to_rgb24_layouts():
+    import numpy as np
+
+    from ppplt.animate import _to_rgb24
+
+    assert _to_rgb24(np.zeros((4, 5))).shape == (4, 5, 3)
+    rgba = np.full((4, 5, 4), 1.0)
+    out = _to_rgb24(rgba)
+    assert out.shape == (4, 5, 3) and out.dtype == np.uint8 and out.flags.c_contiguous and out.max() == 255
+
+
+def test_encode_video_segments(tmp_path):
+    import numpy as np
+    import pytest
+
+    from ppplt.animate import encode_video, find_ffmpeg
+
+    try:
+        find_ffmpeg()
+    except Exception:
+        pytest.skip("ffmpeg not available")
+    frames = np.random.default_rng(0).integers(0, 256, size=(40, 32, 48, 3), dtype=np.uint8)
+    out = tmp_path / "clip.mp4"
+    encode_video(frames, str(out), fps=10, preset="ultrafast", gop=10, workers=2, segments=3)
+    assert out.stat().st_size > 0 and not list(tmp_path.glob("ppplt-segments-*"))
+
+
+def test_iter_rgb24_converts_stack_once():
+    import numpy as np
+
+    from ppplt.animate import iter_rgb24
+
+    rgba = np.ones((3, 4, 5, 4), dtype=np.float32)
+    frames = list(iter_rgb24(rgba))
+    assert len(frames) == 3 and frames[0].shape == (4, 5, 3) and frames[0].dtype == np.uint8
+    gray = list(iter_rgb24(np.zeros((2, 4, 5), dtype=bool)))
+    assert len(gray) == 2 and gray[0].shape == (4, 5, 3)
+
+
+def test_select_encoder():
+    import pytest
+
+    from ppplt.animate import Encoder, ENCODERS, PILEncoder, register_encoder, select_encoder
+
+    assert select_encoder("a.gif") is PILEncoder
+    with pytest.raises(ValueError):
+        select_encoder("a.mp4", backend="pil")
+    with pytest.raises(ValueError):
+        select_encoder("a.mp4", backend="nope")
+    with pytest.raises(ValueError):
+        register_encoder(object)
+
+    class Null(Encoder):
+        name = "null"
+
+        def write(self, frame):
+            pass
+
+    try:
+        assert register_encoder(Null) is Null and select_encoder("a.mp4", backend="null") is Null
+    finally:
+        ENCODERS.pop("null")
+
+
+def test_animate_pil_backend(tmp_path, capsys):
+    import numpy as np
+    from PIL import Image
+
+    import ppplt
+    from ppplt.animate import animate
+
+    ppplt.init(theme="dumb")
+    try:
+        frames = np.linspace(0, 1, 6 * 8 * 10 * 3).reshape(6, 8, 10, 3)
+        for ext in ("gif", "webp"):
+            out = tmp_path / f"clip.{ext}"
+            animate(frames, str(out), fps=10)
+            with Image.open(out) as im:
+                assert im.n_frames == 6 and im.size == (10, 8)
+    finally:
+        ppplt.destroy()
+
+
+def test_image_writes_recreate_deleted_dirs_and_reject_out_of_range(tmp_path):
+    import shutil
+
+    import numpy as np
+    import pytest
+
+    from ppplt.animate import ImageWriter, _write_image
+
+    out = tmp_path / "frames"
+    _write_image(np.zeros((4, 4), np.uint8), str(out / "a.png"))
+    shutil.rmtree(out)
+    _write_image(np.full((4, 4), 200, np.int32), str(out / "b.png"))
+    assert (out / "b.png").exists()
+    with pytest.raises(ValueError):
+        _write_image(np.full((4, 4), 255.0), str(out / "c.png"))
+    with pytest.raises(ValueError):
+        _write_image(np.full((4, 4), 300, np.int32), str(out / "d.png"))
+    with ImageWriter() as writer, pytest.raises(ValueError):
+        writer.write(np.full((4, 4), -1.0), str(out / "e.png"))
+
+
+FAKE_FFMPEG = """\
+import os
+import sys
+
+args = sys.argv[1:]
+out = args[-1]
+if "concat" in args:
+    listing = args[args.index("-i") + 1]
+    with open(out, "wb") as f:
+        for line in open(listing):
+            with open(os.path.join(os.path.dirname(listing), line.strip()[6:-1]), "rb") as seg:
+                f.write(seg.read())
+else:
+    w, h = map(int, args[args.index("-s") + 1].split("x"))
+    data = sys.stdin.buffer.read()
+    assert len(data) % (w * h * 3) == 0
+    with open(out, "wb") as f:
+        f.write(b"F" * (len(data) // (w * h * 3)))  # one byte per received frame
+"""
+
+
+def test_segmented_animate_accepts_image_paths(tmp_path, monkeypatch, capsys):
+    import sys
+
+    import numpy as np
+    from PIL import Image
+
+    import ppplt
+    from ppplt.animate import animate
+
+    fake = tmp_path / "ffmpeg"
+    fake.write_text(f"#!{sys.executable}\n" + FAKE_FFMPEG)
+    fake.chmod(0o755)
+    monkeypatch.setenv("PPPLT_FFMPEG", str(fake))
+    paths = []
+    for i in range(7):
+        paths.append(str(tmp_path / f"f{i}.png"))
+        Image.fromarray(np.full((6, 8, 4), i * 30, np.uint8)).save(paths[-1])
+    ppplt.init(theme="dumb")
+    try:
+        out = tmp_path / "clip.mp4"
+        animate(paths, str(out), fps=2, workers=2, gop=2)
+        assert out.read_bytes() == b"F" * 7
+    finally:
+        ppplt.destroy()
@@ -36,3 +36,21 @@ def test_get_color_set_invalid_raises():
 
     with pytest.raises(ValueError):
         get_color_set("NOT_EXIST")
+
+
+def test_grayscale_check_keeps_luma_default_and_offers_lightness():
+    import pytest
+
+    from ppplt import is_grayscale_discriminable
+
+    def luma_ok(colors, min_delta=8.0):
+        ys = sorted(
+            (0.2126 * int(c[1:3], 16) + 0.7152 * int(c[3:5], 16) + 0.0722 * int(c[5:7], 16)) / 255 * 100 for c in colors
+        )
+        return all(b - a >= min_delta for a, b in zip(ys, ys[1:]))
+
+    for name in list_color_sets():
+        assert is_grayscale_discriminable(name) == luma_ok(get_color_set(name)), name
+    assert isinstance(is_grayscale_discriminable("Okabe-Ito", metric="lightness"), bool)
+    with pytest.raises(ValueError):
+        is_grayscale_discriminable("Okabe-Ito", metric="nope")
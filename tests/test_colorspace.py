@@ -0,0 +1,49 @@
+import numpy as np
+
+from ppplt import palette_report, is_grayscale_discriminable
+from ppplt.colorspace import (
+    to_rgb,
+    rgb_to_lab,
+    rgb_to_cam02ucs,
+    simulate_cvd,
+    pairwise_delta_e,
+    min_delta_e,
+)
+
+
+def test_to_rgb_parses_hex_and_names():
+    rgb = to_rgb(["#FF0000", "#00ff00"])
+    assert rgb.shape == (2, 3)
+    assert np.allclose(rgb, [[1, 0, 0], [0, 1, 0]])
+    assert np.allclose(to_rgb(["red", "#0000FF"]), [[1, 0, 0], [0, 0, 1]])
+
+
+def test_white_and_black_reference_values():
+    lab = rgb_to_lab(np.array([[1.0, 1.0, 1.0], [0.0, 0.0, 0.0]]))
+    assert np.allclose(lab, [[100, 0, 0], [0, 0, 0]], atol=1e-3)
+    ucs = rgb_to_cam02ucs(np.array([[1.0, 1.0, 1.0]]))
+    assert abs(ucs[0, 0] - 100.0) < 0.5 and np.hypot(*ucs[0, 1:]) < 3.0  # incomplete adaptation leaves a small chroma
+
+
+def test_delta_e_matrix_batched():
+    x = np.random.default_rng(0).random((4, 6, 3)) * 100
+    d = pairwise_delta_e(x)
+    assert d.shape == (4, 6, 6)
+    assert np.allclose(d, np.swapaxes(d, -1, -2)) and np.allclose(np.diagonal(d, axis1=-2, axis2=-1), 0)
+    assert min_delta_e(x).shape == (4,)
+
+
+def test_cvd_simulation_keeps_neutrals():
+    grays = np.linspace(0, 1, 5)[:, None].repeat(3, axis=1)
+    for kind in ("protanopia", "deuteranopia", "tritanopia", "grayscale"):
+        assert np.allclose(simulate_cvd(grays, kind), grays, atol=2e-3)
+
+
+def test_palette_report_grayscale_safe():
+    report = palette_report("Grayscale-Safe")
+    assert report.delta_e.shape == (8, 8)
+    assert report.is_grayscale_discriminable(8.0)
+    assert is_grayscale_discriminable("Grayscale-Safe", 8.0, metric="lightness")
+    assert set(report.cvd_min_delta_e) == {"protanopia", "deuteranopia", "tritanopia"}
+    i, j = report.worst_pair()
+    assert report.delta_e[i, j] == report.min_delta_e
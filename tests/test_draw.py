@@ -0,0 +1,160 @@
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+
+import ppplt
+from ppplt.draw import LegendConfig, _CachedLocator, draw_grid, solve_legend_layout
+
+
+@pytest.fixture
+def styled(capsys):
+    ppplt.init(theme="dumb")
+    ppplt.set_style(preset="ieee-modern")
+    yield
+    plt.close("all")
+    ppplt.destroy()
+
+
+def test_solver_uses_fewest_rows_that_fit():
+    labels = [f"s{i}" for i in range(6)]
+    wide = solve_legend_layout(labels, available=100.0)
+    assert (wide.ncol, wide.nrows) == (6, 1)
+    narrow = solve_legend_layout(labels, available=wide.width * 0.6)
+    assert narrow.nrows > 1 and narrow.width <= wide.width * 0.6
+    # same row count with fewer columns is preferred
+    assert solve_legend_layout(labels[:5], available=narrow.width).ncol <= narrow.ncol
+    side = solve_legend_layout(labels, edge="right", available=100.0)
+    assert side.ncol == 1
+
+
+def test_solver_measures_the_resolved_serif_font():
+    import matplotlib as mpl
+
+    labels = ["a fairly long legend label"] * 4
+    widths = []
+    for serif in (["DejaVu Serif"], ["STIXGeneral"]):
+        with mpl.rc_context({"font.family": "serif", "font.serif": serif}):
+            widths.append(solve_legend_layout(labels, available=100.0).width)
+    assert widths[0] != widths[1]
+
+
+@pytest.mark.parametrize("edge", ["bottom", "top", "left", "right"])
+def test_grid_legend_stays_outside_axes(styled, edge):
+    x = np.arange(10)
+
+    def cell(ax, r, c, idx):
+        for k in range(5):
+            ax.plot(x, x * k, label=f"series {k} label" if idx == 0 else "_nolegend_")
+
+    fig = draw_grid(cell, grid=(2, 2), legend=LegendConfig(edge=edge))
+    fig.canvas.draw()
+    legend = fig.legends[0].get_window_extent()
+    assert fig.bbox.contains(*legend.p0) and fig.bbox.contains(*legend.p1)
+    assert not any(legend.overlaps(ax.get_tightbbox()) for ax in fig.axes)
+
+
+def test_collect_legend_entries_dedups_across_cells():
+    from ppplt.draw import collect_legend_entries
+
+    fig, axes = plt.subplots(2, 2)
+    try:
+        for ax in axes.flat:
+            ax.plot([0, 1], [0, 1], color="C0", label="a")
+            ax.plot([0, 1], [1, 0], color="C1", label="b")
+        axes[1, 1].plot([0, 1], [0, 0], color="C2", label="a")  # same label, different style
+        assert collect_legend_entries(axes)[1] == ["a", "b"]
+        assert collect_legend_entries(axes, dedup="style")[1] == ["a", "b", "a"]
+        assert len(collect_legend_entries(axes, dedup=None)[1]) == 9
+        handles, _ = collect_legend_entries(axes, proxies=True)
+        assert len(handles[0].get_xdata()) == 0 and handles[0].get_color() == axes[0, 0].lines[0].get_color()
+    finally:
+        plt.close(fig)
+
+
+def test_mosaic_grid_skips_empty_slots(styled):
+    seen = []
+
+    def cell(ax, r, c, idx):
+        seen.append((ax.get_label(), r, c, idx))
+        ax.plot([0, 1], [0, 1], label="a")
+
+    inner = [["x", "y"]]
+    fig, axes = draw_grid(
+        cell,
+        mosaic=[["A", "A", "."], ["B", ".", inner]],
+        titles={"A": "wide", "y": "nested"},
+        legend=LegendConfig(),
+        return_axes=True,
+    )
+    assert set(axes) == {"A", "B", "x", "y"} and len(fig.axes) == 4
+    assert sorted(label for label, *_ in seen) == ["A", "B", "x", "y"]
+    assert ("y", 0, 1) in [(label, r, c) for label, r, c, _ in seen]
+    assert axes["A"].get_title() == "wide" and axes["y"].get_title() == "nested"
+    assert axes["B"].get_title() == ""
+    assert len(fig.legends[0].texts) == 1
+
+
+def test_identical_cells_share_tick_computation(styled):
+    x = np.arange(10)
+    fig, axes = draw_grid(
+        lambda ax, r, c, i: ax.plot(x, x * (1 if c < 2 else 5)),
+        grid=(2, 3),
+        share_ticks=True,
+        hide_inner_labels=True,
+        return_axes=True,
+    )
+    fig.canvas.draw()
+    first = axes[0, 0].xaxis.get_major_locator()
+    assert first.cache is axes[1, 1].xaxis.get_major_locator().cache
+    np.testing.assert_array_equal(axes[1, 1].get_xticks(), first.base())
+    # equal x ranges in a column: only the bottom row keeps its x tick labels
+    assert not axes[0, 0].xaxis.get_tick_params()["labelbottom"]
+    assert axes[1, 0].xaxis.get_tick_params().get("labelbottom", True)
+    # the third column has a different y range, so its y labels stay visible
+    assert not axes[0, 1].yaxis.get_tick_params()["labelleft"]
+    assert axes[0, 2].yaxis.get_tick_params().get("labelleft", True)
+
+
+def _prepare_sine(r, c, idx, data):
+    x = np.linspace(0, 1, data)
+    return x, np.sin(2 * np.pi * (idx + 1) * x)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_prepare_cell_runs_off_thread_and_feeds_plot_cell(styled, executor):
+    import threading
+
+    main = threading.get_ident()
+    plotted = []
+
+    def plot_cell(ax, r, c, idx, prepared):
+        assert threading.get_ident() == main
+        plotted.append(idx)
+        ax.plot(*prepared)
+
+    fig, axes = draw_grid(
+        plot_cell, grid=(2, 2), data=50, prepare_cell=_prepare_sine, executor=executor, return_axes=True
+    )
+    assert plotted == [0, 1, 2, 3]
+    np.testing.assert_allclose(axes[1, 1].lines[0].get_ydata(), _prepare_sine(1, 1, 3, 50)[1])
+
+
+def test_prepare_cell_errors_propagate(styled):
+    def boom(r, c, idx, data):
+        raise RuntimeError("bad cell")
+
+    with pytest.raises(RuntimeError, match="bad cell"):
+        draw_grid(lambda *a: None, grid=(1, 2), prepare_cell=boom)
+
+
+def test_tick_sharing_is_opt_in_and_keeps_locator_params(styled):
+    x = np.arange(10)
+    fig, axes = draw_grid(lambda ax, r, c, i: ax.plot(x, x), grid=(2, 2), return_axes=True)
+    assert not isinstance(axes[0, 0].xaxis.get_major_locator(), _CachedLocator)
+    assert axes[0, 0].xaxis.get_tick_params().get("labelbottom", True)
+
+    fig, axes = draw_grid(lambda ax, r, c, i: ax.plot(x, x), grid=(2, 2), share_ticks=True, return_axes=True)
+    fig.canvas.draw()
+    axes[0, 0].locator_params(axis="x", nbins=2)
+    fig.canvas.draw()
+    assert len(axes[0, 0].get_xticks()) < len(axes[1, 1].get_xticks())
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from ppplt.framestore import FrameStore, FrameWriter
+
+
+def _frames(n, shape=(6, 5, 3)):
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(n, *shape), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "none"])
+def test_roundtrip_random_access(tmp_path, codec):
+    frames = _frames(37)
+    path = tmp_path / "clip.ppfs"
+    with FrameWriter(path, fps=24, codec=codec, chunk_frames=8) as writer:
+        writer.extend(frames)
+    with FrameStore(path) as store:
+        assert len(store) == 37 and store.fps == 24 and store.shape == (6, 5, 3)
+        for i in (36, 0, 17, -1, 8):
+            np.testing.assert_array_equal(store[i], frames[i])
+        np.testing.assert_array_equal(store[3:30:4], frames[3:30:4])
+        with pytest.raises(IndexError):
+            store[37]
+
+
+def test_append_and_retime(tmp_path):
+    frames = _frames(20)
+    path = tmp_path / "clip.ppfs"
+    with FrameWriter(path, fps=10, chunk_frames=8) as writer:
+        writer.extend(frames[:13])
+    with FrameWriter(path, append=True) as writer:
+        writer.extend(frames[13:])
+        with pytest.raises(ValueError):
+            writer.append(np.zeros((2, 2), np.uint8))
+    with FrameStore(path) as store:
+        np.testing.assert_array_equal(np.stack(list(store)), frames)
+        half = store.retimed(5)
+        assert len(half) == 10 and half.fps == 5
+        np.testing.assert_array_equal(half[1], frames[2])
+
+
+def test_unclosed_writer_is_rejected(tmp_path):
+    path = tmp_path / "broken.ppfs"
+    writer = FrameWriter(path, codec="zlib")
+    writer.extend(_frames(3))
+    writer._file.flush()
+    with pytest.raises(ValueError):
+        FrameStore(path)
+    writer.close()
+
+
+def test_interrupted_append_keeps_previous_store(tmp_path):
+    frames = _frames(12)
+    path = tmp_path / "clip.ppfs"
+    with FrameWriter(path, codec="zlib", chunk_frames=4) as writer:
+        writer.extend(frames[:6])
+    writer = FrameWriter(path, append=True)
+    writer.extend(frames[6:])  # flushes chunks, but close() (the commit) never runs
+    writer._file.flush()
+    with FrameStore(path) as store:
+        assert len(store) == 6
+        np.testing.assert_array_equal(store[5], frames[5])
+    writer.close()
+    with FrameStore(path) as store:
+        np.testing.assert_array_equal(np.stack(list(store)), frames)
+
+
+def test_append_to_empty_store(tmp_path):
+    path = tmp_path / "empty.ppfs"
+    FrameWriter(path, codec="zlib").close()
+    with FrameStore(path) as store:
+        assert len(store) == 0
+    frames = _frames(5, shape=(3, 4))
+    with FrameWriter(path, append=True) as writer:
+        writer.extend(frames)
+    with FrameStore(path) as store:
+        assert store.shape == (3, 4)
+        np.testing.assert_array_equal(store[1:4], frames[1:4])
@@ -0,0 +1,39 @@
+import numpy as np
+
+import ppplt
+from ppplt.imagegrid import compose_image_grid, draw_image_grid, tile_origins
+
+
+def test_stack_and_list_paths_agree():
+    rng = np.random.default_rng(0)
+    stack = rng.integers(0, 255, size=(12, 5, 7, 3), dtype=np.uint8)
+    fast = compose_image_grid(stack, ncols=4, pad=1)
+    slow = compose_image_grid(list(stack), ncols=4, pad=1)
+    np.testing.assert_array_equal(fast, slow)
+    assert fast.shape == (3 * 6 + 1, 4 * 8 + 1, 3)
+    y, x = tile_origins(12, (5, 7), ncols=4, pad=1)[6]
+    np.testing.assert_array_equal(fast[y : y + 5, x : x + 7], stack[6])
+
+
+def test_ragged_tiles_are_centered_and_empty_slots_padded():
+    tiles = [np.zeros((4, 4), np.uint8), np.zeros((2, 2, 3), np.uint8), np.zeros((4, 4), np.uint8)]
+    canvas = compose_image_grid(tiles, ncols=2, pad=0, pad_value=9)
+    assert canvas.shape == (8, 8, 3)
+    assert (canvas[5:8, 4:8] == 9).all()  # unused fourth slot
+    assert (canvas[1:3, 5:7] == 0).all() and (canvas[0, 4:8] == 9).all()  # small tile centered
+
+
+def test_raster_labels_and_image_grid_figure(capsys):
+    tiles = np.zeros((4, 16, 32), dtype=np.uint8)
+    labelled = compose_image_grid(tiles, labels=["a", "b", "c", "d"])
+    assert labelled.max() == 255 and labelled[2:18, 2:34].max() > 0
+    ppplt.init(theme="dumb")
+    try:
+        ppplt.set_style(preset="ieee-modern")
+        fig, ax = draw_image_grid(tiles, labels=["a", "b", "c", "d"], return_axes=True)
+        assert len(ax.images) == 1 and len(ax.texts) == 4
+        assert ppplt.last_figure() is fig
+        fig, ax = draw_image_grid((t for t in tiles), labels=["a", "b", "c", "d"], return_axes=True)
+        assert len(ax.images) == 1 and len(ax.texts) == 4
+    finally:
+        ppplt.destroy()
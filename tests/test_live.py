@@ -0,0 +1,64 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from ppplt.live import LiveFigure, RingBuffer
+
+
+def test_ring_buffer_bounded_window_and_eviction():
+    buf = RingBuffer(4)
+    assert buf.extend([1, 2, 3]).size == 0
+    np.testing.assert_array_equal(buf.extend([4, 5]), [1])
+    np.testing.assert_array_equal(buf.view(), [2, 3, 4, 5])
+    np.testing.assert_array_equal(buf.extend(np.arange(10, 16)), [2, 3, 4, 5, 10, 11])
+    np.testing.assert_array_equal(buf.view(), [12, 13, 14, 15])
+
+
+def test_ring_buffer_unbounded_grows():
+    buf = RingBuffer()
+    for i in range(0, 3000, 100):
+        buf.extend(np.arange(i, i + 100))
+    np.testing.assert_array_equal(buf.view(), np.arange(3000))
+
+
+def test_live_figure_limits_follow_window(tmp_path):
+    fig, ax = plt.subplots()
+    try:
+        lf = LiveFigure(fig, save_path=str(tmp_path / "live.png"), save_interval=0.0, margin=0.0)
+        line = lf.line(ax, capacity=5)
+        line.append(np.arange(5), [100, 1, 2, 3, 4])
+        assert lf.update() and lf.saves == 1
+        assert ax.get_ylim() == (1.0, 100.0)
+        line.append(5, 5)  # evicts the peak, so the limits shrink
+        lf.push()
+        assert ax.get_ylim() == (1.0, 5.0) and ax.get_xlim() == (1.0, 5.0)
+        np.testing.assert_array_equal(line.artist.get_ydata(), [1, 2, 3, 4, 5])
+        lf.close()
+        assert (tmp_path / "live.png").exists() and lf.saves == 2
+    finally:
+        plt.close(fig)
+
+
+def test_live_figure_background_saver(tmp_path):
+    fig, ax = plt.subplots()
+    try:
+        with LiveFigure(fig, save_path=str(tmp_path / "bg.png"), save_interval=0.01, background=True) as lf:
+            line = lf.line(0)
+            for i in range(50):
+                line.append(i, i * i)
+            assert not lf.update()  # saving belongs to the background thread
+        assert lf.saves >= 1 and len(line.artist.get_xdata()) == 50
+    finally:
+        plt.close(fig)
+
+
+def test_live_figure_update_pushes_between_saves(tmp_path):
+    fig, ax = plt.subplots()
+    try:
+        for save_path in (str(tmp_path / "throttled.png"), None):
+            lf = LiveFigure(fig, save_path=save_path, save_interval=60.0)
+            line = lf.line(ax)
+            line.append([0, 1, 2], [0, 1, 4])
+            assert not lf.update() and lf.saves == 0
+            np.testing.assert_array_equal(line.artist.get_ydata(), [0, 1, 4])
+    finally:
+        plt.close(fig)
@@ -0,0 +1,96 @@
+import ppplt
+
+
+def _run_logger(capsys, **init_kwargs):
+    ppplt.init(theme="dumb", log_time=False, **init_kwargs)
+    try:
+        ppplt.logger.info("a ~<b>~ ~~~~<c>~~~~")
+        ppplt.logger.raw("raw\n")
+        ppplt.logger.warning("d")
+    finally:
+        ppplt.destroy()
+    return capsys.readouterr().out.splitlines()
+
+
+def test_markup_is_expanded_in_single_pass(capsys):
+    lines = _run_logger(capsys)
+    assert "[Pplt] [I] a b c" in lines
+
+
+def test_async_logging_preserves_order(capsys):
+    sync_lines = _run_logger(capsys)
+    async_lines = _run_logger(capsys, async_logging=True)
+    assert async_lines == sync_lines
+    assert async_lines[-4:-1] == ["[Pplt] [I] a b c", "raw", "[Pplt] [W] d"]
+
+
+def test_json_sink_records_save_event(tmp_path, capsys):
+    import json
+
+    log_path = tmp_path / "events.jsonl"
+    ppplt.init(theme="dumb", json_log=str(log_path))
+    try:
+        ppplt.set_style(preset="ieee-modern")
+        ppplt.draw(lambda fig, ax: ax.plot([0, 1], [1, 0]))
+        written = ppplt.save(str(tmp_path / "fig.png"))
+    finally:
+        ppplt.destroy()
+    events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert all({"ts", "level", "msg", "phase"} <= e.keys() for e in events)
+    (save_event,) = [e for e in events if e.get("event") == "save"]
+    assert save_event["paths"] == written
+    assert save_event["bytes"][0] > 0 and save_event["phase"] == "SAVED"
+    assert [e["event"] for e in events if "event" in e] == ["draw", "save"]
+
+
+def test_timer_on_non_tty_logs_single_completion_line(capsys):
+    ppplt.init(theme="dumb", log_time=False)
+    try:
+        with ppplt.logger.timer("exporting", end_msg="done") as t:
+            assert not t.interactive
+        assert ppplt.logger._active_timers == 0
+    finally:
+        ppplt.destroy()
+    lines = capsys.readouterr().out.splitlines()
+    i = lines.index("[Pplt] [I] exporting")
+    assert lines[i + 1].startswith("[Pplt] [I] ✅ done ") and lines[i + 1].endswith("s")
+
+
+def test_no_color_overrides_every_theme(monkeypatch, capsys):
+    from ppplt import style
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    for theme in ("auto", "dark"):
+        ppplt.init(theme=theme)
+        try:
+            assert ppplt._theme == "dumb" and style.palette is style.PALETTES["dumb"]
+        finally:
+            ppplt.destroy()
+    ppplt.init()
+    try:
+        ppplt.set_theme("light")
+        assert ppplt.logger._formatter.palette is style.PALETTES["dumb"]
+        monkeypatch.delenv("NO_COLOR")
+        ppplt.set_theme("light")
+        assert ppplt.logger._formatter.palette is style.PALETTES["light"]
+        assert style.formats.RESET == "\x1b[0m"
+    finally:
+        ppplt.destroy()
+        style.set_palette("dark")
+
+
+def test_async_handler_reports_write_errors():
+    import logging
+
+    from ppplt.logging import AsyncStreamHandler
+
+    def broken(text):
+        raise OSError("pipe closed")
+
+    handler = AsyncStreamHandler(writer=broken)
+    failed = []
+    handler.handleError = failed.append
+    handler.emit(logging.makeLogRecord({"msg": "lost?"}))
+    handler.flush()
+    handler.close()
+    assert len(failed) == 1 and failed[0].getMessage() == "lost?"
@@ -0,0 +1,37 @@
+import pytest
+
+from ppplt import generate_palette, get_color_set, palette_report, is_grayscale_discriminable
+
+
+def test_generate_palette_is_distinct_and_cached():
+    colors = generate_palette(16)
+    assert len(colors) == len(set(colors)) == 16
+    assert palette_report(colors).min_delta_e > 15
+    assert generate_palette(16) == colors
+
+
+def test_generate_palette_grayscale_and_anchor():
+    colors = generate_palette(8, grayscale=True, min_delta=8.0, anchors=["#0072b2"], name="Generated-Gray-8")
+    assert colors[0] == "#0072B2"
+    assert get_color_set("generated-gray-8") == colors
+    assert is_grayscale_discriminable("Generated-Gray-8", 8.0, metric="lightness")
+
+
+def test_generate_palette_cvd_safe():
+    report = palette_report(generate_palette(12, cvd_safe=True))
+    assert min(report.cvd_min_delta_e.values()) > 10
+
+
+def test_generate_palette_infeasible_grayscale_raises():
+    with pytest.raises(ValueError):
+        generate_palette(20, grayscale=True, min_delta=8.0)
+
+
+def test_generate_palette_does_not_replace_existing_sets():
+    okabe = get_color_set("Okabe-Ito")
+    with pytest.raises(ValueError):
+        generate_palette(4, name="okabe_ito")
+    assert get_color_set("Okabe-Ito") == okabe
+    first = generate_palette(3, name="Generated-3")
+    assert generate_palette(3, seed=1, name="Generated-3", overwrite=True) == get_color_set("Generated-3")
+    assert len(first) == 3
@@ -35,3 +35,35 @@ def test_grayscale_preset_is_discriminable():
 
     apply_paper_preset("ieee-gray")
     assert is_grayscale_discriminable("Grayscale-Safe")
+
+
+def test_preset_context_restores_previous_rc():
+    import ppplt
+
+    apply_paper_preset("ieee-modern")
+    before_family = list(matplotlib.rcParams["font.family"])
+    before_colors = [v["color"] for v in matplotlib.rcParams["axes.prop_cycle"]]
+    with ppplt.preset("gb-okabe"):
+        assert "SimSun" in matplotlib.rcParams["font.family"]
+        got = [v["color"] for v in matplotlib.rcParams["axes.prop_cycle"]]
+        assert got == get_color_set("Okabe-Ito")
+    assert list(matplotlib.rcParams["font.family"]) == before_family
+    assert [v["color"] for v in matplotlib.rcParams["axes.prop_cycle"]] == before_colors
+
+
+def test_preset_context_yields_read_only_rc_and_restores_phase(capsys):
+    import pytest
+
+    import ppplt
+    from ppplt.presets import get_preset_rc
+
+    ppplt.init(theme="dumb")
+    try:
+        with ppplt.preset("gb-okabe") as rc:
+            assert ppplt._phase == ppplt._Phase.STYLE_SET
+            with pytest.raises(TypeError):
+                rc["lines.linewidth"] = 99
+        assert get_preset_rc("gb-okabe").get("lines.linewidth") != 99
+        assert ppplt._phase == ppplt._Phase.INITIALIZED
+    finally:
+        ppplt.destroy()
@@ -0,0 +1,76 @@
+import json
+
+import matplotlib
+import pytest
+
+import ppplt
+from ppplt.registry import Registry
+from ppplt.presets import get_preset_rc
+
+
+def test_registry_normalized_lookup_and_aliases():
+    reg = Registry("thing", {"Contrast Set 1": 1})
+    reg.register("Other_Name", 2, aliases=["on"])
+    assert reg.get("contrast-set-1") == reg.get("CONTRAST set_1") == 1
+    assert reg.get("ON") == 2 and reg.resolve("other name") == "Other_Name"
+    with pytest.raises(ValueError):
+        reg.register("other-name", 3)
+    with pytest.raises(ValueError):
+        reg.get("missing")
+
+
+def test_invalid_entries_fail_at_registration():
+    with pytest.raises(ValueError):
+        ppplt.register_color_set("Broken", ["#12"])
+    with pytest.raises(ValueError):
+        ppplt.register_paper_preset("broken-preset", style="NOPE", colors="Okabe-Ito")
+    with pytest.raises(ValueError):
+        ppplt.register_style("broken-style", {"lines.linewidth": "thick"})
+
+
+def test_preset_rc_is_memoized_and_applied():
+    rc = get_preset_rc("IEEE Okabe")
+    assert get_preset_rc("ieee_okabe") is rc
+    ppplt.apply_paper_preset("ieee-okabe")
+    got = [v["color"] for v in matplotlib.rcParams["axes.prop_cycle"]]
+    assert got == ppplt.get_color_set("Okabe-Ito")
+
+
+def test_load_presets_dir(tmp_path):
+    (tmp_path / "HOUSE.mplstyle").write_text("lines.linewidth: 2.5\n", encoding="utf-8")
+    (tmp_path / "house.json").write_text(
+        json.dumps(
+            {
+                "color_sets": {"House Colors": ["#112233", "#445566"]},
+                "presets": {"house-default": {"style": "HOUSE", "colors": "House Colors", "aliases": ["house"]}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    added = ppplt.load_presets_dir(tmp_path, overwrite=True)
+    assert {"HOUSE", "House Colors", "house-default"} <= set(added)
+    assert ppplt.get_paper_preset("house") == {"style": "HOUSE", "colors": "House Colors"}
+    ppplt.apply_paper_preset("house")
+    assert matplotlib.rcParams["lines.linewidth"] == 2.5
+
+
+def test_loader_runs_once_on_first_miss_or_listing():
+    calls = []
+    reg = Registry("thing", {"a": 1})
+    reg.add_loader(lambda: (calls.append(1), reg.register("plugin", 2)))
+    assert reg.get("a") == 1 and not calls
+    assert reg.get("Plugin") == 2 and calls == [1]
+    assert "missing" not in reg and reg.names() == ["a", "plugin"] and calls == [1]
+
+
+def test_plugin_color_sets_resolve_without_prior_preset_call(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    (tmp_path / "plugin.json").write_text(json.dumps({"color_sets": {"Plugin Set": ["#010203"]}}), encoding="utf-8")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PPPLT_PRESETS_PATH=str(tmp_path), PYTHONPATH=root)
+    code = "from ppplt import get_color_set; print(get_color_set('plugin-set'))"
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    assert "#010203" in out
@@ -0,0 +1,57 @@
+import pytest
+
+import ppplt
+from ppplt import fontcache
+
+
+@pytest.fixture
+def drawn(capsys):
+    ppplt.init(theme="dumb")
+    ppplt.set_style(preset="ieee-modern")
+    ppplt.draw(lambda fig, ax: (ax.plot([0, 1], [1, 0], label="Latin"), ax.set_title("Title")))
+    yield
+    ppplt.destroy()
+
+
+def test_pdf_font_subsets_are_reused(drawn, tmp_path):
+    fontcache.clear()
+    first = ppplt.save(str(tmp_path / "a.pdf"), fonttype=42)
+    misses = fontcache.stats()["misses"]
+    assert misses > 0
+    second = ppplt.save(str(tmp_path / "b.pdf"), fonttype=42)
+    stats = fontcache.stats()
+    assert stats["misses"] == misses and stats["hits"] >= misses
+    a, b = (open(p, "rb").read() for p in first + second)
+    assert abs(len(a) - len(b)) < 64  # only timestamps may differ
+
+
+def test_save_rejects_unknown_fonttype(drawn, tmp_path):
+    with pytest.raises(ppplt.PaperPlotException):
+        ppplt.save(str(tmp_path / "a.pdf"), fonttype=1)
+
+
+def test_pdf_book_streams_pages_into_one_file(drawn, tmp_path):
+    import matplotlib.pyplot as plt
+
+    path = tmp_path / "book.pdf"
+    with ppplt.PdfBook(str(path), fonttype=42) as book:
+        assert book.add() == 1
+        for i in range(2):
+            fig, ax = plt.subplots()
+            ax.set_title(f"Page {i}")
+            book.add(fig)
+        assert not plt.fignum_exists(fig.number)  # closed after writing
+    assert book.pages == 3
+    assert path.read_bytes().startswith(b"%PDF")
+    with pytest.raises(ppplt.PaperPlotException):
+        book.add(fig)
+
+
+def test_fontcache_skips_unsupported_matplotlib(monkeypatch):
+    from matplotlib.backends import _backend_pdf_ps
+
+    fontcache.uninstall()
+    monkeypatch.delattr(_backend_pdf_ps, "SubsetResults")
+    original = _backend_pdf_ps.get_glyphs_subset
+    assert fontcache.install() is False
+    assert _backend_pdf_ps.get_glyphs_subset is original